@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Aggregate Objects
+=================
+Precomputed replacements for the aggregate views of the views script.
+
+Plain views recompute their joins and aggregations on every dashboard
+query. With aggregate_mode 'dynamic_table' each aggregate view (one with a
+GROUP BY) is created as a dynamic table refreshed within TARGET_LAG, and
+with 'materialized_view' as a materialized view. The original V_ view is
+kept as a thin SELECT * over the new object, so existing queries keep
+working while the generated app and semantic model read the object
+directly.
+
+Materialized views only accept a single table without UNION, COUNT(DISTINCT),
+window functions or CURRENT_DATE(); views that need any of these stay plain
+views in that mode. Dynamic tables take every view; the ones that read
+CURRENT_DATE() are refreshed in full.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+AGGREGATE_MODES = ('view', 'dynamic_table', 'materialized_view')
+DEFAULT_AGGREGATE_MODE = 'view'
+DEFAULT_TARGET_LAG = '1 hour'
+
+OBJECT_PREFIXES = {'view': 'V_', 'dynamic_table': 'DT_', 'materialized_view': 'MV_'}
+OBJECT_KINDS = {'view': 'VIEWS', 'dynamic_table': 'DYNAMIC TABLES', 'materialized_view': 'MATERIALIZED VIEWS'}
+
+_VIEW_DEFINITION = re.compile(r'CREATE OR REPLACE VIEW V_(\w+) AS\n(.*?);', re.S)
+_TRAILING_ORDER_BY = re.compile(r'\s*\bORDER BY\b[^()]*$')
+_MATERIALIZED_VIEW_LIMITS = [
+    (re.compile(r'\bJOIN\b', re.I), 'joins'),
+    (re.compile(r'\bUNION\b', re.I), 'UNION'),
+    (re.compile(r'\bCOUNT\s*\(\s*DISTINCT\b', re.I), 'COUNT(DISTINCT)'),
+    (re.compile(r'\bOVER\s*\(', re.I), 'window functions'),
+    (re.compile(r'\bCURRENT_(?:DATE|TIMESTAMP)\b', re.I), 'CURRENT_DATE()')
+]
+_NON_DETERMINISTIC = re.compile(r'\bCURRENT_(?:DATE|TIMESTAMP)\b', re.I)
+
+
+def check_mode(mode: str) -> str:
+    """Return mode if it is one of AGGREGATE_MODES"""
+    if mode not in AGGREGATE_MODES:
+        raise ValueError(f"Unsupported aggregate mode: {mode} (expected one of {', '.join(AGGREGATE_MODES)})")
+    return mode
+
+
+def materialized_view_limits(select_sql: str) -> List[str]:
+    """Constructs in a view definition that a materialized view does not support"""
+    return [label for pattern, label in _MATERIALIZED_VIEW_LIMITS if pattern.search(select_sql)]
+
+
+def _object_mode(select_sql: str, mode: str) -> str:
+    """Mode a single aggregate view is actually created in"""
+    if not re.search(r'\bGROUP BY\b', select_sql, re.I):
+        return 'view'
+    if mode == 'materialized_view' and materialized_view_limits(select_sql):
+        return 'view'
+    return mode
+
+
+def materialize_aggregates(views_script: str, mode: str, target_lag: str,
+                           warehouse: str) -> Tuple[str, Dict[str, str]]:
+    """Rewrite the aggregate views of a views script for the mode
+
+    Returns the new script and a map from each V_ view name to the object
+    dashboards should read (the view itself when nothing was materialized).
+    """
+    check_mode(mode)
+    objects = {}
+
+    def rewrite(match):
+        name, select_sql = match.group(1), match.group(2)
+        object_mode = _object_mode(select_sql, mode)
+        object_name = f"{OBJECT_PREFIXES[object_mode]}{name}"
+        objects[f"V_{name}"] = object_name
+        if object_mode == 'view':
+            return match.group(0)
+
+        # Row order is the reader's business; dynamic tables and materialized views don't keep it
+        body = _TRAILING_ORDER_BY.sub('', select_sql)
+        if object_mode == 'dynamic_table':
+            refresh = "\n    REFRESH_MODE = FULL" if _NON_DETERMINISTIC.search(body) else ''
+            header = (f"CREATE OR REPLACE DYNAMIC TABLE {object_name}\n"
+                      f"    TARGET_LAG = '{target_lag}'\n"
+                      f"    WAREHOUSE = {warehouse}{refresh}\n"
+                      f"AS")
+        else:
+            header = f"CREATE OR REPLACE MATERIALIZED VIEW {object_name} AS"
+        return (f"{header}\n{body};\n\n"
+                f"CREATE OR REPLACE VIEW V_{name} AS SELECT * FROM {object_name};")
+
+    return _VIEW_DEFINITION.sub(rewrite, views_script), objects
+
+
+def object_grants(mode: str, db_name: str) -> str:
+    """GRANT statements for the objects a mode creates besides views"""
+    if check_mode(mode) == 'view':
+        return ''
+    kind = OBJECT_KINDS[mode]
+    return (f"GRANT SELECT ON ALL {kind} IN SCHEMA {db_name}.ANALYTICS TO ROLE {db_name}_ROLE;\n"
+            f"GRANT SELECT ON FUTURE {kind} IN SCHEMA {db_name}.ANALYTICS TO ROLE {db_name}_ROLE;\n")
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Batch Demo Generator CLI
+========================
+Headless entry point that generates complete demo packages for a whole list
+of clients without the Streamlit UI.
+
+Input is a CSV (header row) or JSONL file with one client per row:
+    name, url, industry (optional - auto-detected from the website when blank)
+
+Every client gets its own output folder. Finished clients are appended to
+manifest.jsonl as they complete, so an interrupted run picks up where it
+left off; manifest.json summarises the whole run with timings.
+
+Usage:
+    python batch_cli.py clients.csv --output-dir output/batch --workers 4
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Any, List
+from urllib.parse import urlparse
+
+from aggregate_objects import AGGREGATE_MODES, DEFAULT_AGGREGATE_MODE, DEFAULT_TARGET_LAG
+
+MANIFEST_LOG = 'manifest.jsonl'
+MANIFEST_SUMMARY = 'manifest.json'
+# Options that change what gets built; a finished client is only reused when they match
+BUILD_OPTIONS = ('scale_factor', 'data_format', 'purpose', 'reference_date', 'aggregate_mode', 'target_lag',
+                 'instrumentation')
+
+
+# =====================================================
+# INPUT
+# =====================================================
+
+def load_clients(path: str) -> List[Dict[str, str]]:
+    """Read clients from a CSV or JSONL file"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    clients = []
+    for line_number, row in enumerate(rows, 1):
+        row = {str(key).strip().lower(): '' if value is None else str(value).strip() for key, value in row.items() if key}
+        name = row.get('name', '')
+        url = row.get('url') or row.get('website', '')
+        if not name or not url:
+            raise ValueError(f"{path}: row {line_number} needs both a name and a url")
+
+        clients.append({'name': name, 'url': url, 'industry': row.get('industry', '').lower()})
+
+    return clients
+
+
+def build_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """The options of a run that affect its output"""
+    return {key: options.get(key) for key in BUILD_OPTIONS}
+
+
+def client_key(client: Dict[str, str]) -> str:
+    """Stable identifier used for the client's output folder and for resuming"""
+    from demo_generator import DemoGenerator
+    return DemoGenerator().generate_database_name(client['name']).lower()
+
+
+# =====================================================
+# WORKER
+# =====================================================
+
+def build_client(client: Dict[str, str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyse one client and build its demo package (runs in a worker process)"""
+    from demo_generator import DemoGenerator
+    from build_pipeline import build_all
+
+    started = time.perf_counter()
+    key = client_key(client)
+    record = {'key': key, 'name': client['name'], 'url': client['url'], 'options': build_options(options)}
+
+    try:
+        generator = DemoGenerator()
+
+        # Websites were analysed up front; only clients with an explicit
+        # industry reach this point without website_info
+        analysis_start = time.perf_counter()
+        if client.get('website_info'):
+            website_info = client['website_info']
+        elif client['industry']:
+            if client['industry'] not in generator.industry_templates:
+                raise ValueError(f"Unknown industry '{client['industry']}'")
+            url = client['url'] if client['url'].startswith(('http://', 'https://')) else 'https://' + client['url']
+            domain = urlparse(url).netloc.lower()
+            website_info = {
+                'company_name': domain.replace('www.', '').split('.')[0].title(),
+                'domain': domain,
+                'url': url,
+                'industry': client['industry'],
+                'industry_confidence': 0
+            }
+        else:
+            website_info = generator.analyze_website(client['url'])
+        analysis_seconds = time.perf_counter() - analysis_start
+
+        client_info = {
+            'name': client['name'],
+            'website_info': website_info,
+            'purpose': options['purpose'],
+            'scale_factor': options['scale_factor'],
+            'generated_at': datetime.now().isoformat()
+        }
+        if options.get('reference_date'):
+            client_info['reference_date'] = options['reference_date']
+        if options.get('aggregate_mode'):
+            client_info['aggregate_mode'] = options['aggregate_mode']
+        if options.get('target_lag'):
+            client_info['target_lag'] = options['target_lag']
+        if options.get('instrumentation'):
+            client_info['instrumentation'] = True
+
+        # Artifacts are built serially here; parallelism comes from the client pool
+        report = build_all(
+            client_info, os.path.join(options['output_dir'], key), options['data_format'], parallel=False,
+            use_cache=options.get('use_cache', True)
+        )
+
+        record.update({
+            'status': 'ok',
+            'industry': website_info['industry'],
+            'files': report['files'],
+            'cached': report['cache'],
+            'timings': {'website_analysis': analysis_seconds, **report['timings']}
+        })
+
+    except Exception as e:
+        record.update({'status': 'error', 'error': f"{type(e).__name__}: {e}"})
+
+    record['seconds'] = time.perf_counter() - started
+    return record
+
+
+# =====================================================
+# MANIFEST
+# =====================================================
+
+def load_completed(output_dir: str, options: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Clients that finished successfully in earlier runs with the same build options, by key"""
+    path = os.path.join(output_dir, MANIFEST_LOG)
+    completed = {}
+    if not os.path.exists(path):
+        return completed
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partially written line from an interrupted run
+            if record.get('status') == 'ok' and record.get('options') == build_options(options):
+                completed[record['key']] = record
+            else:
+                completed.pop(record.get('key'), None)
+
+    return completed
+
+
+def append_record(output_dir: str, record: Dict[str, Any]):
+    """Append a finished client to the manifest log and flush it to disk"""
+    with open(os.path.join(output_dir, MANIFEST_LOG), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_summary(output_dir: str, clients: List[Dict[str, str]], records: Dict[str, Dict[str, Any]],
+                  options: Dict[str, Any], wall_clock: float, skipped: int):
+    """Write manifest.json with the status and timings of every client"""
+    keys = list(dict.fromkeys(client_key(client) for client in clients))
+    ordered = [records[key] for key in keys if key in records]
+    built = [r for r in ordered if r['status'] == 'ok']
+
+    summary = {
+        'generated_at': datetime.now().isoformat(),
+        'options': options,
+        'totals': {
+            'clients': len(keys),
+            'succeeded': len(built),
+            'failed': sum(1 for r in ordered if r['status'] != 'ok'),
+            'resumed': skipped,
+            'wall_clock_seconds': round(wall_clock, 3),
+            'client_seconds': round(sum(r['seconds'] for r in ordered), 3)
+        },
+        'clients': ordered
+    }
+
+    with open(os.path.join(output_dir, MANIFEST_SUMMARY), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    return summary
+
+
+# =====================================================
+# MAIN
+# =====================================================
+
+def run_batch(clients_file: str, output_dir: str = "output/batch", workers: int = 4, scale_factor: float = 1.0,
+              data_format: str = "sql", purpose: str = "Sales Presentation", force: bool = False,
+              use_cache: bool = True, reference_date: str = None, aggregate_mode: str = None,
+              target_lag: str = None, instrumentation: bool = False) -> Dict[str, Any]:
+    """Generate demo packages for every client in the file and return the run summary"""
+    started = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+
+    clients = load_clients(clients_file)
+    options = {
+        'output_dir': output_dir,
+        'scale_factor': scale_factor,
+        'data_format': data_format,
+        'purpose': purpose,
+        'use_cache': use_cache,
+        'reference_date': reference_date,
+        'aggregate_mode': aggregate_mode,
+        'target_lag': target_lag,
+        'instrumentation': instrumentation
+    }
+
+    records = {} if force else load_completed(output_dir, options)
+    seen = set()
+    pending = []
+    for client in clients:
+        key = client_key(client)
+        if key in seen:
+            print(f"⚠️  Duplicate client '{client['name']}' skipped", file=sys.stderr)
+            continue
+        seen.add(key)
+        if key not in records:
+            pending.append(client)
+
+    skipped = len(seen) - len(pending)
+    print(f"{len(pending)} client(s) to build, {skipped} already complete")
+
+    # Detect industries for all clients that need it in one concurrent pass
+    to_analyze = [client for client in pending if not client['industry']]
+    if to_analyze:
+        from website_analyzer import WebsiteAnalyzer
+        analysis_start = time.perf_counter()
+        analyses = WebsiteAnalyzer(max_concurrency=max(workers, 16)).analyze_urls([c['url'] for c in to_analyze])
+        for client, website_info in zip(to_analyze, analyses):
+            client['website_info'] = website_info
+        print(f"Analysed {len(to_analyze)} website(s) in {time.perf_counter() - analysis_start:.1f}s")
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    futures = {pool.submit(build_client, client, options): client for client in pending}
+    try:
+        for done, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            append_record(output_dir, record)
+            records[record['key']] = record
+
+            status = '✅' if record['status'] == 'ok' else f"❌ {record['error']}"
+            print(f"[{done}/{len(pending)}] {record['name']} ({record['seconds']:.1f}s) {status}")
+    except KeyboardInterrupt:
+        for future in futures:
+            future.cancel()
+        print("\nInterrupted - finished clients are saved, re-run the same command to resume", file=sys.stderr)
+        raise
+    finally:
+        pool.shutdown(wait=True)
+
+    summary = write_summary(output_dir, clients, records, options, time.perf_counter() - started, skipped)
+    totals = summary['totals']
+    print(f"Done: {totals['succeeded']} ok, {totals['failed']} failed in {totals['wall_clock_seconds']:.1f}s "
+          f"(manifest: {os.path.join(output_dir, MANIFEST_SUMMARY)})")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Snowflake Cortex demo packages for a list of clients")
+    parser.add_argument('clients_file', help="CSV or JSONL file with name, url and optional industry")
+    parser.add_argument('--output-dir', default='output/batch', help="Root folder for all demo packages")
+    parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1), help="Clients built in parallel")
+    parser.add_argument('--scale-factor', type=float, default=1.0, help="Sample data scale factor (0.01 - 1000)")
+    parser.add_argument('--data-format', choices=['sql', 'csv', 'parquet'], default='sql',
+                        help="Sample data as INSERT scripts or bulk-load files")
+    parser.add_argument('--purpose', default='Sales Presentation', help="Demo purpose recorded in each package")
+    parser.add_argument('--force', action='store_true', help="Rebuild clients already in the manifest")
+    parser.add_argument('--no-cache', action='store_true', help="Regenerate artifacts even when cached builds exist")
+    parser.add_argument('--reference-date', help="Date (YYYY-MM-DD) the sample data is generated as of; default today")
+    parser.add_argument('--aggregates', choices=list(AGGREGATE_MODES), default=DEFAULT_AGGREGATE_MODE,
+                        help="Create the aggregate views as plain views, dynamic tables or materialized views")
+    parser.add_argument('--target-lag', default=DEFAULT_TARGET_LAG, help="TARGET_LAG of the dynamic tables")
+    parser.add_argument('--instrument', action='store_true',
+                        help="Add section/query timings and a Performance panel to the generated apps")
+    args = parser.parse_args()
+
+    try:
+        summary = run_batch(
+            args.clients_file, args.output_dir, args.workers, args.scale_factor,
+            args.data_format, args.purpose, args.force, not args.no_cache, args.reference_date,
+            args.aggregates, args.target_lag, args.instrument
+        )
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    sys.exit(1 if summary['totals']['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
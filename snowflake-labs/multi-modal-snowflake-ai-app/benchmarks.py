@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Demo Generator Benchmarks
+=========================
+Micro-benchmarks for the performance-sensitive parts of the generator.
+
+Usage:
+    python benchmarks.py keywords [--sizes 0.1 1 5] [--repeat 5]
+    python benchmarks.py apps [--count 1000]
+    python benchmarks.py startup [--repeat 5] [--history .cache/startup_history.jsonl]
+    python benchmarks.py rerun [--industries retail healthcare] [--repeat 5] [--threshold 0.25]
+    python benchmarks.py queries [--industry retail] [--scale-factors 1 4 16] [--model model.yaml]
+    python benchmarks.py yaml [--model model.yaml] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    """Best wall-clock time of several runs, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# =====================================================
+# KEYWORD SCORING
+# =====================================================
+
+FILLER_WORDS = [
+    'the', 'our', 'and', 'with', 'for', 'customers', 'service', 'quality', 'solutions', 'team',
+    'technique', 'shopping', 'products', 'platforms', 'storefront', 'healthy', 'banking', 'cloudy'
+]
+
+
+def _legacy_industry_scores(content: str, industry_keywords: Dict[str, List[str]]) -> Dict[str, int]:
+    """The original analyze_website scoring: one substring scan per keyword over the lower-cased page"""
+    content = content.lower()
+    return {
+        industry: sum(1 for keyword in keywords if keyword in content)
+        for industry, keywords in industry_keywords.items()
+    }
+
+
+def _synthetic_page(size_mb: float, industry_keywords: Dict[str, List[str]], industry: str = 'retail',
+                    seed: int = 7) -> str:
+    """HTML page of roughly size_mb with scripts, styles and paragraphs about one industry
+
+    Keywords of the other industries never appear in the text, which is the
+    common case and the worst case for per-keyword substring scans.
+    """
+    rng = random.Random(seed)
+    keywords = industry_keywords[industry]
+    target = int(size_mb * 1024 * 1024)
+
+    parts = ['<html><head><style>.product-card{color:#333}.cloud-banner{margin:0}</style></head><body>']
+    length = len(parts[0])
+    while length < target:
+        if rng.random() < 0.3:
+            # Bundled JavaScript is often most of a modern page
+            block = '<script>' + ''.join(
+                f"var {rng.choice(['cart', 'api', 'tech', 'store'])}{i}=fetch('/api/v1/items');" for i in range(40)
+            ) + '</script>'
+        else:
+            words = [rng.choice(keywords) if rng.random() < 0.03 else rng.choice(FILLER_WORDS) for _ in range(120)]
+            block = f'<div class="section"><p>{" ".join(words)}</p></div>'
+        parts.append(block)
+        length += len(block)
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def bench_keywords(sizes: List[float], repeat: int):
+    """Compare the legacy substring scorer with the single-pass word scorer"""
+    from keyword_scorer import KeywordScorer
+    from website_analyzer import INDUSTRY_KEYWORDS
+
+    scorer = KeywordScorer(INDUSTRY_KEYWORDS)
+    print(f"{'page MB':>8} {'legacy ms':>10} {'1-pass ms':>12} {'ratio':>6}  industry (legacy / 1-pass)")
+
+    for size in sizes:
+        page = _synthetic_page(size, INDUSTRY_KEYWORDS)
+        legacy_time = _best_of(lambda: _legacy_industry_scores(page, INDUSTRY_KEYWORDS), repeat)
+        compiled_time = _best_of(lambda: scorer.score(page), repeat)
+
+        legacy_scores = _legacy_industry_scores(page, INDUSTRY_KEYWORDS)
+        compiled_scores = scorer.score(page)['industry_scores']
+        print(f"{len(page) / 1024 / 1024:8.2f} {legacy_time * 1000:10.1f} {compiled_time * 1000:12.1f} "
+              f"{compiled_time / legacy_time:6.2f}  "
+              f"{max(legacy_scores, key=legacy_scores.get)} {legacy_scores} / "
+              f"{max(compiled_scores, key=compiled_scores.get)} {compiled_scores}")
+
+
+# =====================================================
+# STREAMLIT APP GENERATION
+# =====================================================
+
+# Names that have broken generated apps before: quotes, backslashes, braces
+COMPANY_NAMES = [
+    'Acme Corp', "O'Reilly Autos", 'Smith "Best" Co', 'Back\\slash Ltd', 'Curly {Braces} Inc',
+    'Triple """ Quote', 'Ünïcødé Café'
+]
+
+
+def bench_apps(count: int) -> int:
+    """Render count Streamlit apps across industries and company names, then compile() every one
+
+    Returns the number of apps that are not valid Python.
+    """
+    from demo_generator import DemoGenerator
+    from streamlit_generator import StreamlitGenerator
+
+    demo_generator = DemoGenerator()
+    industries = list(demo_generator.industry_templates)
+    clients = []
+    for i in range(count):
+        industry = industries[i % len(industries)]
+        clients.append({
+            'name': f"{COMPANY_NAMES[i % len(COMPANY_NAMES)]} {i}",
+            'website_info': {'industry': industry, 'url': f'https://client{i}.com', 'domain': f'client{i}.com'},
+            'purpose': 'Benchmark',
+            'reference_date': '2025-01-01'
+        })
+
+    generator = StreamlitGenerator()
+    start = time.perf_counter()
+    apps = [
+        generator._generate_app_content(client, demo_generator.build_demo_context(client))
+        for client in clients
+    ]
+    render_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    failures = []
+    for client, source in zip(clients, apps):
+        try:
+            compile(source, f"{client['name']}.py", 'exec')
+        except SyntaxError as e:
+            failures.append(f"{client['name']} ({client['website_info']['industry']}): line {e.lineno}: {e.msg}")
+    compile_seconds = time.perf_counter() - start
+
+    print(f"{count} apps, {sum(len(app) for app in apps) / count / 1024:.0f} KB each")
+    print(f"render   {render_seconds * 1000:10.1f} ms total  {render_seconds / count * 1000:8.3f} ms/app")
+    print(f"compile  {compile_seconds * 1000:10.1f} ms total  {compile_seconds / count * 1000:8.3f} ms/app")
+    print(f"valid    {count - len(failures)}/{count}")
+    for failure in failures[:20]:
+        print(f"  ❌ {failure}")
+    return len(failures)
+
+
+# =====================================================
+# STARTUP
+# =====================================================
+
+# Import-time budgets in milliseconds. `streamlit run main.py` has loaded
+# Streamlit before main.py runs, so the entry budget covers only our own
+# imports; the first-click modules are warmed in the background after the
+# first page render (demo_generator.warm_imports).
+STARTUP_BUDGETS_MS = {
+    'entry': 50,
+    'first_click': 300
+}
+STARTUP_HISTORY = os.path.join('.cache', 'startup_history.jsonl')
+
+# Each phase ends with the top-level import of its last module
+STARTUP_PHASES = [
+    ('python + streamlit', ['streamlit']),
+    ('entry', ['main']),
+    ('first_click', None)  # Filled from demo_generator.WARM_MODULES
+]
+
+
+def _import_times(statement: str) -> List[Tuple[str, int, int, int]]:
+    """Run a statement in a fresh interpreter under -X importtime
+
+    Returns (module, depth, self us, cumulative us) for every module imported,
+    in the order the interpreter reports them (children before parents).
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Import failed: {completed.stderr.strip().splitlines()[-1]}")
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_part, cumulative_part, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), depth, int(self_part), int(cumulative_part)))
+    return rows
+
+
+def _startup_phases(rows: List[Tuple[str, int, int, int]], phases: List[Tuple[str, List[str]]]) -> Dict[str, float]:
+    """Split top-level import times into phases, in milliseconds"""
+    totals = {name: 0.0 for name, _ in phases}
+    phase = 0
+    for module, depth, _, cumulative in rows:
+        if depth != 0:
+            continue
+        name, last_modules = phases[phase]
+        totals[name] += cumulative / 1000
+        if last_modules and module == last_modules[-1] and phase < len(phases) - 1:
+            phase += 1
+    return totals
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_startup(repeat: int, history_path: str, top: int = 10) -> int:
+    """Measure cold import time of the entry point and first-click modules against the budget
+
+    Every run is appended to history_path so startup can be tracked over
+    time. Returns the number of phases over budget.
+    """
+    from demo_generator import WARM_MODULES
+
+    phases = [(name, modules or WARM_MODULES) for name, modules in STARTUP_PHASES]
+    statement = '; '.join(f"import {', '.join(modules)}" for _, modules in phases)
+
+    best = None
+    slowest = {}
+    for _ in range(repeat):
+        rows = _import_times(statement)
+        totals = _startup_phases(rows, phases)
+        if best is None or totals['entry'] + totals['first_click'] < best['entry'] + best['first_click']:
+            best = totals
+            # Slowest modules loaded by our own code, by self time
+            own = rows[next(i for i, row in enumerate(rows) if row[0] == 'streamlit' and row[1] == 0) + 1:]
+            slowest = sorted(own, key=lambda row: row[2], reverse=True)[:top]
+
+    previous = None
+    if os.path.exists(history_path):
+        with open(history_path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+        if lines:
+            previous = json.loads(lines[-1])
+
+    print(f"{'phase':<20} {'ms':>8} {'budget':>8} {'previous':>9}")
+    over_budget = 0
+    for name, ms in best.items():
+        budget = STARTUP_BUDGETS_MS.get(name)
+        before = previous['phases_ms'].get(name) if previous else None
+        status = ''
+        if budget is not None and ms > budget:
+            status = '  ❌ over budget'
+            over_budget += 1
+        print(f"{name:<20} {ms:8.1f} {budget if budget is not None else '-':>8} "
+              f"{f'{before:.1f}' if before is not None else '-':>9}{status}")
+
+    print("\nSlowest imports after streamlit (self time):")
+    for module, _, self_us, _ in slowest:
+        print(f"  {self_us / 1000:8.1f} ms  {module}")
+
+    os.makedirs(os.path.dirname(history_path) or '.', exist_ok=True)
+    with open(history_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'phases_ms': {name: round(ms, 1) for name, ms in best.items()}
+        }) + '\n')
+
+    return over_budget
+
+
+# =====================================================
+# APP RERUNS
+# =====================================================
+
+RERUN_HISTORY = os.path.join('.cache', 'rerun_history.jsonl')
+# A measurement regresses when it exceeds the last passing run by more than
+# the threshold ratio and by more than its noise floor
+RERUN_THRESHOLD = 0.25
+RERUN_NOISE_FLOOR = {'cold_ms': 20.0, 'warm_ms': 10.0, 'peak_mb': 2.0}
+RERUN_TIMEOUT_SECONDS = 60
+
+
+def _clear_streamlit_caches():
+    import streamlit as st
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def _measure_app(source: str, repeat: int) -> Dict[str, Dict[str, object]]:
+    """Cold and warm rerun latency and peak memory of every demo_section of a generated app
+
+    Cold reruns start with empty Streamlit caches, as for the first viewer
+    after a deploy, warm reruns with the caches filled; both are the best of
+    repeat reruns. Peak memory is traced (tracemalloc) over a separate cold
+    rerun so tracing does not slow the timed ones.
+    """
+    import gc
+    import tracemalloc
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_string(source, default_timeout=RERUN_TIMEOUT_SECONDS)
+    app.run()
+    if app.exception:
+        return {'(startup)': {'errors': [error.value for error in app.exception]}}
+
+    results = {}
+    for section in app.sidebar.radio[0].options:
+        app.sidebar.radio[0].set_value(section).run()
+        errors = [error.value for error in app.exception]
+
+        def cold_rerun():
+            _clear_streamlit_caches()
+            gc.collect()
+            start = time.perf_counter()
+            app.run()
+            return time.perf_counter() - start
+
+        def warm_rerun():
+            gc.collect()
+            start = time.perf_counter()
+            app.run()
+            return time.perf_counter() - start
+
+        cold = min(cold_rerun() for _ in range(repeat))
+        warm = min(warm_rerun() for _ in range(repeat))
+
+        _clear_streamlit_caches()
+        tracemalloc.start()
+        try:
+            app.run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        results[section] = {
+            'cold_ms': round(cold * 1000, 1),
+            'warm_ms': round(warm * 1000, 1),
+            'peak_mb': round(peak / 2 ** 20, 2),
+            'errors': errors
+        }
+    return results
+
+
+def bench_rerun(industries: Optional[List[str]], repeat: int, threshold: float, history_path: str) -> int:
+    """Drive a generated app per industry through every demo_section with AppTest
+
+    The result is compared with the last passing run in history_path and
+    appended to it. Returns the number of sections that raised or regressed
+    beyond the threshold.
+    """
+    import streamlit
+    from streamlit import config
+    from streamlit.logger import set_log_level
+    from demo_generator import DemoGenerator
+    from streamlit_generator import StreamlitGenerator
+
+    # Bare-mode AppTest runs log a warning for every cache call and deprecated argument
+    config.set_option('logger.level', 'error')
+    set_log_level('error')
+
+    demo_generator = DemoGenerator()
+    generator = StreamlitGenerator()
+    industries = industries or list(demo_generator.industry_templates)
+
+    previous = None
+    if os.path.exists(history_path):
+        with open(history_path, 'r', encoding='utf-8') as f:
+            runs = [json.loads(line) for line in f if line.strip()]
+        previous = next((run for run in reversed(runs) if not run['failures']), None)
+
+    print(f"{'industry':<14} {'section':<26} {'cold ms':>9} {'warm ms':>9} {'peak MB':>9}   previous (cold/warm/MB)")
+    apps = {}
+    failures = 0
+    for industry in industries:
+        client = {
+            # Quotes, braces and a backslash: the name has to survive every generated string literal
+            'name': f"Benchmark {industry.title()} \"Q\" {{x}} O'Neil \\",
+            'website_info': {'industry': industry, 'url': 'https://benchmark.com', 'domain': 'benchmark.com'},
+            'purpose': 'Benchmark',
+            'reference_date': '2025-01-01'
+        }
+        source = generator._generate_app_content(client, demo_generator.build_demo_context(client))
+        apps[industry] = _measure_app(source, repeat)
+
+        for section, result in apps[industry].items():
+            before = ((previous or {}).get('apps') or {}).get(industry, {}).get(section)
+            problems = [f"raised {error}" for error in result['errors']]
+            if before and not problems:
+                for metric, floor in RERUN_NOISE_FLOOR.items():
+                    if result[metric] > before[metric] * (1 + threshold) and result[metric] - before[metric] > floor:
+                        problems.append(f"{metric} {before[metric]:g} -> {result[metric]:g}")
+            failures += bool(problems)
+
+            label = section.encode('ascii', 'ignore').decode().strip()
+            if 'cold_ms' in result:
+                print(f"{industry:<14} {label:<26} {result['cold_ms']:9.1f} {result['warm_ms']:9.1f} "
+                      f"{result['peak_mb']:9.2f}   "
+                      + (f"{before['cold_ms']:.1f}/{before['warm_ms']:.1f}/{before['peak_mb']:.2f}" if before else '-'))
+            else:
+                print(f"{industry:<14} {label:<26}")
+            for problem in problems:
+                print(f"  ❌ {problem}")
+
+    os.makedirs(os.path.dirname(history_path) or '.', exist_ok=True)
+    with open(history_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'streamlit': streamlit.__version__,
+            'repeat': repeat,
+            'threshold': threshold,
+            'failures': failures,
+            'apps': apps
+        }, ensure_ascii=False) + '\n')
+
+    return failures
+
+
+# =====================================================
+# VERIFIED QUERIES
+# =====================================================
+
+def bench_queries(industry: str, scale_factors: List[float], engine: str, repeat: int,
+                  model_path: Optional[str] = None, json_path: Optional[str] = None) -> int:
+    """Run the semantic model's verified queries locally at several scale factors
+
+    Returns the number of queries that failed or scale super-linearly.
+    """
+    from query_benchmark import benchmark_verified_queries
+
+    queries = None
+    if model_path:
+        import yaml
+        with open(model_path, 'r', encoding='utf-8') as f:
+            queries = yaml.safe_load(f).get('verified_queries', [])
+
+    report = benchmark_verified_queries(industry, scale_factors, engine, repeat, queries)
+    sfs = report['scale_factors']
+    print(f"Engine: {report['engine']}  Industry: {industry}  Scale factors: {', '.join(f'{sf:g}' for sf in sfs)}")
+    print(f"{'query':<32}" + ''.join(f"{f'SF {sf:g} ms':>12}" for sf in sfs) + f"{'rows scanned':>14} {'slope':>6}")
+
+    problems = 0
+    for query in report['queries']:
+        runs = query['runs']
+        latencies = ''.join(
+            f"{run['latency_ms']:12.2f}" if 'latency_ms' in run else f"{'error':>12}" for run in runs
+        )
+        largest = runs[-1]
+        exponent = f"{query['exponent']:6.2f}" if query['exponent'] is not None else f"{'-':>6}"
+        flag = '  ❌ super-linear' if query['superlinear'] else ''
+        print(f"{query['name'][:32]:<32}{latencies}{largest.get('rows_scanned', 0):14,} {exponent}{flag}")
+        print(f"    plan: {largest.get('plan') or largest.get('error')}")
+        errors = [run['error'] for run in runs if 'error' in run]
+        if query['superlinear'] or errors:
+            problems += 1
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    return problems
+
+
+# =====================================================
+# SEMANTIC MODEL YAML
+# =====================================================
+
+def bench_yaml(model_path: Optional[str], repeat: int) -> int:
+    """Load, index, validate and emit a semantic model with the C and pure-Python YAML backends
+
+    Returns the number of unresolved references found in the model.
+    """
+    import io
+    import yaml
+    from semantic_model_index import YAML_DUMPER, YAML_LOADER, SchemaIndex, dump_yaml, validate_model
+
+    if model_path:
+        with open(model_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        model = yaml.load(text, Loader=YAML_LOADER)
+        label = os.path.basename(model_path)
+    else:
+        from demo_generator import DemoGenerator
+        from semantic_model_generator import SemanticModelGenerator
+        demo_context = DemoGenerator().build_demo_context({'name': 'Benchmark Co', 'website_info': {'industry': 'retail'}})
+        model = SemanticModelGenerator()._build_semantic_model(
+            demo_context['company_name'], demo_context['db_name'], demo_context['template'], demo_context['sample_data']
+        )
+        text = dump_yaml(model)
+        label = 'generated retail model'
+
+    problems = validate_model(model)
+    c_text = dump_yaml(model, Dumper=YAML_DUMPER)
+    pure_text = dump_yaml(model, Dumper=yaml.SafeDumper)
+
+    print(f"Model: {label} ({len(text.splitlines()):,} lines)  libyaml: {'yes' if yaml.__with_libyaml__ else 'no'}")
+    timings = [
+        ('load (C parser)', lambda: yaml.load(text, Loader=YAML_LOADER)),
+        ('load (pure Python)', lambda: yaml.load(text, Loader=yaml.SafeLoader)),
+        ('index + validate', lambda: validate_model(model, SchemaIndex.from_model(model))),
+        ('emit (C emitter)', lambda: dump_yaml(model, io.StringIO(), Dumper=YAML_DUMPER)),
+        ('emit (pure Python)', lambda: dump_yaml(model, io.StringIO(), Dumper=yaml.SafeDumper)),
+        ('emit (legacy yaml.dump)', lambda: yaml.dump(model, io.StringIO(), default_flow_style=False,
+                                                      sort_keys=False, allow_unicode=True)),
+    ]
+    for name, func in timings:
+        print(f"  {name:<26}{_best_of(func, repeat) * 1000:9.2f} ms")
+    print(f"  C and pure-Python output identical: {'yes' if c_text == pure_text else 'NO'}")
+
+    for problem in problems:
+        print(f"  ❌ {problem}")
+    return len(problems)
+
+
+# =====================================================
+# CLI
+# =====================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Demo generator micro-benchmarks")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    keywords_parser = subparsers.add_parser('keywords', help="Website keyword scoring on large pages")
+    keywords_parser.add_argument('--sizes', type=float, nargs='+', default=[0.1, 1, 5], help="Page sizes in MB")
+    keywords_parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement (best is reported)")
+
+    apps_parser = subparsers.add_parser('apps', help="Streamlit app rendering, with a compile() check of every app")
+    apps_parser.add_argument('--count', type=int, default=1000, help="Number of apps to generate")
+
+    startup_parser = subparsers.add_parser('startup', help="Cold import time of the app against its budget")
+    startup_parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters to run (best is reported)")
+    startup_parser.add_argument('--history', default=STARTUP_HISTORY, help="JSONL file the result is appended to")
+
+    rerun_parser = subparsers.add_parser('rerun', help="Generated app rerun latency and memory per section (AppTest)")
+    rerun_parser.add_argument('--industries', nargs='+', help="Industries to generate apps for (default: all)")
+    rerun_parser.add_argument('--repeat', type=int, default=5, help="Cold and warm reruns per section (best is reported)")
+    rerun_parser.add_argument('--threshold', type=float, default=RERUN_THRESHOLD,
+                              help="Allowed growth over the last passing run before a measurement fails")
+    rerun_parser.add_argument('--history', default=RERUN_HISTORY, help="JSONL file the result is appended to")
+
+    queries_parser = subparsers.add_parser('queries', help="Verified queries on a local DuckDB / SQLite copy of the data")
+    queries_parser.add_argument('--industry', default='retail', help="Industry whose sample data and queries are used")
+    queries_parser.add_argument('--scale-factors', type=float, nargs='+', default=[1, 4, 16])
+    queries_parser.add_argument('--engine', choices=['auto', 'duckdb', 'sqlite'], default='auto')
+    queries_parser.add_argument('--repeat', type=int, default=3, help="Runs per query (best is reported)")
+    queries_parser.add_argument('--model', help="Generated semantic model YAML whose verified queries to run")
+    queries_parser.add_argument('--json', help="Also write the full report (plans included) to this file")
+
+    yaml_parser = subparsers.add_parser('yaml', help="Semantic model YAML load, validation and emission")
+    yaml_parser.add_argument('--model', help="Semantic model YAML to use instead of a generated retail model")
+    yaml_parser.add_argument('--repeat', type=int, default=20, help="Runs per measurement (best is reported)")
+
+    args = parser.parse_args()
+    if args.benchmark == 'keywords':
+        bench_keywords(args.sizes, args.repeat)
+    elif args.benchmark == 'apps':
+        sys.exit(1 if bench_apps(args.count) else 0)
+    elif args.benchmark == 'startup':
+        sys.exit(1 if bench_startup(args.repeat, args.history) else 0)
+    elif args.benchmark == 'rerun':
+        sys.exit(1 if bench_rerun(args.industries, args.repeat, args.threshold, args.history) else 0)
+    elif args.benchmark == 'queries':
+        sys.exit(1 if bench_queries(args.industry, args.scale_factors, args.engine, args.repeat,
+                                    args.model, args.json) else 0)
+    elif args.benchmark == 'yaml':
+        sys.exit(1 if bench_yaml(args.model, args.repeat) else 0)
+
+
+if __name__ == "__main__":
+    main()
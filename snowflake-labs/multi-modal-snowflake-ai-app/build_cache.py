@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Build Cache
+===========
+Content-addressed cache of generated demo artifacts.
+
+Each artifact is keyed by a SHA-256 of everything that decides its bytes:
+the client info (minus run bookkeeping such as generated_at), the resolved
+demo context (industry template, sample data sizing and scale factor, seed,
+reference date), the data format where it matters, and the generator's
+GENERATOR_VERSION plus a digest of its source files. Generation is seeded,
+so equal keys always mean identical files.
+
+A hit copies the stored files into the output folder instead of running the
+generator. A miss builds into a private staging folder which is then renamed
+into place under its key, so concurrent builds never see half an entry.
+
+The cache is bounded. Builds larger than MAX_ENTRY_BYTES (bulk-load data at
+high scale factors) are moved straight into the output folder and never
+stored, since regenerating them costs little next to keeping a second copy.
+Entries unused for MAX_AGE_DAYS are dropped, and least recently used ones
+after that until the cache fits in MAX_CACHE_BYTES.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'builds')
+ENTRY_MANIFEST = '_entry.json'
+MAX_ENTRY_BYTES = 64 * 2**20
+MAX_CACHE_BYTES = 2 * 2**30
+MAX_AGE_DAYS = 30
+
+# Fields that record how or when a run happened rather than what it builds
+VOLATILE_CLIENT_FIELDS = {'generated_at'}
+VOLATILE_WEBSITE_FIELDS = {'cache_status'}
+
+
+# =====================================================
+# KEYS
+# =====================================================
+
+@lru_cache(maxsize=None)
+def generator_fingerprint(modules: Tuple[str, ...]) -> Dict[str, Any]:
+    """GENERATOR_VERSION of each module and a digest of their combined source"""
+    digest = hashlib.sha256()
+    versions = {}
+    for name in modules:
+        module = importlib.import_module(name)
+        versions[name] = getattr(module, 'GENERATOR_VERSION', None)
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return {'versions': versions, 'source': digest.hexdigest()}
+
+
+def stable_client_info(client_info: Dict[str, Any]) -> Dict[str, Any]:
+    """client_info without the fields that change on every run"""
+    stable = {key: value for key, value in client_info.items() if key not in VOLATILE_CLIENT_FIELDS}
+    if isinstance(stable.get('website_info'), dict):
+        stable['website_info'] = {
+            key: value for key, value in stable['website_info'].items() if key not in VOLATILE_WEBSITE_FIELDS
+        }
+    return stable
+
+
+def artifact_key(artifact: str, modules: List[str], client_info: Dict[str, Any],
+                 demo_context: Dict[str, Any], **options: Any) -> str:
+    """Content address of one artifact build"""
+    payload = {
+        'artifact': artifact,
+        'generator': generator_fingerprint(tuple(modules)),
+        'client_info': stable_client_info(client_info),
+        'demo_context': demo_context,
+        'options': options
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+# =====================================================
+# CACHE
+# =====================================================
+
+def _map_paths(result: Any, func: Callable[[str], str]) -> Any:
+    """Apply func to every file path in a generator result (a path or a dict of paths)"""
+    if isinstance(result, dict):
+        return {key: _map_paths(value, func) for key, value in result.items()}
+    if isinstance(result, str):
+        return func(result)
+    return result
+
+
+def _folder_bytes(folder: str) -> int:
+    """Total size of the files under a folder"""
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(folder) for name in names)
+
+
+class BuildCache:
+    """On-disk store of built artifacts, one folder per content key"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_entry_bytes: int = MAX_ENTRY_BYTES,
+                 max_cache_bytes: int = MAX_CACHE_BYTES, max_age_days: float = MAX_AGE_DAYS):
+        self.cache_dir = cache_dir
+        self.max_entry_bytes = max_entry_bytes
+        self.max_cache_bytes = max_cache_bytes
+        self.max_age_days = max_age_days
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Manifest of a cached entry, or None"""
+        try:
+            with open(os.path.join(self._entry_dir(key), ENTRY_MANIFEST), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get_or_build(self, key: str, output_dir: str, build: Callable[[str], Any]) -> Tuple[Any, bool]:
+        """Place an artifact in output_dir, building it only on a cache miss
+
+        build(directory) must write the artifact into directory and return
+        its file path(s). Returns the paths inside output_dir and whether the
+        entry came from the cache.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            try:
+                # Marks the entry as recently used, so prune() keeps it longest
+                os.utime(os.path.join(self._entry_dir(key), ENTRY_MANIFEST))
+                return self._materialize(self._entry_dir(key), entry, output_dir), True
+            except OSError:
+                pass  # Pruned by a concurrent build in the meantime; build it again
+
+        staging_dir = os.path.join(self.cache_dir, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        os.makedirs(staging_dir)
+
+        try:
+            entry = self._build_entry(key, build, staging_dir)
+            if entry['bytes'] > self.max_entry_bytes:
+                return self._materialize(staging_dir, entry, output_dir, move=True), False
+
+            try:
+                os.rename(staging_dir, self._entry_dir(key))
+            except OSError:
+                pass  # Another build published the same key first; its files are identical
+            result = self._materialize(self._entry_dir(key), entry, output_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self.prune()
+        return result, False
+
+    def _build_entry(self, key: str, build: Callable[[str], Any], staging_dir: str) -> Dict[str, Any]:
+        """Build into the staging folder and write its manifest there"""
+        result = build(staging_dir)
+        files = sorted(
+            os.path.relpath(os.path.join(root, name), staging_dir)
+            for root, _, names in os.walk(staging_dir) for name in names
+        )
+        entry = {
+            'key': key,
+            'files': files,
+            'bytes': sum(os.path.getsize(os.path.join(staging_dir, path)) for path in files),
+            'result': _map_paths(result, lambda path: os.path.relpath(path, staging_dir))
+        }
+        with open(os.path.join(staging_dir, ENTRY_MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        return entry
+
+    def _materialize(self, entry_dir: str, entry: Dict[str, Any], output_dir: str, move: bool = False) -> Any:
+        """Copy (or move) an entry's files into output_dir and return its result with output paths"""
+
+        # Data folders belong to the artifact, so parts left over from a larger build are dropped
+        for folder in {path.split(os.sep)[0] for path in entry['files'] if os.sep in path}:
+            shutil.rmtree(os.path.join(output_dir, folder), ignore_errors=True)
+
+        for path in entry['files']:
+            target = os.path.join(output_dir, path)
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+            if move:
+                shutil.move(os.path.join(entry_dir, path), target)
+            else:
+                shutil.copyfile(os.path.join(entry_dir, path), target)
+
+        return _map_paths(entry['result'], lambda path: os.path.join(output_dir, path))
+
+    def prune(self):
+        """Drop entries unused for max_age_days, then least recently used ones until the cache fits max_cache_bytes"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            manifest = os.path.join(self.cache_dir, name, ENTRY_MANIFEST)
+            if name.endswith('.tmp'):
+                continue  # Staging folder of a build in progress
+            try:
+                used = os.path.getmtime(manifest)
+                with open(manifest, 'r', encoding='utf-8') as f:
+                    size = json.load(f).get('bytes')
+            except (OSError, ValueError):
+                continue
+            if size is None:
+                size = _folder_bytes(os.path.join(self.cache_dir, name))  # Entry written before sizes were recorded
+            entries.append((used, size, name))
+
+        total = sum(size for _, size, _ in entries)
+        oldest_kept = time.time() - self.max_age_days * 86400
+        for used, size, name in sorted(entries):
+            if used >= oldest_kept and total <= self.max_cache_bytes:
+                break
+            shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+            total -= size
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Demo Build Pipeline
+===================
+Builds every artifact of a client demo in one go.
+
+The client context (industry template, sample data sizing, database name)
+is resolved once and handed to the Streamlit, SQL and semantic model
+generators, which then run concurrently on a process pool. Wall-clock and
+per-artifact timings are reported so slow artifacts are easy to spot.
+
+Artifacts go through the content-addressed build cache (build_cache.py):
+an artifact whose inputs and generator are unchanged is copied from the
+cache instead of being generated again.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Tuple
+
+from build_cache import BuildCache, DEFAULT_CACHE_DIR, artifact_key
+
+# =====================================================
+# ARTIFACT TASKS
+# =====================================================
+# Module-level functions so they can be pickled and run in worker processes
+
+def _build_streamlit_app(client_info: Dict[str, Any], demo_context: Dict[str, Any],
+                         output_dir: str, data_format: str) -> Tuple[Any, float]:
+    """Generate the Streamlit application"""
+    start = time.perf_counter()
+    from streamlit_generator import StreamlitGenerator
+    app_file = StreamlitGenerator().generate_app(client_info, output_dir, demo_context)
+    return app_file, time.perf_counter() - start
+
+
+def _build_sql_scripts(client_info: Dict[str, Any], demo_context: Dict[str, Any],
+                       output_dir: str, data_format: str) -> Tuple[Any, float]:
+    """Generate the setup, tables, sample data and views scripts"""
+    start = time.perf_counter()
+    from sql_generator import SQLGenerator
+    sql_files = SQLGenerator().generate_complete_setup(client_info, output_dir, data_format, demo_context)
+    return sql_files, time.perf_counter() - start
+
+
+def _build_semantic_model(client_info: Dict[str, Any], demo_context: Dict[str, Any],
+                          output_dir: str, data_format: str) -> Tuple[Any, float]:
+    """Generate the Cortex Analyst semantic model"""
+    start = time.perf_counter()
+    from semantic_model_generator import SemanticModelGenerator
+    model_file = SemanticModelGenerator().generate_semantic_model(client_info, output_dir, demo_context)
+    return model_file, time.perf_counter() - start
+
+
+ARTIFACT_TASKS = {
+    'streamlit_app': _build_streamlit_app,
+    'sql_scripts': _build_sql_scripts,
+    'semantic_model': _build_semantic_model
+}
+
+# Modules whose code decides each artifact's content, for its cache key
+ARTIFACT_MODULES = {
+    'streamlit_app': ['streamlit_generator', 'sql_generator', 'aggregate_objects'],
+    'sql_scripts': ['sql_generator', 'sample_data_engine', 'clustering_advisor', 'semantic_model_generator',
+                    'aggregate_objects'],
+    'semantic_model': ['semantic_model_generator', 'sql_generator', 'aggregate_objects']
+}
+
+# Artifacts that never read the sample data sizing, so a new scale factor reuses them
+SCALE_INDEPENDENT_ARTIFACTS = {'streamlit_app', 'semantic_model'}
+
+
+def _key_inputs(name: str, client_info: Dict[str, Any], demo_context: Dict[str, Any]) -> Tuple[Dict, Dict]:
+    """The parts of the client info and context that can change an artifact's content"""
+    if name not in SCALE_INDEPENDENT_ARTIFACTS:
+        return client_info, demo_context
+
+    sample_data = {
+        key: value for key, value in demo_context['sample_data'].items() if key not in ('scale_factor', 'row_counts')
+    }
+    return (
+        {key: value for key, value in client_info.items() if key != 'scale_factor'},
+        {**demo_context, 'sample_data': sample_data}
+    )
+
+
+def _run_artifact(name: str, client_info: Dict[str, Any], demo_context: Dict[str, Any],
+                  output_dir: str, data_format: str, cache_dir: Optional[str]) -> Tuple[Any, float, bool]:
+    """Build one artifact, reusing a cached build when its inputs are unchanged"""
+    task = ARTIFACT_TASKS[name]
+    if cache_dir is None:
+        return (*task(client_info, demo_context, output_dir, data_format), False)
+
+    start = time.perf_counter()
+    # Only the SQL scripts depend on the sample data format
+    options = {'data_format': data_format} if name == 'sql_scripts' else {}
+    key = artifact_key(name, ARTIFACT_MODULES[name], *_key_inputs(name, client_info, demo_context), **options)
+
+    result, hit = BuildCache(cache_dir).get_or_build(
+        key, output_dir, lambda directory: task(client_info, demo_context, directory, data_format)[0]
+    )
+    return result, time.perf_counter() - start, hit
+
+
+# =====================================================
+# PIPELINE
+# =====================================================
+
+def build_all(client_info: Dict[str, Any], output_dir: str = "output", data_format: str = "sql",
+              max_workers: int = None, parallel: bool = True, use_cache: bool = True,
+              cache_dir: str = DEFAULT_CACHE_DIR) -> Dict[str, Any]:
+    """Build every demo artifact for a client and report timings
+
+    Returns a dictionary with the generated 'files', per-step 'timings' in
+    seconds (context, each artifact, readme), the overall 'wall_clock' and
+    the artifacts served from the build 'cache'. With parallel=False the
+    artifacts are built one after another in this process, which is handy
+    when debugging a generator; use_cache=False always regenerates.
+    """
+    from demo_generator import DemoGenerator
+
+    pipeline_start = time.perf_counter()
+    timings = {}
+
+    # Resolve the shared client context once
+    step_start = time.perf_counter()
+    generator = DemoGenerator()
+    demo_context = generator.build_demo_context(client_info)
+    timings['context'] = time.perf_counter() - step_start
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Build artifacts
+    cache = cache_dir if use_cache else None
+    results = {}
+    if parallel:
+        workers = max_workers or len(ARTIFACT_TASKS)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_run_artifact, name, client_info, demo_context, output_dir, data_format, cache): name
+                for name in ARTIFACT_TASKS
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    else:
+        for name in ARTIFACT_TASKS:
+            results[name] = _run_artifact(name, client_info, demo_context, output_dir, data_format, cache)
+
+    cached = []
+    for name in ARTIFACT_TASKS:
+        _, seconds, hit = results[name]
+        timings[name] = seconds
+        if hit:
+            cached.append(name)
+
+    app_file = results['streamlit_app'][0]
+    sql_files = results['sql_scripts'][0]
+    model_file = results['semantic_model'][0]
+
+    # README references the other artifacts, so it is written last
+    step_start = time.perf_counter()
+    readme_content = generator._generate_readme(client_info, app_file, sql_files, model_file)
+    readme_file = os.path.join(output_dir, f"README_{client_info['name'].replace(' ', '_')}.md")
+    with open(readme_file, 'w', encoding='utf-8') as f:
+        f.write(readme_content)
+    timings['readme'] = time.perf_counter() - step_start
+
+    return {
+        'files': {
+            'Streamlit App': app_file,
+            'README': readme_file,
+            'Semantic Model': model_file,
+            **sql_files
+        },
+        'timings': timings,
+        'cache': cached,
+        'wall_clock': time.perf_counter() - pipeline_start
+    }
+
+
+def format_timings(report: Dict[str, Any]) -> str:
+    """Render a build report's timings as a small text table"""
+    timings = report['timings']
+    width = max(len(name) for name in timings)
+
+    cached = report.get('cache', [])
+    lines = [
+        f"{name.ljust(width)}  {seconds:8.2f}s" + ('  (cached)' if name in cached else '')
+        for name, seconds in timings.items()
+    ]
+    lines.append(f"{'wall clock'.ljust(width)}  {report['wall_clock']:8.2f}s")
+
+    # Sequential cost of the steps vs. what the pipeline actually took
+    lines.append(f"{'serial sum'.ljust(width)}  {sum(timings.values()):8.2f}s")
+    return '\n'.join(lines)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Clustering Advisor
+==================
+Recommends clustering keys and search optimization for the demo tables.
+
+The advisor reads the SQL the demo actually runs (the analytical views and
+the semantic model's verified queries) and counts, per table and column,
+how often a column is filtered by a range (dates), compared to a literal,
+or grouped by. Clustering keys are built from range-filtered date columns
+followed by the most used low-cardinality dimension; search optimization is
+suggested for literal point lookups on identifier columns.
+
+Both features cost credits to maintain and only pay off once a table spans
+many micro-partitions, so each recommendation is sized against the table's
+row count at the chosen scale factor. Below the threshold it is still
+written, commented out, together with the row count at which it starts to
+matter.
+"""
+
+import math
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Rows of a narrow fact table in one ~16 MB (compressed) micro-partition
+ROWS_PER_MICRO_PARTITION = 500_000
+# Clustering only lets date windows skip work once a table spans several micro-partitions;
+# at ~2M rows TRANSACTIONS qualifies from SF 400, the top of the demo's scale range
+CLUSTERING_MIN_MICRO_PARTITIONS = 4
+# Point lookups on a single micro-partition already read just that partition
+SEARCH_OPTIMIZATION_MIN_MICRO_PARTITIONS = 2
+# Snowflake recommends at most three or four clustering key expressions
+MAX_CLUSTERING_KEYS = 2
+
+_SQL_WORDS = {
+    'select', 'from', 'where', 'join', 'on', 'and', 'or', 'not', 'group', 'by', 'order', 'having', 'limit',
+    'union', 'all', 'as', 'case', 'when', 'then', 'else', 'end', 'in', 'is', 'null', 'true', 'false',
+    'left', 'right', 'inner', 'outer', 'full', 'cross', 'desc', 'asc', 'distinct', 'between', 'like'
+}
+_COMMENT = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_TABLE_REFERENCE = re.compile(
+    r"\b(?:FROM|JOIN)\s+([A-Za-z_]\w*)(?:\s+(?:AS\s+)?(?!(?:WHERE|JOIN|ON|GROUP|ORDER|LEFT|RIGHT|INNER|FULL|CROSS|LIMIT|UNION|HAVING)\b)([A-Za-z_]\w*))?",
+    re.I
+)
+_COLUMN = r'(?:([A-Za-z_]\w*)\.)?([A-Za-z_]\w*)'
+_RANGE = re.compile(_COLUMN + r"\s*(?:>=|<=|>|<|\bBETWEEN\b)", re.I)
+_EQUALITY = re.compile(_COLUMN + r"\s*(?:=\s*(?:'|-?\d|TRUE\b|FALSE\b)|\bIN\s*\(\s*')", re.I)
+_GROUP_BY = re.compile(r'\bGROUP\s+BY\b(.*?)(?=\bORDER\s+BY\b|\bHAVING\b|\bLIMIT\b|\bQUALIFY\b|$)', re.I | re.S)
+_GROUP_COLUMN = re.compile(_COLUMN + r'\b(?!\s*\()')
+_TIME_BUCKET = re.compile(r"\b(?:DATE_TRUNC\s*\(\s*''\s*,|TO_DATE\s*\(|DATE\s*\()\s*" + _COLUMN, re.I)
+
+# range: compared with <, >, BETWEEN; equality: compared with a literal;
+# bucket: grouped by a DATE_TRUNC / TO_DATE of it; group: grouped by as is
+USAGE_KINDS = ('range', 'equality', 'bucket', 'group')
+# Dimension keys must be used by at least this many branches
+MIN_DIMENSION_USES = 2
+
+
+# =====================================================
+# USAGE
+# =====================================================
+
+def _branches(sql: str) -> Iterable[str]:
+    """Statements and UNION branches of a script, comments removed"""
+    for statement in _COMMENT.sub(' ', sql).split(';'):
+        yield from re.split(r'\bUNION(?:\s+ALL)?\b', statement, flags=re.I)
+
+
+def column_usage(sql: str) -> List[Tuple[str, str, str]]:
+    """(TABLE, COLUMN, kind) for every filter and GROUP BY column in a script (kinds in USAGE_KINDS)
+
+    Each branch reports a column at most once per kind. Unqualified columns
+    are attributed to the branch's table when it reads from a single table.
+    """
+    usage = []
+    for branch in _branches(sql):
+        references = _TABLE_REFERENCE.findall(branch)
+        if not references:
+            continue
+
+        aliases = {}
+        for table, alias in references:
+            aliases[table.upper()] = table.upper()
+            if alias:
+                aliases[alias.upper()] = table.upper()
+        tables = set(aliases.values())
+        default_table = next(iter(tables)) if len(tables) == 1 else None
+
+        def resolve(qualifier: str, column: str):
+            if column.lower() in _SQL_WORDS:
+                return None
+            table = aliases.get(qualifier.upper()) if qualifier else default_table
+            return (table, column.upper()) if table else None
+
+        # Predicates live in WHERE and JOIN ... ON, after the first FROM
+        body = branch[re.search(r'\bFROM\b', branch, re.I).start():]
+        found = set()
+        for kind, pattern in (('range', _RANGE), ('equality', _EQUALITY)):
+            for qualifier, column in pattern.findall(body):
+                resolved = resolve(qualifier, column)
+                if resolved:
+                    found.add(resolved + (kind,))
+
+        for clause in _GROUP_BY.findall(_STRING.sub("''", body)):
+            buckets = {resolve(qualifier, column) for qualifier, column in _TIME_BUCKET.findall(clause)}
+            for qualifier, column in _GROUP_COLUMN.findall(clause):
+                resolved = resolve(qualifier, column)
+                if resolved:
+                    found.add(resolved + ('bucket' if resolved in buckets else 'group',))
+
+        usage.extend(sorted(found))
+    return usage
+
+
+# =====================================================
+# RECOMMENDATIONS
+# =====================================================
+
+def micro_partitions(rows: int) -> int:
+    """Estimated micro-partitions of a table with this many rows"""
+    return max(1, math.ceil(rows / ROWS_PER_MICRO_PARTITION))
+
+
+def recommend(queries: Dict[str, str], row_counts: Dict[str, int]) -> List[Dict[str, Any]]:
+    """Clustering and search optimization advice for every table the queries filter or group
+
+    queries maps a name (view or verified query) to its SQL; row_counts maps
+    table names to rows at the chosen scale factor. Tables without a row
+    count are treated as small dimension tables.
+    """
+    row_counts = {table.upper(): rows for table, rows in row_counts.items()}
+    tables: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for sql in queries.values():
+        for table, column, kind in column_usage(sql):
+            counts = tables.setdefault(table, {}).setdefault(column, dict.fromkeys(USAGE_KINDS, 0))
+            counts[kind] += 1
+
+    advice = []
+    for table, columns in sorted(tables.items()):
+        rows = row_counts.get(table, 0)
+        partitions = micro_partitions(rows)
+
+        def ranked(kinds: Tuple[str, ...], identifiers: bool, min_uses: int = 1) -> List[str]:
+            candidates = [
+                column for column, counts in columns.items()
+                if sum(counts[kind] for kind in kinds) >= min_uses and column.endswith('_ID') == identifiers
+            ]
+            return sorted(candidates, key=lambda column: tuple(-columns[column][kind] for kind in kinds) + (column,))
+
+        # Leading key: the date the queries window or bucket on, truncated to a day to keep
+        # cardinality low; then the dimension the queries slice by most often
+        dates = ranked(('range', 'bucket'), identifiers=False)
+        dimensions = [
+            column for column in ranked(('group', 'equality'), identifiers=False, min_uses=MIN_DIMENSION_USES)
+            if column not in dates
+        ]
+        keys = [f"TO_DATE({column})" for column in dates[:1]] + dimensions
+        lookups = ranked(('equality',), identifiers=True)
+
+        advice.append({
+            'table': table,
+            'rows': rows,
+            'micro_partitions': partitions,
+            'usage': columns,
+            'cluster_by': keys[:MAX_CLUSTERING_KEYS],
+            'cluster': bool(keys) and partitions >= CLUSTERING_MIN_MICRO_PARTITIONS,
+            'search_optimization': lookups,
+            'search': bool(lookups) and partitions >= SEARCH_OPTIMIZATION_MIN_MICRO_PARTITIONS
+        })
+    return advice
+
+
+def render_sql(advice: List[Dict[str, Any]], scale_factor: float, sources: Dict[str, int]) -> str:
+    """Explanation block and ALTER TABLE statements, inactive ones commented out"""
+    source_text = ', '.join(f"{count} {name}" for name, count in sources.items())
+    lines = [
+        f"-- Analysed {source_text} at SF {scale_factor:g}.",
+        f"-- Clustering pays off from ~{CLUSTERING_MIN_MICRO_PARTITIONS:,} micro-partitions "
+        f"(~{CLUSTERING_MIN_MICRO_PARTITIONS * ROWS_PER_MICRO_PARTITION:,} rows), search",
+        f"-- optimization from ~{SEARCH_OPTIMIZATION_MIN_MICRO_PARTITIONS:,} "
+        f"(~{SEARCH_OPTIMIZATION_MIN_MICRO_PARTITIONS * ROWS_PER_MICRO_PARTITION:,} rows). "
+        "Smaller tables prune well enough",
+        "-- without them, so their statements are left commented out."
+    ]
+    if not any(entry['search_optimization'] for entry in advice):
+        lines.append("-- No query looks up single rows by identifier, so search optimization is not recommended.")
+
+    for entry in advice:
+        usage = entry['usage']
+        lines.append('')
+        lines.append(f"-- {entry['table']}: ~{entry['rows']:,} rows, ~{entry['micro_partitions']:,} micro-partition(s)")
+        for kind, label in (('range', 'range filters'), ('equality', 'literal filters'),
+                            ('bucket', 'time buckets'), ('group', 'group by')):
+            used = sorted((column for column in usage if usage[column][kind]), key=lambda c: (-usage[c][kind], c))
+            if used:
+                lines.append(f"--   {label + ':':<16} " + ', '.join(f"{c} ({usage[c][kind]})" for c in used))
+
+        if entry['cluster_by']:
+            prefix = '' if entry['cluster'] else '-- '
+            if not entry['cluster']:
+                lines.append(f"--   Not clustered at SF {scale_factor:g}: needs ~{CLUSTERING_MIN_MICRO_PARTITIONS:,} "
+                             "micro-partitions to pay off.")
+            lines.append(f"{prefix}ALTER TABLE {entry['table']} CLUSTER BY ({', '.join(entry['cluster_by'])});")
+        else:
+            lines.append("--   No range or dimension filters; no clustering key recommended.")
+
+        if entry['search_optimization']:
+            prefix = '' if entry['search'] else '-- '
+            targets = ', '.join(f"EQUALITY({column})" for column in entry['search_optimization'])
+            if not entry['search']:
+                lines.append(f"--   No search optimization at SF {scale_factor:g}: needs "
+                             f"~{SEARCH_OPTIMIZATION_MIN_MICRO_PARTITIONS:,} micro-partitions to pay off.")
+            lines.append(f"{prefix}ALTER TABLE {entry['table']} ADD SEARCH OPTIMIZATION ON {targets};")
+
+    return '\n'.join(lines)
@@ -15,15 +15,48 @@ Author: Snowflake Sales Engineer
 Version: 1.0
 """
 
-import streamlit as st
-import requests
 import json
 import re
-from urllib.parse import urlparse
+import threading
 import os
-from datetime import datetime
+from datetime import datetime, time
 from typing import Dict, List, Any, Tuple
 
+from aggregate_objects import AGGREGATE_MODES, DEFAULT_AGGREGATE_MODE, DEFAULT_TARGET_LAG
+
+# Scale factor 1 reproduces the original demo volumes; fact tables grow
+# linearly with the scale factor while dimension tables stay fixed
+BASE_ROW_COUNTS = {
+    'customers': 500,
+    'transactions': 5000,
+    'support_tickets': 1000,
+    'customer_feedback': 500
+}
+MIN_SCALE_FACTOR = 0.01
+MAX_SCALE_FACTOR = 1000
+
+PRODUCT_TEMPLATES = {
+    'Fashion': ['Premium Clothing Line', 'Designer Accessories', 'Seasonal Collection', 'Athletic Wear'],
+    'Home': ['Modern Furniture Set', 'Kitchen Appliances', 'Home Decor Collection', 'Bedding Essentials'],
+    'Electronics': ['Smart Device Collection', 'Audio Equipment', 'Computer Accessories', 'Mobile Tech'],
+    'Beauty': ['Skincare Essentials', 'Makeup Collection', 'Fragrance Line', 'Hair Care Products'],
+    'Sports': ['Fitness Equipment', 'Outdoor Gear', 'Athletic Accessories', 'Sports Apparel'],
+    'Luxury': ['Premium Collection', 'Exclusive Items', 'Limited Edition', 'VIP Products']
+}
+GENERIC_PRODUCT_TEMPLATES = ['Premium Product', 'Standard Product', 'Basic Product']
+
+# Streamlit is imported inside the UI code so headless users of this module
+# (build pipeline, batch CLI) do not pay for it. The generators behind the
+# buttons are imported in the background once the page has been drawn, so the
+# first click does not pay for numpy, yaml and requests either.
+WARM_MODULES = ['build_pipeline', 'streamlit_generator', 'sql_generator', 'semantic_model_generator', 'website_analyzer']
+_warm_lock = threading.Lock()
+_warm_thread = None
+
+# Generation is seeded and dated from the client context so the same inputs
+# always produce byte-for-byte identical artifacts
+DEFAULT_SEED = 42
+
 class DemoGenerator:
     """Main class for generating customized Snowflake Cortex demos"""
     
@@ -110,65 +143,12 @@ class DemoGenerator:
     def analyze_website(self, url: str) -> Dict[str, Any]:
         """Analyze a company website to extract business information"""
         try:
-            # Normalize URL
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            
-            # Extract domain info
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
-            
-            # Company name from domain
-            company_name = domain.replace('www.', '').split('.')[0].title()
-            
-            # Try to make a request to get basic info
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            try:
-                response = requests.get(url, headers=headers, timeout=10)
-                content = response.text.lower()
-                
-                # Simple keyword analysis to determine industry
-                industry_keywords = {
-                    'retail': ['shop', 'store', 'buy', 'product', 'cart', 'ecommerce', 'retail', 'fashion', 'clothing'],
-                    'financial': ['bank', 'finance', 'investment', 'loan', 'credit', 'insurance', 'financial'],
-                    'healthcare': ['health', 'medical', 'hospital', 'clinic', 'doctor', 'patient', 'healthcare'],
-                    'manufacturing': ['manufacturing', 'factory', 'production', 'industrial', 'machinery', 'equipment'],
-                    'technology': ['software', 'technology', 'tech', 'digital', 'cloud', 'api', 'platform']
-                }
-                
-                industry_scores = {}
-                for industry, keywords in industry_keywords.items():
-                    score = sum(1 for keyword in keywords if keyword in content)
-                    industry_scores[industry] = score
-                
-                # Determine best matching industry
-                best_industry = max(industry_scores, key=industry_scores.get) if industry_scores else 'technology'
-                
-            except Exception:
-                # Fallback to domain-based heuristics
-                if any(word in domain for word in ['shop', 'store', 'retail', 'fashion']):
-                    best_industry = 'retail'
-                elif any(word in domain for word in ['bank', 'finance', 'invest']):
-                    best_industry = 'financial'
-                elif any(word in domain for word in ['health', 'medical', 'hospital']):
-                    best_industry = 'healthcare'
-                elif any(word in domain for word in ['manufacturing', 'industrial']):
-                    best_industry = 'manufacturing'
-                else:
-                    best_industry = 'technology'
-            
-            return {
-                'company_name': company_name,
-                'domain': domain,
-                'url': url,
-                'industry': best_industry,
-                'industry_confidence': industry_scores.get(best_industry, 0) if 'industry_scores' in locals() else 0
-            }
+            # Pooled, cached fetch; falls back to domain heuristics when offline
+            from website_analyzer import WebsiteAnalyzer
+            return WebsiteAnalyzer(max_concurrency=1).analyze(url)
             
         except Exception as e:
+            import streamlit as st
             st.error(f"Error analyzing website: {str(e)}")
             return {
                 'company_name': 'Unknown Company',
@@ -186,8 +166,35 @@ class DemoGenerator:
         clean_name = clean_name.strip('_')  # Remove leading/trailing underscores
         return f"{clean_name}_CORTEX_DEMO"
     
-    def generate_sample_data(self, industry: str, company_name: str) -> Dict[str, Any]:
-        """Generate sample data appropriate for the industry"""
+    def build_demo_context(self, client_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve everything the artifact generators share for a client, once"""
+        company_name = client_info['name']
+        industry = client_info['website_info']['industry']
+        
+        return {
+            'company_name': company_name,
+            'industry': industry,
+            'template': self.industry_templates[industry],
+            'sample_data': self.generate_sample_data(industry, company_name, client_info.get('scale_factor', 1.0)),
+            'db_name': self.generate_database_name(company_name),
+            'seed': client_info.get('seed', DEFAULT_SEED),
+            'reference_date': self.get_reference_date(client_info),
+            'aggregate_mode': client_info.get('aggregate_mode', DEFAULT_AGGREGATE_MODE),
+            'target_lag': client_info.get('target_lag', DEFAULT_TARGET_LAG),
+            'instrumentation': client_info.get('instrumentation', False)
+        }
+    
+    def get_reference_date(self, client_info: Dict[str, Any]) -> datetime:
+        """Date the sample data and file headers are generated as of (client_info['reference_date'] or today)"""
+        reference_date = client_info.get('reference_date')
+        if reference_date is None:
+            return datetime.combine(datetime.now().date(), time())
+        if isinstance(reference_date, str):
+            return datetime.fromisoformat(reference_date)
+        return reference_date
+    
+    def generate_sample_data(self, industry: str, company_name: str, scale_factor: float = 1.0) -> Dict[str, Any]:
+        """Generate sample data appropriate for the industry, sized by a TPC-style scale factor"""
         template = self.industry_templates[industry]
         
         # Base data structure
@@ -197,11 +204,37 @@ class DemoGenerator:
             'metrics': template['metrics'],
             'customers': self.generate_customer_segments(industry),
             'transactions': self.generate_transaction_patterns(industry),
-            'use_cases': template['use_cases']
+            'products': self.generate_product_catalog(template['categories']),
+            'use_cases': template['use_cases'],
+            'scale_factor': scale_factor,
+            'row_counts': self.get_row_counts(scale_factor)
         }
         
         return data
     
+    def get_row_counts(self, scale_factor: float = 1.0) -> Dict[str, int]:
+        """Get the number of rows of each fact table for a scale factor"""
+        if not MIN_SCALE_FACTOR <= scale_factor <= MAX_SCALE_FACTOR:
+            raise ValueError(
+                f"Scale factor must be between {MIN_SCALE_FACTOR} and {MAX_SCALE_FACTOR}, got {scale_factor}"
+            )
+        
+        return {table: max(1, int(round(base * scale_factor))) for table, base in BASE_ROW_COUNTS.items()}
+    
+    def generate_product_catalog(self, categories: List[str]) -> List[Dict[str, str]]:
+        """Generate the product catalog, numbered so PRODUCT_ID foreign keys match the PRODUCTS table"""
+        products = []
+        for i, category in enumerate(categories, 1):
+            for product_template in PRODUCT_TEMPLATES.get(category, GENERIC_PRODUCT_TEMPLATES):
+                products.append({
+                    'product_id': f"PROD{len(products) + 1:04d}",
+                    'name': f"{category} - {product_template}",
+                    'category_id': f"CAT{i:03d}",
+                    'description': f"High-quality {product_template.lower()} from our {category.lower()} collection"
+                })
+        
+        return products
+    
     def get_revenue_scale(self, industry: str) -> Dict[str, int]:
         """Get appropriate revenue scale for industry"""
         scales = {
@@ -264,7 +297,7 @@ class DemoGenerator:
 
 This demo kit contains a complete Snowflake Cortex demonstration tailored for **{company_name}** in the **{template['name']}** industry.
 
-**Generated on:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}  
+**Generated on:** {self.get_reference_date(client_info).strftime("%Y-%m-%d")}  
 **Industry:** {template['name']} ({template['icon']})  
 **Website:** {website_info['url']}  
 **Demo Purpose:** {client_info['purpose']}
@@ -449,7 +482,28 @@ For questions about this demo kit:
 '''
 
 
+def warm_imports(modules: List[str] = WARM_MODULES) -> threading.Thread:
+    """Import modules on a daemon thread, once per process"""
+    global _warm_thread
+    
+    def import_all():
+        import importlib
+        for module in modules:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                pass  # The button that needs it reports the error
+    
+    with _warm_lock:
+        if _warm_thread is None:
+            _warm_thread = threading.Thread(target=import_all, name='warm-imports', daemon=True)
+            _warm_thread.start()
+    return _warm_thread
+
+
 def main():
+    import streamlit as st
+    
     st.set_page_config(
         page_title="Multi-Modal Snowflake AI Demo Generator",
         page_icon="🚀",
@@ -494,6 +548,31 @@ def main():
             ["Sales Presentation", "POC Demo", "Training Session", "Executive Briefing"],
             help="What is the main purpose of this demo?"
         )
+        
+        scale_factor = st.number_input(
+            "Data Scale Factor",
+            min_value=MIN_SCALE_FACTOR,
+            max_value=float(MAX_SCALE_FACTOR),
+            value=1.0,
+            help="TPC-style scale factor: SF 1 loads 500 customers and 5,000 transactions, SF 100 loads 50,000 customers and 500,000 transactions"
+        )
+        
+        aggregate_mode = st.selectbox(
+            "Aggregate Objects",
+            list(AGGREGATE_MODES),
+            format_func=lambda x: {
+                'view': "Plain views (recomputed on every query)",
+                'dynamic_table': "Dynamic tables (TARGET_LAG refresh)",
+                'materialized_view': "Materialized views (single-table aggregates)"
+            }[x],
+            help="Dynamic tables and materialized views precompute the aggregate views, so dashboard reads hit stored results; the app and semantic model query them directly"
+        )
+        
+        instrumentation = st.checkbox(
+            "Performance instrumentation",
+            value=False,
+            help="Time every section, query and Cortex call in the generated app and show them, with cache hit rates, in a sidebar Performance panel that exports JSON"
+        )
     
     # Analyze website button
     if st.button("🔍 Analyze Website & Generate Demo", disabled=not (client_name and website_url)):
@@ -511,6 +590,9 @@ def main():
                 'name': client_name,
                 'website_info': website_info,
                 'purpose': demo_purpose,
+                'scale_factor': scale_factor,
+                'aggregate_mode': aggregate_mode,
+                'instrumentation': instrumentation,
                 'generated_at': datetime.now().isoformat()
             }
             
@@ -540,6 +622,7 @@ def main():
             db_name = generator.generate_database_name(client_info['name'])
             st.write(f"**Database Name:** `{db_name}`")
             st.write(f"**Demo Purpose:** {client_info['purpose']}")
+            st.write(f"**Scale Factor:** SF {client_info.get('scale_factor', 1.0):g}")
             st.write(f"**Generated:** {client_info['generated_at'][:10]}")
             
             # Color preview
@@ -582,14 +665,27 @@ def main():
                         st.error(f"Error generating Streamlit app: {str(e)}")
         
         with col2:
+            data_format = st.selectbox(
+                "Sample Data Format",
+                ["sql", "csv", "parquet"],
+                format_func=lambda x: {
+                    'sql': "INSERT statements",
+                    'csv': "Bulk load: CSV (gzip) + COPY INTO",
+                    'parquet': "Bulk load: Parquet + COPY INTO"
+                }[x],
+                help="Bulk load formats write compressed data files and a PUT / COPY INTO script, which loads large scale factors much faster"
+            )
+            
             if st.button("🗄️ Generate SQL Scripts", use_container_width=True):
                 with st.spinner("Generating database schemas and sample data..."):
                     try:
                         from sql_generator import SQLGenerator
                         sql_gen = SQLGenerator()
-                        sql_files = sql_gen.generate_complete_setup(client_info, "output")
+                        sql_files = sql_gen.generate_complete_setup(client_info, "output", data_format)
                         
                         st.success("✅ SQL scripts generated successfully!")
+                        if data_format != 'sql':
+                            st.info(f"📁 {data_format.upper()} data files written to `output/{db_name.lower()}_data/` - run the load script with SnowSQL or the Snowflake CLI")
                         
                         for script_type, filepath in sql_files.items():
                             with open(filepath, 'r', encoding='utf-8') as f:
@@ -640,37 +736,21 @@ def main():
         if st.button("🚀 Generate Complete Demo Package", use_container_width=True, type="primary"):
             with st.spinner("Generating complete demo package..."):
                 try:
-                    # Generate all components
-                    from streamlit_generator import StreamlitGenerator
-                    from sql_generator import SQLGenerator
-                    from semantic_model_generator import SemanticModelGenerator
-                    
-                    streamlit_gen = StreamlitGenerator()
-                    sql_gen = SQLGenerator()
-                    semantic_gen = SemanticModelGenerator()
+                    # Resolve the client context once and build all artifacts in parallel
+                    from build_pipeline import build_all, format_timings
                     
-                    # Generate all files
-                    app_file = streamlit_gen.generate_app(client_info, "output")
-                    sql_files = sql_gen.generate_complete_setup(client_info, "output")
-                    model_file = semantic_gen.generate_semantic_model(client_info, "output")
+                    report = build_all(client_info, "output", data_format)
                     
-                    # Generate README
-                    readme_content = self._generate_readme(client_info, app_file, sql_files, model_file)
-                    readme_file = os.path.join("output", f"README_{client_info['name'].replace(' ', '_')}.md")
-                    with open(readme_file, 'w', encoding='utf-8') as f:
-                        f.write(readme_content)
+                    st.success(f"✅ Complete demo package generated in {report['wall_clock']:.1f}s!")
                     
-                    st.success("✅ Complete demo package generated successfully!")
+                    # Show timings
+                    with st.expander("⏱️ Build Timings"):
+                        st.code(format_timings(report), language=None)
                     
                     # Show summary
                     st.markdown("### 📦 Generated Files:")
                     
-                    all_files = {
-                        'Streamlit App': app_file,
-                        'README': readme_file,
-                        'Semantic Model': model_file,
-                        **sql_files
-                    }
+                    all_files = report['files']
                     
                     for file_type, filepath in all_files.items():
                         with open(filepath, 'r', encoding='utf-8') as f:
@@ -695,7 +775,7 @@ def main():
         st.header("👀 Step 4: Demo Preview")
         
         # Generate sample data for preview
-        sample_data = generator.generate_sample_data(industry, client_info['name'])
+        sample_data = generator.generate_sample_data(industry, client_info['name'], client_info.get('scale_factor', 1.0))
         
         tab1, tab2, tab3 = st.tabs(["📊 Sample Data", "🎯 Use Cases", "📋 Resources"])
         
@@ -719,6 +799,11 @@ def main():
                 
                 revenue_info = sample_data['revenue_scale']
                 st.write(f"**Revenue Scale:** {revenue_info['monthly_base']} {revenue_info['unit']} {revenue_info['currency']} monthly")
+                
+                st.write(f"**Row Counts (SF {sample_data['scale_factor']:g}):**")
+                st.write(f"• Products: {len(sample_data['products']):,}")
+                for table, count in sample_data['row_counts'].items():
+                    st.write(f"• {table.replace('_', ' ').title()}: {count:,}")
         
         with tab2:
             st.subheader("Snowflake Cortex Use Cases")
@@ -739,6 +824,9 @@ def main():
             
             for resource in resources:
                 st.write(resource)
+    
+    # The page is drawn; load the generators while the user reads it
+    warm_imports()
 
 
 if __name__ == "__main__":
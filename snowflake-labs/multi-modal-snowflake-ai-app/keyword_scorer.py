@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Keyword Scorer
+==============
+Single-pass industry keyword scoring for website analysis.
+
+Instead of scanning the page once per keyword, the visible text is split
+into words in a single pass (str.translate + split, both in C) and every
+word is looked up in a compiled table of keyword forms (keyword, keyword+s,
+keyword+es). Only whole words match, so "tech" no longer fires inside
+"technique". Scripts, styles, comments and markup are stripped first, so
+only visible text is scored.
+
+Counting every word is the expensive part on large pages, so only the
+first MAX_SCORED_CHARS characters of visible text are scored; a site names
+its industry long before that.
+"""
+
+import html
+import re
+from collections import Counter
+from typing import Dict, List
+
+# Bump when matching rules change so cached scores are recomputed
+SCORER_VERSION = 2
+# Visible text scored per page (about 40,000 words)
+MAX_SCORED_CHARS = 256 * 1024
+
+_INVISIBLE_BLOCKS = re.compile(r'<(script|style|noscript|template|svg)\b.*?</\1\s*>|<!--.*?-->', re.I | re.S)
+_TAGS = re.compile(r'<[^>]*>')
+
+
+def visible_text(page: str) -> str:
+    """Reduce an HTML page to the text a visitor would see"""
+    text = _INVISIBLE_BLOCKS.sub(' ', page)
+    text = _TAGS.sub(' ', text)
+    return html.unescape(text)
+
+
+def _word_separator_table() -> Dict[int, str]:
+    """str.translate table mapping every non-word character (Latin range and general punctuation) to a space"""
+    return {
+        code: ' ' for code in range(0x2070)
+        if not (chr(code).isalnum() or chr(code) == '_')
+    }
+
+
+class KeywordScorer:
+    """Scores every industry in one pass over a page's visible text"""
+
+    def __init__(self, industry_keywords: Dict[str, List[str]]):
+        self.industry_keywords = {
+            industry: [keyword.lower() for keyword in keywords]
+            for industry, keywords in industry_keywords.items()
+        }
+
+        # Every accepted spelling of a keyword points back to the keyword
+        self.keyword_forms = {}
+        for keywords in self.industry_keywords.values():
+            for keyword in keywords:
+                for form in (keyword + 'es', keyword + 's', keyword):
+                    self.keyword_forms[form] = keyword
+        self.separators = _word_separator_table()
+
+    def keyword_hits(self, page: str, is_html: bool = True) -> Dict[str, int]:
+        """How many times each keyword occurs as a word in the page's first MAX_SCORED_CHARS of visible text"""
+        text = (visible_text(page) if is_html else page)[:MAX_SCORED_CHARS]
+        word_counts = Counter(text.lower().translate(self.separators).split())
+
+        hits = Counter()
+        for form, keyword in self.keyword_forms.items():
+            count = word_counts.get(form)
+            if count:
+                hits[keyword] += count
+        return dict(hits)
+
+    def score(self, page: str, is_html: bool = True) -> Dict[str, Dict[str, int]]:
+        """Industry scores (distinct keywords found) and per-keyword hit counts"""
+        hits = self.keyword_hits(page, is_html)
+
+        return {
+            'industry_scores': {
+                industry: sum(1 for keyword in keywords if keyword in hits)
+                for industry, keywords in self.industry_keywords.items()
+            },
+            'keyword_hits': hits
+        }
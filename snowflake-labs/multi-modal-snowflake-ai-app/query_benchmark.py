@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Verified Query Benchmark
+========================
+Runs the semantic model's verified queries against the generated sample data
+in a local engine, so slow queries are found before a customer runs them.
+
+DuckDB is used when installed (closest to Snowflake: columnar, hash joins,
+no indexes); otherwise the standard library's SQLite stands in. The Snowflake
+SQL is translated for the local engine and CURRENT_DATE() is pinned to the
+demo's reference date, so date filters select the same rows as in Snowflake.
+
+Every query is run at several scale factors and reported with its latency,
+the rows it scans and its plan shape. A query whose latency grows faster
+than the data (log-log slope above SUPERLINEAR_EXPONENT) is flagged.
+"""
+
+import math
+import re
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Latency growth exponent (vs. scale factor) above which a query is flagged.
+# Sort-based GROUP BY / COUNT(DISTINCT) plus cache effects measure about
+# 1.1-1.25 here; a nested-loop join or correlated scan measures close to 2.
+SUPERLINEAR_EXPONENT = 1.5
+# Below this latency at the largest scale factor timings are mostly noise
+MIN_FLAG_MS = 1.0
+
+_INTERVAL_UNITS = {'DAY': ('days', 1), 'WEEK': ('days', 7), 'MONTH': ('months', 1),
+                   'QUARTER': ('months', 3), 'YEAR': ('years', 1)}
+_DATEADD = re.compile(r"DATEADD\(\s*'(\w+)'\s*,\s*(-?\d+)\s*,\s*([^()]+?)\s*\)", re.I)
+_DATE_TRUNC = re.compile(r"DATE_TRUNC\(\s*'(\w+)'\s*,\s*([^()]+?)\s*\)", re.I)
+_CURRENT_DATE = re.compile(r"CURRENT_DATE(\(\))?", re.I)
+_TABLE_REFERENCE = re.compile(
+    r"\b(?:FROM|JOIN)\s+([A-Za-z_]\w*)(?:\s+(?:AS\s+)?(?!(?:WHERE|JOIN|ON|GROUP|ORDER|LEFT|RIGHT|INNER|FULL|CROSS|LIMIT)\b)([A-Za-z_]\w*))?",
+    re.I
+)
+
+
+# =====================================================
+# ENGINES
+# =====================================================
+
+def connect(engine: str = 'auto') -> Tuple[str, Any]:
+    """Open an in-memory database: 'duckdb', 'sqlite' or 'auto' (DuckDB when installed)"""
+    if engine in ('auto', 'duckdb'):
+        try:
+            import duckdb
+            return 'duckdb', duckdb.connect()
+        except ImportError:
+            if engine == 'duckdb':
+                raise ImportError("The DuckDB engine requires duckdb: pip install duckdb")
+    return 'sqlite', sqlite3.connect(':memory:')
+
+
+def _sqlite_type(values: np.ndarray) -> str:
+    kind = values.dtype.kind
+    if kind in 'biu':
+        return 'INTEGER'
+    if kind == 'f':
+        return 'REAL'
+    return 'TEXT'
+
+
+def _sqlite_values(values: np.ndarray) -> List[Any]:
+    """Column values as Python objects SQLite accepts (timestamps as ISO text)"""
+    if values.dtype.kind == 'M':
+        text = np.datetime_as_string(values, unit='s')
+        return [None if value == 'NaT' else value.replace('T', ' ') for value in text.tolist()]
+    return values.tolist()
+
+
+def load_tables(engine: str, connection: Any, tables: Iterable[Tuple[str, Iterable[Dict[str, np.ndarray]]]]) -> Dict[str, int]:
+    """Load (table name, column chunks) pairs and return the row count of each table"""
+    row_counts = {}
+    for table_name, column_chunks in tables:
+        table = table_name.lower()
+        row_counts[table] = 0
+        for part, columns in enumerate(column_chunks):
+            if engine == 'duckdb':
+                import pyarrow as pa
+                connection.register('chunk', pa.table(
+                    {name: pa.array(values, from_pandas=True) for name, values in columns.items()}
+                ))
+                if part == 0:
+                    connection.execute(f"CREATE TABLE {table} AS SELECT * FROM chunk")
+                else:
+                    connection.execute(f"INSERT INTO {table} SELECT * FROM chunk")
+                connection.unregister('chunk')
+            else:
+                if part == 0:
+                    definitions = ', '.join(f"{name} {_sqlite_type(values)}" for name, values in columns.items())
+                    connection.execute(f"CREATE TABLE {table} ({definitions})")
+                placeholders = ', '.join('?' * len(columns))
+                connection.executemany(
+                    f"INSERT INTO {table} VALUES ({placeholders})",
+                    zip(*(_sqlite_values(values) for values in columns.values()))
+                )
+            row_counts[table] += len(next(iter(columns.values())))
+
+    if engine == 'sqlite':
+        connection.commit()
+        connection.execute('ANALYZE')
+    return row_counts
+
+
+# =====================================================
+# SQL TRANSLATION
+# =====================================================
+
+def translate_sql(sql: str, engine: str, reference_date: datetime) -> str:
+    """Rewrite the Snowflake date functions used by verified queries for the local engine"""
+    today = reference_date.strftime('%Y-%m-%d')
+
+    if engine == 'duckdb':
+        sql = _CURRENT_DATE.sub(f"DATE '{today}'", sql)
+
+        def dateadd(match):
+            unit, amount = _INTERVAL_UNITS[match.group(1).upper()]
+            return f"({match.group(3)} + INTERVAL '{int(match.group(2)) * amount} {unit}')"
+
+        return _DATEADD.sub(dateadd, sql)
+
+    sql = _CURRENT_DATE.sub(f"'{today}'", sql)
+
+    def dateadd(match):
+        unit, amount = _INTERVAL_UNITS[match.group(1).upper()]
+        return f"date({match.group(3)}, '{int(match.group(2)) * amount:+d} {unit}')"
+
+    def date_trunc(match):
+        part, value = match.group(1).upper(), match.group(2)
+        if part == 'YEAR':
+            return f"strftime('%Y-01-01', {value})"
+        if part == 'QUARTER':
+            return (f"printf('%s-%02d-01', strftime('%Y', {value}), "
+                    f"((CAST(strftime('%m', {value}) AS INTEGER) - 1) / 3) * 3 + 1)")
+        if part == 'MONTH':
+            return f"strftime('%Y-%m-01', {value})"
+        return f"date({value})"
+
+    return _DATE_TRUNC.sub(date_trunc, _DATEADD.sub(dateadd, sql))
+
+
+# =====================================================
+# PLANS
+# =====================================================
+
+def _table_aliases(sql: str) -> Dict[str, str]:
+    """Map every table name and alias referenced in a query to its table"""
+    aliases = {}
+    for table, alias in _TABLE_REFERENCE.findall(sql):
+        aliases[table.lower()] = table.lower()
+        if alias:
+            aliases[alias.lower()] = table.lower()
+    return aliases
+
+
+def explain(engine: str, connection: Any, sql: str, row_counts: Dict[str, int]) -> Tuple[str, int]:
+    """Plan shape of a query and the rows it reads from base tables
+
+    Rows scanned is estimated from the plan: a table read without an index
+    costs all of its rows. DuckDB has no indexes, so every referenced table
+    is scanned in full.
+    """
+    if engine == 'duckdb':
+        plan_text = '\n'.join(row[-1] for row in connection.execute(f"EXPLAIN {sql}").fetchall())
+        operators = re.findall(r'│\s*([A-Z][A-Z_]{2,})\s*│', plan_text)
+        shape = ' > '.join(dict.fromkeys(operators))
+        tables = set(_table_aliases(sql).values())
+        return shape, sum(row_counts.get(table, 0) for table in tables)
+
+    aliases = _table_aliases(sql)
+    steps = [row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()]
+    scanned = 0
+    for step in steps:
+        match = re.match(r'(SCAN|SEARCH) (?:TABLE )?(\w+)', step)
+        # A full scan reads the whole table, and so does building an automatic index
+        if match and (match.group(1) == 'SCAN' or 'AUTOMATIC' in step):
+            scanned += row_counts.get(aliases.get(match.group(2).lower(), match.group(2).lower()), 0)
+    return '; '.join(steps), scanned
+
+
+def _best_latency(connection: Any, sql: str, repeat: int) -> Tuple[float, int]:
+    """Best wall-clock time in milliseconds and the number of result rows"""
+    best = float('inf')
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(connection.execute(sql).fetchall())
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, rows
+
+
+def growth_exponent(points: List[Tuple[float, float]]) -> Optional[float]:
+    """Least-squares log-log slope of latency against scale factor"""
+    points = [(math.log(sf), math.log(ms)) for sf, ms in points if sf > 0 and ms > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+# =====================================================
+# HARNESS
+# =====================================================
+
+def benchmark_verified_queries(industry: str = 'retail', scale_factors: List[float] = (1, 4, 16),
+                               engine: str = 'auto', repeat: int = 5,
+                               queries: Optional[List[Dict[str, Any]]] = None,
+                               reference_date: str = '2025-01-01') -> Dict[str, Any]:
+    """Run every verified query at every scale factor and flag super-linear ones
+
+    queries defaults to the verified queries the semantic model generator
+    produces for the industry; pass a loaded model's verified_queries to
+    benchmark a generated YAML file instead.
+    """
+    from demo_generator import DemoGenerator
+    from semantic_model_generator import SemanticModelGenerator
+    from sql_generator import SQLGenerator
+
+    demo_generator = DemoGenerator()
+    results = {}
+    engine_name = None
+
+    for scale_factor in sorted(scale_factors):
+        client_info = {
+            'name': 'Benchmark Co',
+            'website_info': {'industry': industry},
+            'scale_factor': scale_factor,
+            'reference_date': reference_date
+        }
+        demo_context = demo_generator.build_demo_context(client_info)
+        if queries is None:
+            model_generator = SemanticModelGenerator()
+            model_generator.reference_date = demo_context['reference_date']
+            queries = model_generator._build_verified_queries(
+                demo_context['company_name'], demo_context['template'], demo_context['sample_data']
+            )
+
+        engine_name, connection = connect(engine)
+        row_counts = load_tables(engine_name, connection, SQLGenerator().iter_table_columns(demo_context))
+
+        for query in queries:
+            result = results.setdefault(query['name'], {'name': query['name'], 'runs': []})
+            run = {'scale_factor': scale_factor, 'transactions': row_counts.get('transactions', 0)}
+            try:
+                sql = translate_sql(query['sql'], engine_name, demo_context['reference_date'])
+                run['plan'], run['rows_scanned'] = explain(engine_name, connection, sql, row_counts)
+                run['latency_ms'], run['result_rows'] = _best_latency(connection, sql, repeat)
+            except Exception as e:
+                run['error'] = f"{type(e).__name__}: {e}"
+            result['runs'].append(run)
+
+        connection.close()
+
+    for result in results.values():
+        timed = [(run['scale_factor'], run['latency_ms']) for run in result['runs'] if 'latency_ms' in run]
+        result['exponent'] = growth_exponent(timed)
+        result['superlinear'] = bool(
+            result['exponent'] is not None and result['exponent'] > SUPERLINEAR_EXPONENT
+            and timed[-1][1] >= MIN_FLAG_MS
+        )
+
+    return {
+        'engine': engine_name,
+        'industry': industry,
+        'scale_factors': sorted(scale_factors),
+        'queries': list(results.values())
+    }
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Sample Data Engine
+==================
+Columnar sample data generation for the Snowflake demo tables.
+
+Every table is drawn as a dictionary of NumPy arrays (one array per column)
+instead of row by row, so the same code path scales from a few thousand
+rows to millions of transactions. Rows are then formatted in bulk as SQL
+literals by the helpers at the bottom of this module.
+"""
+
+import numpy as np
+import csv
+import gzip
+import io
+import os
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+
+REGIONS = ['CDMX', 'Guadalajara', 'Monterrey', 'Puebla', 'Tijuana', 'León', 'Querétaro', 'Mérida']
+
+FIRST_NAMES = ['Juan', 'María', 'Carlos', 'Ana', 'Luis', 'Carmen', 'Jorge', 'Patricia', 'Miguel', 'Rosa',
+               'Fernando', 'Guadalupe', 'Rafael', 'Isabel', 'Antonio', 'Margarita', 'José', 'Leticia']
+
+LAST_NAMES = ['García', 'Rodríguez', 'Martínez', 'González', 'López', 'Hernández', 'Pérez', 'Sánchez',
+              'Ramírez', 'Torres', 'Flores', 'Rivera', 'Gómez', 'Díaz', 'Cruz', 'Morales', 'Jiménez']
+
+CHANNELS = ['Online', 'Store', 'Mobile App', 'Call Center', 'Partner']
+PAYMENT_METHODS = ['Credit Card', 'Debit Card', 'PayPal', 'Bank Transfer', 'Cash']
+
+PERFORMANCE_METRICS = [
+    ('Revenue', 'currency', 'MXN'),
+    ('Transactions', 'count', 'units'),
+    ('Customer Satisfaction', 'rating', 'score'),
+    ('Market Share', 'percentage', 'percent'),
+    ('Growth Rate', 'percentage', 'percent')
+]
+PERFORMANCE_REGIONS = ['CDMX', 'Guadalajara', 'Monterrey', 'Puebla', 'National']
+
+SUPPORT_SUBJECTS = [
+    'Product inquiry and specifications',
+    'Order status and delivery questions',
+    'Technical support request',
+    'Billing and payment issues',
+    'Return and refund request',
+    'Account access problems',
+    'Product quality concerns',
+    'Feature request and suggestions',
+    'General customer service inquiry'
+]
+SUPPORT_CATEGORIES = ['Technical', 'Billing', 'Sales', 'General', 'Returns', 'Account']
+SUPPORT_PRIORITIES = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+SUPPORT_STATUSES = ['OPEN', 'IN_PROGRESS', 'RESOLVED', 'CLOSED']
+SUPPORT_AGENTS = ['Agent001', 'Agent002', 'Agent003', 'Agent004', 'Agent005']
+
+SECONDS_PER_DAY = 86400
+
+# Large tables are drawn and written this many rows at a time so memory stays
+# flat regardless of the scale factor
+CHUNK_ROWS = 100_000
+
+
+class SampleDataEngine:
+    """Generates demo tables column by column with NumPy"""
+
+    def __init__(self, seed: Optional[int] = None, reference_date: Optional[datetime] = None):
+        self.rng = np.random.default_rng(seed)
+        self.reference_date = reference_date or datetime.now()
+
+    def customers(self, num_customers: int, num_segments: int, start: int = 1) -> Dict[str, np.ndarray]:
+        """Draw the CUSTOMERS table (or the chunk of it whose ids begin at start)"""
+        rng = self.rng
+
+        first = np.array(FIRST_NAMES)[rng.integers(0, len(FIRST_NAMES), num_customers)]
+        last = np.array(LAST_NAMES)[rng.integers(0, len(LAST_NAMES), num_customers)]
+        names = np.char.add(np.char.add(first, ' '), last)
+        emails = np.char.add(np.char.replace(np.char.lower(names), ' ', '.'), '@email.com')
+        phones = np.char.add(
+            np.char.add('+52 55 ', rng.integers(1000, 10000, num_customers).astype(str)),
+            np.char.add(' ', rng.integers(1000, 10000, num_customers).astype(str))
+        )
+
+        # Registration in the last 3 years, last purchase somewhere after it
+        today = self._today()
+        days_ago = rng.integers(1, 1096, num_customers)
+        registration = today - days_ago
+        last_purchase = registration + rng.integers(1, days_ago + 1)
+
+        return {
+            'CUSTOMER_ID': _prefixed_ids('CUST', start, num_customers, 6),
+            'CUSTOMER_NAME': names,
+            'EMAIL': emails,
+            'PHONE': phones,
+            'SEGMENT_ID': _prefixed_ids('SEG', rng.integers(1, num_segments + 1, num_customers), None, 3),
+            'REGISTRATION_DATE': registration,
+            'LAST_PURCHASE_DATE': last_purchase,
+            'TOTAL_PURCHASES': np.round(rng.uniform(100, 10000, num_customers), 2),
+            'IS_ACTIVE': np.ones(num_customers, dtype=bool),
+            'REGION': np.array(REGIONS)[rng.integers(0, len(REGIONS), num_customers)],
+            'COUNTRY': np.full(num_customers, 'Mexico')
+        }
+
+    def transactions(self, num_transactions: int, num_customers: int, num_products: int,
+                     transaction_patterns: Optional[Dict[str, List[float]]] = None,
+                     days: int = 540, start: int = 1) -> Dict[str, np.ndarray]:
+        """Draw the TRANSACTIONS table (or a chunk of it), shaped by daily and seasonal patterns"""
+        rng = self.rng
+        n = num_transactions
+
+        # Pick a day for every transaction, weighting each calendar day by its
+        # weekday volume and its month's seasonal multiplier
+        day_grid = self._today() - np.arange(days, 0, -1)
+        weights = _day_weights(day_grid, transaction_patterns)
+        day_index = rng.choice(len(day_grid), size=n, p=weights)
+        seconds = rng.integers(0, SECONDS_PER_DAY, n).astype('timedelta64[s]')
+        transaction_dates = day_grid[day_index].astype('datetime64[s]') + seconds
+
+        quantity = rng.integers(1, 6, n)
+        unit_price = np.round(rng.uniform(50, 1000, n), 2)
+        total_amount = np.round(quantity * unit_price, 2)
+        discounted = rng.random(n) < 0.3
+        discount = np.where(discounted, np.round(rng.uniform(0, 1, n) * total_amount * 0.2, 2), 0.0)
+        final_amount = np.round(total_amount - discount, 2)
+
+        status = np.where(
+            rng.random(n) < 0.95,
+            'COMPLETED',
+            np.array(['PENDING', 'CANCELLED'])[rng.integers(0, 2, n)]
+        )
+
+        return {
+            'TRANSACTION_ID': _prefixed_ids('TXN', start, n, 8),
+            'CUSTOMER_ID': _prefixed_ids('CUST', rng.integers(1, num_customers + 1, n), None, 6),
+            'PRODUCT_ID': _prefixed_ids('PROD', rng.integers(1, num_products + 1, n), None, 4),
+            'TRANSACTION_DATE': transaction_dates,
+            'QUANTITY': quantity,
+            'UNIT_PRICE': unit_price,
+            'TOTAL_AMOUNT': total_amount,
+            'DISCOUNT_AMOUNT': discount,
+            'FINAL_AMOUNT': final_amount,
+            'PAYMENT_METHOD': np.array(PAYMENT_METHODS)[rng.integers(0, len(PAYMENT_METHODS), n)],
+            'STATUS': status,
+            'CHANNEL': np.array(CHANNELS)[rng.integers(0, len(CHANNELS), n)],
+            'REGION': np.array(REGIONS)[rng.integers(0, len(REGIONS), n)]
+        }
+
+    def performance_metrics(self, categories: List[str], months: int = 24) -> Dict[str, np.ndarray]:
+        """Draw the PERFORMANCE_METRICS table (month x metric x region x category)"""
+        rng = self.rng
+
+        month_idx, metric_idx, region_idx, category_idx = (
+            grid.ravel() for grid in np.meshgrid(
+                np.arange(months), np.arange(len(PERFORMANCE_METRICS)),
+                np.arange(len(PERFORMANCE_REGIONS)), np.arange(len(categories)),
+                indexing='ij'
+            )
+        )
+        n = len(month_idx)
+
+        metric_names = np.array([m[0] for m in PERFORMANCE_METRICS])[metric_idx]
+        metric_types = np.array([m[1] for m in PERFORMANCE_METRICS])[metric_idx]
+        units = np.array([m[2] for m in PERFORMANCE_METRICS])[metric_idx]
+
+        # Realistic values per metric type
+        spread = rng.uniform(0.9, 1.1, n)
+        currency = np.round(rng.uniform(50000, 500000, n), 2)
+        count = rng.integers(100, 2001, n).astype(float)
+        rating = np.round(rng.uniform(3.5, 5.0, n), 1)
+        percentage = np.round(rng.uniform(0, 100, n), 1)
+
+        value = np.select(
+            [metric_types == 'currency', metric_types == 'count', metric_types == 'rating'],
+            [currency, count, rating],
+            percentage
+        )
+        target = np.select(
+            [metric_types == 'currency', metric_types == 'count', metric_types == 'rating'],
+            [np.round(currency * spread, 2), np.floor(count * spread), np.full(n, 4.5)],
+            np.round(percentage * spread, 1)
+        )
+
+        start = self._today() - 730
+        metric_dates = start + month_idx * 30
+
+        return {
+            'METRIC_ID': _prefixed_ids('MET', 1, n, 6),
+            'METRIC_DATE': metric_dates,
+            'METRIC_NAME': metric_names,
+            'METRIC_VALUE': value,
+            'METRIC_TARGET': target,
+            'CATEGORY': np.char.add(np.char.add(np.array(categories)[category_idx], ' - '), metric_names),
+            'REGION': np.array(PERFORMANCE_REGIONS)[region_idx],
+            'MEASUREMENT_UNIT': units
+        }
+
+    def support_tickets(self, num_tickets: int, num_customers: int, days: int = 180,
+                        start: int = 1) -> Dict[str, np.ndarray]:
+        """Draw the SUPPORT_TICKETS table (or a chunk of it)"""
+        rng = self.rng
+        n = num_tickets
+
+        subjects = np.array(SUPPORT_SUBJECTS)[rng.integers(0, len(SUPPORT_SUBJECTS), n)]
+        descriptions = np.char.add(
+            np.char.add('Customer inquiry regarding ', np.char.lower(subjects)),
+            '. Detailed description of the issue and customer requirements.'
+        )
+        categories = np.array(SUPPORT_CATEGORIES)[rng.integers(0, len(SUPPORT_CATEGORIES), n)]
+        statuses = np.array(SUPPORT_STATUSES)[rng.integers(0, len(SUPPORT_STATUSES), n)]
+
+        created = (self._today() - days + rng.integers(0, days + 1, n)).astype('datetime64[s]')
+        created = created + rng.integers(0, SECONDS_PER_DAY, n).astype('timedelta64[s]')
+
+        # Resolved/closed tickets get a resolution date and, usually, a rating
+        resolved = np.isin(statuses, ['RESOLVED', 'CLOSED'])
+        resolve_delta = rng.integers(1, 8, n).astype('timedelta64[D]')
+        resolved_date = np.where(resolved, created + resolve_delta, np.datetime64('NaT', 's'))
+        rated = resolved & (rng.random(n) < 0.8)
+        satisfaction = np.where(rated, np.round(rng.uniform(3.0, 5.0, n), 1), np.nan)
+        feedback = np.where(
+            rated,
+            np.char.add(np.char.add('Customer feedback for ticket regarding ', np.char.lower(categories)), ' issue'),
+            None
+        )
+
+        return {
+            'TICKET_ID': _prefixed_ids('TICK', start, n, 6),
+            'CUSTOMER_ID': _prefixed_ids('CUST', rng.integers(1, num_customers + 1, n), None, 6),
+            'SUBJECT': subjects,
+            'DESCRIPTION': descriptions,
+            'PRIORITY': np.array(SUPPORT_PRIORITIES)[rng.integers(0, len(SUPPORT_PRIORITIES), n)],
+            'STATUS': statuses,
+            'CATEGORY': categories,
+            'ASSIGNED_TO': np.array(SUPPORT_AGENTS)[rng.integers(0, len(SUPPORT_AGENTS), n)],
+            'CREATED_DATE': created,
+            'RESOLVED_DATE': resolved_date,
+            'SATISFACTION_RATING': satisfaction,
+            'FEEDBACK_TEXT': feedback
+        }
+
+    def _today(self) -> np.datetime64:
+        """Reference date as a day-resolution NumPy datetime"""
+        return np.datetime64(self.reference_date.date(), 'D')
+
+
+def iter_chunks(total_rows: int, chunk_rows: int = CHUNK_ROWS):
+    """Yield (start, count) pairs covering 1..total_rows"""
+    for offset in range(0, total_rows, chunk_rows):
+        yield offset + 1, min(chunk_rows, total_rows - offset)
+
+
+def _day_weights(day_grid: np.ndarray, transaction_patterns: Optional[Dict[str, List[float]]]) -> np.ndarray:
+    """Probability of each calendar day from weekday volumes and monthly seasonality"""
+    if not transaction_patterns:
+        return np.full(len(day_grid), 1.0 / len(day_grid))
+
+    # 1970-01-01 was a Thursday, so shift by 3 to make Monday == 0
+    weekday = (day_grid.astype('int64') + 3) % 7
+    month = day_grid.astype('datetime64[M]').astype('int64') % 12
+
+    daily = np.asarray(transaction_patterns['daily_transactions'], dtype=float)
+    seasonal = np.asarray(transaction_patterns['seasonal_multiplier'], dtype=float)
+    weights = daily[weekday] * seasonal[month]
+    return weights / weights.sum()
+
+
+def _prefixed_ids(prefix: str, start, count: Optional[int], width: int) -> np.ndarray:
+    """Build ids such as CUST000001 for a range (start, count) or an array of numbers (start)"""
+    numbers = np.arange(start, start + count) if count is not None else np.asarray(start)
+    return np.char.add(prefix, np.char.zfill(numbers.astype(str), width))
+
+
+# =====================================================
+# BULK SQL FORMATTING
+# =====================================================
+
+def to_sql_literals(values: np.ndarray) -> List[str]:
+    """Format a whole column as SQL literals, choosing the literal style from the dtype"""
+    kind = values.dtype.kind
+
+    if kind == 'M':
+        return _datetime_literals(values)
+    
+    if kind == 'b':
+        return np.where(values, 'TRUE', 'FALSE').tolist()
+
+    if kind in 'iu':
+        return list(map(str, values.tolist()))
+
+    if kind == 'f':
+        # repr() on Python floats is the fastest shortest-round-trip formatter
+        literals = list(map(repr, values.tolist()))
+        for i in np.flatnonzero(np.isnan(values)).tolist():
+            literals[i] = 'NULL'
+        return literals
+
+    if kind == 'U':
+        quoted = np.char.add(np.char.add("'", np.char.replace(values, "'", "''")), "'")
+        return quoted.tolist()
+
+    # Object arrays may carry None for NULL
+    return ['NULL' if v is None else "'" + str(v).replace("'", "''") + "'" for v in values.tolist()]
+
+
+def _datetime_literals(values: np.ndarray, quote: str = "'", null: str = 'NULL') -> List[str]:
+    """Format dates/timestamps by formatting each distinct day and time of day only once"""
+    missing = np.isnat(values)
+    days = values.astype('datetime64[D]')
+    if missing.all():
+        return [null] * len(values)
+    first_day = days[~missing].min()
+    day_offsets = np.where(missing, 0, (days - first_day).astype(np.int64))
+    day_text = np.datetime_as_string(np.arange(first_day, days[~missing].max() + 1)).tolist()
+    
+    if np.datetime_data(values.dtype)[0] == 'D':
+        day_literals = [quote + day + quote for day in day_text]
+        literals = [day_literals[i] for i in day_offsets.tolist()]
+    else:
+        day_literals = [quote + day + ' ' for day in day_text]
+        seconds = np.where(missing, 0, (values - days).astype('timedelta64[s]').astype(np.int64))
+        time_literals = ['%02d:%02d:%02d%s' % (s // 3600, s // 60 % 60, s % 60, quote) for s in range(SECONDS_PER_DAY)]
+        literals = [day_literals[d] + time_literals[t] for d, t in zip(day_offsets.tolist(), seconds.tolist())]
+    
+    for i in np.flatnonzero(missing).tolist():
+        literals[i] = null
+    return literals
+
+
+def format_value_rows(columns: Dict[str, np.ndarray]) -> List[str]:
+    """Format column arrays into '(v1, v2, ...)' VALUES rows"""
+    literals = [to_sql_literals(values) for values in columns.values()]
+    return ['(' + row + ')' for row in map(', '.join, zip(*literals))]
+
+
+# =====================================================
+# BULK FILE OUTPUT
+# =====================================================
+
+def to_csv_values(values: np.ndarray) -> List[str]:
+    """Format a whole column as CSV fields; NULLs become empty fields"""
+    kind = values.dtype.kind
+
+    if kind == 'M':
+        return _datetime_literals(values, quote='', null='')
+
+    if kind == 'b':
+        return np.where(values, 'TRUE', 'FALSE').tolist()
+
+    if kind == 'f':
+        fields = list(map(repr, values.tolist()))
+        for i in np.flatnonzero(np.isnan(values)).tolist():
+            fields[i] = ''
+        return fields
+
+    if kind == 'O':
+        return ['' if v is None else str(v) for v in values.tolist()]
+
+    return values.astype(str).tolist()
+
+
+def write_csv_files(directory: str, column_chunks: Iterable[Dict[str, np.ndarray]]) -> List[str]:
+    """Write each chunk of a table as a gzip-compressed CSV part (with a header row) and return the file paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+
+    for part, columns in enumerate(column_chunks):
+        fields = [to_csv_values(values) for values in columns.values()]
+        path = os.path.join(directory, f"part_{part:05d}.csv.gz")
+        # A zero mtime and no embedded file name keep identical data byte-for-byte identical
+        with open(path, 'wb') as raw, gzip.GzipFile(filename='', mode='wb', compresslevel=6, fileobj=raw, mtime=0) as gz, \
+                io.TextIOWrapper(gz, encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*fields))
+        paths.append(path)
+
+    return paths
+
+
+def write_parquet_files(directory: str, column_chunks: Iterable[Dict[str, np.ndarray]]) -> List[str]:
+    """Write each chunk of a table as a Snappy-compressed Parquet part and return the file paths"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+
+    for part, columns in enumerate(column_chunks):
+        table = pa.table({name: pa.array(values, from_pandas=True) for name, values in columns.items()})
+        path = os.path.join(directory, f"part_{part:05d}.parquet")
+        pq.write_table(table, path, compression='snappy')
+        paths.append(path)
+
+    return paths
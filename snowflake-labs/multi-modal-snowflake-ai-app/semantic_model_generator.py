@@ -11,36 +11,101 @@ This module creates semantic models that define:
 """
 
 import os
-import yaml
 from typing import Dict, Any, List
 from datetime import datetime
 
+from semantic_model_index import SchemaIndex, dump_yaml, validate_model
+
+# Part of every build cache key; bump when the generated output changes
+GENERATOR_VERSION = 2
+
+# Analytical views exposed as logical tables once they are precomputed
+# (dynamic table or materialized view): view -> (name, description, columns, time dimension)
+AGGREGATE_TABLES = {
+    'V_MONTHLY_PERFORMANCE': ('monthly_performance', 'Precomputed monthly transaction totals', [
+        ('month', 'date', 'Month'),
+        ('total_transactions', 'number', 'Completed transactions in the month'),
+        ('unique_customers', 'number', 'Distinct customers in the month'),
+        ('total_revenue', 'number', 'Revenue from completed transactions'),
+        ('avg_transaction_value', 'number', 'Average transaction value'),
+        ('total_quantity', 'number', 'Units sold'),
+        ('products_sold', 'number', 'Distinct products sold')
+    ], 'month'),
+    'V_CATEGORY_PERFORMANCE': ('category_performance', 'Precomputed all-time totals per category', [
+        ('category_id', 'varchar', 'Category identifier'),
+        ('category_name', 'varchar', 'Category name'),
+        ('total_products', 'number', 'Products in the category'),
+        ('total_transactions', 'number', 'Completed transactions'),
+        ('total_revenue', 'number', 'Revenue from completed transactions'),
+        ('avg_transaction_value', 'number', 'Average transaction value'),
+        ('total_quantity', 'number', 'Units sold')
+    ], None),
+    'V_CUSTOMER_SEGMENT_ANALYSIS': ('customer_segment_analysis', 'Precomputed all-time totals per customer segment', [
+        ('segment_id', 'varchar', 'Segment identifier'),
+        ('segment_name', 'varchar', 'Segment name'),
+        ('total_customers', 'number', 'Customers in the segment'),
+        ('total_transactions', 'number', 'Completed transactions'),
+        ('total_revenue', 'number', 'Revenue from completed transactions'),
+        ('avg_transaction_value', 'number', 'Average transaction value'),
+        ('revenue_per_customer', 'number', 'Revenue per customer'),
+        ('activity_rate_90d', 'number', 'Share of transactions in the last 90 days')
+    ], None),
+    'V_SUPPORT_SUMMARY': ('support_summary', 'Precomputed monthly support ticket totals', [
+        ('month', 'date', 'Month the tickets were created'),
+        ('priority', 'varchar', 'Ticket priority'),
+        ('status', 'varchar', 'Ticket status'),
+        ('ticket_count', 'number', 'Tickets created'),
+        ('avg_satisfaction', 'number', 'Average satisfaction rating'),
+        ('avg_resolution_hours', 'number', 'Average hours to resolution')
+    ], 'month'),
+    'V_PRODUCT_METRICS': ('product_metrics', 'Precomputed monthly totals per product', [
+        ('product_id', 'varchar', 'Product identifier'),
+        ('product_name', 'varchar', 'Product name'),
+        ('category_name', 'varchar', 'Category name'),
+        ('month', 'date', 'Month'),
+        ('total_transactions', 'number', 'Completed transactions'),
+        ('total_revenue', 'number', 'Revenue from completed transactions'),
+        ('total_quantity', 'number', 'Units sold'),
+        ('avg_transaction_value', 'number', 'Average transaction value'),
+        ('unique_customers', 'number', 'Distinct customers')
+    ], 'month')
+}
+
+
 class SemanticModelGenerator:
     """Generates semantic models for Cortex Analyst"""
     
     def __init__(self):
         self.base_metrics = self._define_base_metrics()
         self.base_dimensions = self._define_base_dimensions()
+        self.reference_date = datetime.now()
+        self.schema_index = None
+        self.aggregate_objects: Dict[str, str] = {}
     
-    def generate_semantic_model(self, client_info: Dict[str, Any], output_dir: str = "output") -> str:
+    def generate_semantic_model(self, client_info: Dict[str, Any], output_dir: str = "output",
+                                demo_context: Dict[str, Any] = None) -> str:
         """Generate a complete semantic model for the client"""
         
-        company_name = client_info['name']
-        website_info = client_info['website_info']
-        industry = website_info['industry']
+        # Resolve industry template, sample data and database name
+        if demo_context is None:
+            from demo_generator import DemoGenerator
+            demo_context = DemoGenerator().build_demo_context(client_info)
+        
+        company_name = demo_context['company_name']
+        template = demo_context['template']
+        sample_data = demo_context['sample_data']
+        db_name = demo_context['db_name']
+        self.reference_date = demo_context['reference_date']
         
-        # Import industry template
-        from demo_generator import DemoGenerator
-        generator = DemoGenerator()
-        template = generator.industry_templates[industry]
-        sample_data = generator.generate_sample_data(industry, company_name)
+        # Point the model at precomputed aggregates when the views script creates them
+        self.aggregate_objects = {}
+        if demo_context['aggregate_mode'] != 'view':
+            from sql_generator import SQLGenerator
+            self.aggregate_objects = SQLGenerator().aggregate_objects(demo_context)
         
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Generate database name
-        db_name = generator.generate_database_name(company_name)
-        
         # Build semantic model
         semantic_model = self._build_semantic_model(
             company_name, db_name, template, sample_data
@@ -51,7 +116,7 @@ class SemanticModelGenerator:
         filepath = os.path.join(output_dir, filename)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(semantic_model, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            dump_yaml(semantic_model, f)
         
         return filepath
     
@@ -60,6 +125,7 @@ class SemanticModelGenerator:
         
         # Build logical tables
         logical_tables = self._build_logical_tables(db_name, template, sample_data)
+        logical_tables.extend(self._build_aggregate_tables())
         
         # Build metrics
         metrics = self._build_metrics(template, sample_data)
@@ -82,6 +148,12 @@ class SemanticModelGenerator:
             }
         }
         
+        # Every metric, relationship and verified query must resolve to a real column
+        self.schema_index = SchemaIndex.from_model(semantic_model)
+        problems = validate_model(semantic_model, self.schema_index)
+        if problems:
+            raise ValueError("Semantic model has unresolved references:\n  " + "\n  ".join(problems))
+        
         return semantic_model
     
     def _build_logical_tables(self, db_name: str, template: Dict[str, Any], sample_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -212,6 +284,35 @@ class SemanticModelGenerator:
         
         return tables
     
+    def _precomputed(self, view: str) -> str:
+        """Object a precomputed analytical view is stored in, or '' while it is a plain view"""
+        name = self.aggregate_objects.get(view, '')
+        return '' if name.rsplit('.', 1)[-1].startswith('V_') else name
+    
+    def _build_aggregate_tables(self) -> List[Dict[str, Any]]:
+        """Logical tables over the dynamic tables / materialized views of the aggregate views"""
+        tables = []
+        for view, (name, description, columns, time_column) in AGGREGATE_TABLES.items():
+            object_name = self._precomputed(view)
+            if not object_name:
+                continue
+            tables.append({
+                'name': name,
+                'description': description,
+                'base_table': {
+                    'name': object_name,
+                    'columns': [
+                        {'name': column, 'data_type': data_type, 'description': column_description}
+                        for column, data_type, column_description in columns
+                    ]
+                },
+                'dimensions': [
+                    {'name': column, 'type': 'time' if column == time_column else 'categorical'}
+                    for column, data_type, _ in columns if data_type != 'number'
+                ]
+            })
+        return tables
+    
     def _build_metrics(self, template: Dict[str, Any], sample_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Build metrics configuration"""
         
@@ -382,6 +483,13 @@ class SemanticModelGenerator:
             'question': 'What is our monthly revenue trend?',
             'use_as_onboarding_question': True,
             'sql': '''SELECT 
+    month,
+    total_revenue,
+    total_transactions AS transaction_count,
+    unique_customers
+FROM monthly_performance
+WHERE month >= DATE_TRUNC('MONTH', DATEADD('MONTH', -12, CURRENT_DATE()))
+ORDER BY month''' if self._precomputed('V_MONTHLY_PERFORMANCE') else '''SELECT 
     DATE_TRUNC('MONTH', transaction_date) AS month,
     SUM(final_amount) AS total_revenue,
     COUNT(*) AS transaction_count,
@@ -392,7 +500,7 @@ WHERE status = 'COMPLETED'
 GROUP BY DATE_TRUNC('MONTH', transaction_date)
 ORDER BY month''',
             'verified_by': 'System',
-            'verified_at': datetime.now().isoformat()
+            'verified_at': self.reference_date.isoformat()
         }
         queries.append(monthly_revenue)
         
@@ -414,7 +522,7 @@ WHERE t.status = 'COMPLETED'
 GROUP BY c.category_name
 ORDER BY total_revenue DESC''',
             'verified_by': 'System',
-            'verified_at': datetime.now().isoformat()
+            'verified_at': self.reference_date.isoformat()
         }
         queries.append(top_categories)
         
@@ -437,7 +545,7 @@ WHERE t.status = 'COMPLETED'
 GROUP BY cs.segment_name
 ORDER BY total_revenue DESC''',
             'verified_by': 'System',
-            'verified_at': datetime.now().isoformat()
+            'verified_at': self.reference_date.isoformat()
         }
         queries.append(segment_analysis)
         
@@ -458,7 +566,7 @@ WHERE t.status = 'COMPLETED'
 GROUP BY t.region
 ORDER BY total_revenue DESC''',
             'verified_by': 'System',
-            'verified_at': datetime.now().isoformat()
+            'verified_at': self.reference_date.isoformat()
         }
         queries.append(regional_performance)
         
@@ -480,7 +588,7 @@ WHERE status = 'COMPLETED'
 GROUP BY channel
 ORDER BY total_revenue DESC''',
             'verified_by': 'System',
-            'verified_at': datetime.now().isoformat()
+            'verified_at': self.reference_date.isoformat()
         }
         queries.append(channel_analysis)
         
@@ -500,7 +608,7 @@ WHERE registration_date >= DATEADD('YEAR', -1, CURRENT_DATE())
 GROUP BY DATE_TRUNC('MONTH', registration_date)
 ORDER BY month''',
             'verified_by': 'System',
-            'verified_at': datetime.now().isoformat()
+            'verified_at': self.reference_date.isoformat()
         }
         queries.append(acquisition_trends)
         
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Semantic Model Index
+====================
+Fast YAML emission and linear-time validation for semantic models.
+
+SchemaIndex maps every logical table to its columns in a single pass over
+the model, so checking that a metric, relationship or verified query points
+at a real column is a dictionary lookup instead of a scan of the column
+lists. Both the layout this generator writes (semantic_model.logical_tables)
+and the Cortex Analyst layout used by hand-written models (tables with
+dimensions / time_dimensions / measures / facts) are understood.
+
+YAML is written with libyaml's C emitter when PyYAML was built with it and
+with the pure-Python emitter otherwise. Lines are never folded, which keeps
+the two emitters' output byte-for-byte identical.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import yaml
+
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Wide enough that no scalar is ever folded across lines
+YAML_WIDTH = 1 << 20
+
+# Cortex Analyst field sections of a logical table
+FIELD_SECTIONS = ('dimensions', 'time_dimensions', 'measures', 'facts')
+
+SQL_KEYWORDS = frozenset('''
+    all and any as asc between by case cross current_date current_timestamp desc distinct else end except
+    exists false filter first following from full group having if ilike in inner intersect interval is join
+    last lateral left like limit natural not null nulls offset on or order outer over partition preceding
+    qualify range right rlike row rows select then true unbounded union using when where window with
+    year quarter month week day hour minute second date timestamp
+'''.split())
+
+_STRING_OR_COMMENT = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.S)
+_SQL_TOKEN = re.compile(r'"[^"]*"|[A-Za-z_][\w$]*(?:\s*\.\s*[A-Za-z_][\w$]*)*|\(|,|\)')
+_IDENTIFIER = re.compile(r'[A-Za-z_][\w$]*(?:\.[A-Za-z_][\w$]*)?')
+
+
+def dump_yaml(data: Any, stream=None, **options: Any):
+    """yaml.dump with the fastest available emitter and the generator's formatting"""
+    settings = {'Dumper': YAML_DUMPER, 'default_flow_style': False, 'sort_keys': False,
+                'allow_unicode': True, 'width': YAML_WIDTH}
+    settings.update(options)
+    return yaml.dump(data, stream, **settings)
+
+
+def load_yaml(stream) -> Any:
+    """yaml.safe_load with the fastest available parser"""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def _name(value: str) -> str:
+    """Normalise a table or column reference (case-insensitive, Cortex '__table' prefix dropped)"""
+    value = re.sub(r'\s+', '', value).replace('"', '').lower()
+    return value[2:] if value.startswith('__') else value
+
+
+def _physical_names(base_table: Dict[str, Any]) -> List[str]:
+    """database.schema.table, schema.table and table of a base_table, in either layout"""
+    if base_table.get('table'):
+        parts = [base_table.get('database'), base_table.get('schema'), base_table['table']]
+    else:
+        parts = str(base_table.get('name') or '').split('.')
+    parts = [str(part) for part in parts if part]
+    return ['.'.join(parts[start:]) for start in range(len(parts))]
+
+
+# =====================================================
+# INDEX
+# =====================================================
+
+class SchemaIndex:
+    """Table -> column lookup for a semantic model
+
+    Tables are found by logical name or by the physical name of their
+    base_table, fully qualified or not.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, Dict[str, Optional[str]]] = {}
+        # Physical names (database.schema.table, schema.table, table) -> logical table
+        self.aliases: Dict[str, str] = {}
+
+    def _table(self, table: str) -> str:
+        table = _name(table)
+        return table if table in self.tables else self.aliases.get(table, table)
+
+    def add_table(self, table: str) -> Dict[str, Optional[str]]:
+        return self.tables.setdefault(_name(table), {})
+
+    def add_alias(self, alias: str, table: str):
+        self.aliases.setdefault(_name(alias), _name(table))
+
+    def add_column(self, table: str, column: str, data_type: Optional[str] = None):
+        self.add_table(table)[_name(column)] = data_type
+
+    def has_table(self, table: str) -> bool:
+        return self._table(table) in self.tables
+
+    def has_column(self, table: str, column: str) -> bool:
+        return _name(column) in self.tables.get(self._table(table), ())
+
+    @classmethod
+    def from_model(cls, model: Dict[str, Any]) -> 'SchemaIndex':
+        """Index every table and column of a model in one pass"""
+        index = cls()
+        root = model.get('semantic_model', model)
+
+        # Verified queries may name the physical table instead of the logical one
+        for table in (root.get('logical_tables') or []) + (root.get('tables') or []):
+            for alias in _physical_names(table.get('base_table') or {}):
+                index.add_alias(alias, table['name'])
+
+        # Generator layout: physical columns listed under base_table
+        for table in root.get('logical_tables') or []:
+            index.add_table(table['name'])
+            for column in (table.get('base_table') or {}).get('columns') or []:
+                index.add_column(table['name'], column['name'], column.get('data_type'))
+
+        # Cortex Analyst layout: every field is addressable by name and by the columns of its expr
+        for table in root.get('tables') or []:
+            index.add_table(table['name'])
+            for section in FIELD_SECTIONS:
+                for field in table.get(section) or []:
+                    index.add_column(table['name'], field['name'], field.get('data_type'))
+                    expr = str(field.get('expr') or '')
+                    if _IDENTIFIER.fullmatch(expr):
+                        index.add_column(table['name'], expr.split('.')[-1], field.get('data_type'))
+                    else:
+                        # Physical columns a computed field is built from exist too
+                        for reference in _expression_columns(expr):
+                            if '.' not in reference:
+                                index.add_column(table['name'], reference)
+
+        return index
+
+
+# =====================================================
+# VALIDATION
+# =====================================================
+
+def _expression_columns(expr: str) -> Iterable[str]:
+    """Column references of a SQL expression (function names, keywords and literals skipped)"""
+    expr = _STRING_OR_COMMENT.sub(' ', expr)
+    tokens = _SQL_TOKEN.findall(expr)
+    for position, token in enumerate(tokens):
+        if token in '(),' or token.startswith('"'):
+            continue
+        is_function = position + 1 < len(tokens) and tokens[position + 1] == '('
+        if not is_function and token.lower() not in SQL_KEYWORDS:
+            yield re.sub(r'\s+', '', token)
+
+
+def check_sql(sql: str, index: SchemaIndex) -> List[str]:
+    """Unknown tables and columns referenced by a query, in one pass over its tokens"""
+    tokens = _SQL_TOKEN.findall(_STRING_OR_COMMENT.sub(' ', sql))
+    lowered = [token.lower() for token in tokens]
+
+    # First pass: tables, their aliases, CTE names and output column aliases
+    aliases: Dict[str, str] = {}
+    referenced: List[str] = []
+    ctes: Set[str] = set()
+    output_aliases: Set[str] = set()
+    problems = []
+    for position, token in enumerate(lowered):
+        following = lowered[position + 1] if position + 1 < len(lowered) else ''
+        previous = lowered[position - 1] if position else ''
+        if previous in ('from', 'join') and token != '(':
+            table = _name(token)
+            if table in ctes:
+                continue
+            if index.has_table(table):
+                referenced.append(table)
+            else:
+                problems.append(f"unknown table '{tokens[position]}'")
+            aliases[table] = table
+            alias = lowered[position + 2] if following == 'as' and position + 2 < len(lowered) else following
+            if _IDENTIFIER.fullmatch(alias) and alias not in SQL_KEYWORDS:
+                aliases[alias] = table
+        elif token == 'as' and following not in ('(', ''):
+            if previous == ')' or _IDENTIFIER.fullmatch(previous):
+                output_aliases.add(following)
+        elif following == 'as' and position + 2 < len(lowered) and lowered[position + 2] == '(':
+            ctes.add(token)  # WITH name AS ( ... )
+
+    # Second pass: every column reference resolves against the referenced tables
+    skip = set(aliases) | ctes | output_aliases
+    for position, token in enumerate(lowered):
+        if token in '(),' or token.startswith('"') or token in SQL_KEYWORDS:
+            continue
+        previous = lowered[position - 1] if position else ''
+        following = lowered[position + 1] if position + 1 < len(lowered) else ''
+        if following == '(' or previous in ('from', 'join', 'as'):
+            continue
+
+        reference = re.sub(r'\s+', '', token)
+        if '.' in reference:
+            qualifier, column = reference.rsplit('.', 1)
+            table = aliases.get(qualifier)
+            if table is None:
+                if qualifier not in ctes:
+                    problems.append(f"unknown table or alias '{qualifier}' in '{tokens[position]}'")
+            elif index.has_table(table) and not index.has_column(table, column):
+                problems.append(f"unknown column '{column}' in table '{table}'")
+        elif reference not in skip and referenced and not any(index.has_column(t, reference) for t in referenced):
+            problems.append(f"unknown column '{tokens[position]}'")
+
+    return list(dict.fromkeys(problems))
+
+
+def validate_model(model: Dict[str, Any], index: Optional[SchemaIndex] = None) -> List[str]:
+    """Every reference in a model that does not resolve to a real table or column"""
+    index = index or SchemaIndex.from_model(model)
+    root = model.get('semantic_model', model)
+    problems = []
+
+    def check_column(where: str, table: str, column: str):
+        if not index.has_table(table):
+            problems.append(f"{where}: unknown table '{table}'")
+        elif not index.has_column(table, column):
+            problems.append(f"{where}: unknown column '{column}' in table '{table}'")
+
+    def check_expression(where: str, table: str, expr: str):
+        for reference in _expression_columns(expr):
+            if '.' in reference:
+                check_column(where, *reference.rsplit('.', 1))
+            else:
+                check_column(where, table, reference)
+
+    # Generator layout
+    for table in root.get('logical_tables') or []:
+        for dimension in table.get('dimensions') or []:
+            check_column(f"dimension {table['name']}.{dimension['name']}", table['name'], dimension['name'])
+
+    for metric in root.get('metrics') or []:
+        where = f"metric {metric.get('name')}"
+        if metric.get('sql'):
+            check_expression(where, metric.get('table', ''), metric['sql'])
+        for condition in metric.get('filters') or []:
+            check_column(where, metric.get('table', ''), condition['column'])
+
+    # Cortex Analyst layout
+    for table in root.get('tables') or []:
+        for column in (table.get('primary_key') or {}).get('columns') or []:
+            check_column(f"primary key of {table['name']}", table['name'], column)
+        for metric in table.get('metrics') or []:
+            check_expression(f"metric {table['name']}.{metric.get('name')}", table['name'], metric.get('expr', ''))
+        for condition in table.get('filters') or []:
+            check_expression(f"filter {table['name']}.{condition.get('name')}", table['name'], condition.get('expr', ''))
+
+    # Relationships (generator, camelCase and snake_case spellings)
+    for relationship in root.get('relationships') or []:
+        where = f"relationship {relationship.get('name')}"
+        left = relationship.get('from_table') or relationship.get('leftTable') or relationship.get('left_table')
+        right = relationship.get('to_table') or relationship.get('rightTable') or relationship.get('right_table')
+        pairs = relationship.get('relationshipColumns') or relationship.get('relationship_columns')
+        if pairs is None:
+            pairs = [{'left_column': relationship.get('from_column'), 'right_column': relationship.get('to_column')}]
+        for pair in pairs:
+            check_column(where, left or '', pair.get('leftColumn') or pair.get('left_column') or '')
+            check_column(where, right or '', pair.get('rightColumn') or pair.get('right_column') or '')
+
+    for query in root.get('verified_queries') or []:
+        for problem in check_sql(query.get('sql', ''), index):
+            problems.append(f"verified query {query.get('name')}: {problem}")
+
+    return problems
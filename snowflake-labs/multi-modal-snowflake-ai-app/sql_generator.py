@@ -12,67 +12,141 @@ This module creates all Snowflake resources needed for the demo including:
 """
 
 import os
-from typing import Dict, Any, List
+import sys
+import glob
+import itertools
+from typing import Dict, Any, Iterable, Iterator, List
 from datetime import datetime, timedelta
 import random
 import json
+import numpy as np
+
+from aggregate_objects import (
+    DEFAULT_AGGREGATE_MODE, DEFAULT_TARGET_LAG, check_mode, materialize_aggregates, object_grants
+)
+from clustering_advisor import recommend, render_sql
+from sample_data_engine import (
+    SampleDataEngine, format_value_rows, iter_chunks, write_csv_files, write_parquet_files
+)
+
+# Part of every build cache key; bump when the generated output changes
+GENERATOR_VERSION = 2
+
+# Print a peak memory report when generating at or above this scale factor
+RSS_REPORT_SCALE_FACTOR = 10
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (0 where unavailable)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
 
 class SQLGenerator:
     """Generates SQL scripts for Snowflake demo setup"""
     
     def __init__(self):
         self.sql_templates = self._load_sql_templates()
+        self.data_engine = SampleDataEngine()
+        self.rng = random.Random()
+        self.reference_date = datetime.now()
+        self.aggregate_mode = DEFAULT_AGGREGATE_MODE
+        self.target_lag = DEFAULT_TARGET_LAG
     
-    def generate_complete_setup(self, client_info: Dict[str, Any], output_dir: str = "output") -> Dict[str, str]:
-        """Generate complete SQL setup for the client demo"""
+    def generate_complete_setup(self, client_info: Dict[str, Any], output_dir: str = "output",
+                                data_format: str = "sql", demo_context: Dict[str, Any] = None) -> Dict[str, str]:
+        """Generate complete SQL setup for the client demo
         
-        company_name = client_info['name']
-        website_info = client_info['website_info']
-        industry = website_info['industry']
+        data_format 'sql' writes the sample data as INSERT statements; 'csv' or
+        'parquet' writes compressed data files plus a PUT / COPY INTO load script.
+        demo_context (from DemoGenerator.build_demo_context) is computed when not given.
+        """
+        if data_format not in ('sql', 'csv', 'parquet'):
+            raise ValueError(f"Unsupported data format: {data_format}")
         
-        # Import industry template
-        from demo_generator import DemoGenerator
-        generator = DemoGenerator()
-        template = generator.industry_templates[industry]
-        sample_data = generator.generate_sample_data(industry, company_name)
+        # Resolve industry template, sample data and database name
+        if demo_context is None:
+            from demo_generator import DemoGenerator
+            demo_context = DemoGenerator().build_demo_context(client_info)
         
-        # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
+        company_name = demo_context['company_name']
+        template = demo_context['template']
+        sample_data = demo_context['sample_data']
+        db_name = demo_context['db_name']
         
-        # Generate database name
-        db_name = generator.generate_database_name(company_name)
+        self._seed_from_context(demo_context)
         
-        # Generate all SQL components
-        setup_sql = self._generate_setup_script(company_name, db_name, template)
-        tables_sql = self._generate_tables_script(company_name, db_name, template, sample_data)
-        data_sql = self._generate_sample_data_script(company_name, db_name, template, sample_data)
-        views_sql = self._generate_views_script(company_name, db_name, template, sample_data)
+        # Create output directory
+        os.makedirs(output_dir, exist_ok=True)
         
-        # Write files
+        # Stream every script straight to its file; the data scripts are
+        # generators, so no script is ever held in memory as a whole
         files_created = {}
         
         setup_file = os.path.join(output_dir, f"{db_name.lower()}_setup.sql")
-        with open(setup_file, 'w', encoding='utf-8') as f:
-            f.write(setup_sql)
+        self._write_script(setup_file, [self._generate_setup_script(company_name, db_name, template)])
         files_created['setup'] = setup_file
         
         tables_file = os.path.join(output_dir, f"{db_name.lower()}_tables.sql")
-        with open(tables_file, 'w', encoding='utf-8') as f:
-            f.write(tables_sql)
+        self._write_script(tables_file, [self._generate_tables_script(company_name, db_name, template, sample_data)])
         files_created['tables'] = tables_file
         
-        data_file = os.path.join(output_dir, f"{db_name.lower()}_sample_data.sql")
-        with open(data_file, 'w', encoding='utf-8') as f:
-            f.write(data_sql)
+        if data_format == 'sql':
+            data_file = os.path.join(output_dir, f"{db_name.lower()}_sample_data.sql")
+            self._write_script(data_file, self._generate_sample_data_script(company_name, db_name, template, sample_data))
+        else:
+            data_dir = os.path.join(output_dir, f"{db_name.lower()}_data")
+            table_files = self._write_bulk_data_files(data_dir, sample_data, data_format)
+            data_file = os.path.join(output_dir, f"{db_name.lower()}_load_data.sql")
+            self._write_script(data_file, self._generate_bulk_load_script(
+                company_name, db_name, template, sample_data, table_files, data_format
+            ))
         files_created['data'] = data_file
         
         views_file = os.path.join(output_dir, f"{db_name.lower()}_views.sql")
-        with open(views_file, 'w', encoding='utf-8') as f:
-            f.write(views_sql)
+        self._write_script(views_file, [self._generate_views_script(company_name, db_name, template, sample_data)])
         files_created['views'] = views_file
         
+        if sample_data['scale_factor'] >= RSS_REPORT_SCALE_FACTOR:
+            print(f"[{db_name}] SF {sample_data['scale_factor']:g} scripts written, peak RSS {peak_rss_mb():.0f} MB")
+        
         return files_created
     
+    def _seed_from_context(self, demo_context: Dict[str, Any]):
+        """Seed every random draw from the context so reruns are reproducible, and take its aggregate settings"""
+        self.data_engine = SampleDataEngine(demo_context['seed'], demo_context['reference_date'])
+        self.rng = random.Random(demo_context['seed'])
+        self.reference_date = demo_context['reference_date']
+        self.aggregate_mode = check_mode(demo_context['aggregate_mode'])
+        self.target_lag = demo_context['target_lag']
+    
+    def aggregate_objects(self, demo_context: Dict[str, Any]) -> Dict[str, str]:
+        """Fully qualified object each analytical view's readers should query (dynamic table, materialized view or the view)"""
+        self._seed_from_context(demo_context)
+        db_name = demo_context['db_name']
+        _, objects = materialize_aggregates(
+            self._generate_plain_views_script(demo_context['company_name'], db_name, demo_context['template']),
+            self.aggregate_mode, self.target_lag, f"{db_name}_WH"
+        )
+        return {view: f"{db_name}.ANALYTICS.{name}" for view, name in objects.items()}
+    
+    def iter_table_columns(self, demo_context: Dict[str, Any]):
+        """Yield (table name, iterator of column chunks) for the ANALYTICS tables without writing any files"""
+        self._seed_from_context(demo_context)
+        return self._build_table_columns(demo_context['sample_data'])
+    
+    def _write_script(self, path: str, parts: Iterable[str]):
+        """Write a script to disk piece by piece as its parts are produced"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for part in parts:
+                f.write(part)
+    
     def _generate_setup_script(self, company_name: str, db_name: str, template: Dict[str, Any]) -> str:
         """Generate database and schema setup script"""
         
@@ -83,7 +157,7 @@ class SQLGenerator:
         return f'''-- =====================================================
 -- {safe_company_name} - Snowflake Cortex Demo Setup
 -- =====================================================
--- Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+-- Generated on: {self.reference_date.strftime("%Y-%m-%d")}
 -- Industry: {template['name']}
 -- Purpose: Complete Snowflake environment setup for Cortex demo
 
@@ -170,6 +244,11 @@ CREATE OR REPLACE FILE FORMAT {db_name}.UTILITIES.CSV_FORMAT
     TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS'
     NULL_IF = ('NULL', 'null', '', '\\N');
 
+CREATE OR REPLACE FILE FORMAT {db_name}.UTILITIES.PARQUET_FORMAT
+    TYPE = 'PARQUET'
+    COMPRESSION = 'SNAPPY'
+    COMMENT = 'Parquet file format for bulk sample data loads';
+
 CREATE OR REPLACE FILE FORMAT {db_name}.UTILITIES.JSON_FORMAT
     TYPE = 'JSON'
     STRIP_OUTER_ARRAY = TRUE
@@ -221,11 +300,12 @@ SELECT 'Setup completed successfully for {safe_company_name} Cortex Demo' AS SET
         safe_company_name = company_name.replace("'", "''")
         categories = sample_data['categories']
         customers = sample_data['customers']
+        clustering_advice = self._generate_clustering_advice(company_name, db_name, template, sample_data)
         
         return f'''-- =====================================================
 -- {safe_company_name} - Tables Creation Script
 -- =====================================================
--- Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+-- Generated on: {self.reference_date.strftime("%Y-%m-%d")}
 -- Industry: {template['name']}
 
 USE DATABASE {db_name};
@@ -425,18 +505,15 @@ CREATE OR REPLACE TABLE PREDICTIONS (
 );
 
 -- =====================================================
--- INDEXES AND CONSTRAINTS
+-- CLUSTERING AND SEARCH OPTIMIZATION
 -- =====================================================
 
--- Add indexes for better query performance
+-- Standard tables have no indexes; large ones are pruned through clustering
+-- keys and search optimization, derived here from the views' and verified
+-- queries' filters and GROUP BYs
 USE SCHEMA ANALYTICS;
 
--- Indexes on frequently queried columns
-CREATE INDEX IF NOT EXISTS IDX_TRANSACTIONS_DATE ON TRANSACTIONS(TRANSACTION_DATE);
-CREATE INDEX IF NOT EXISTS IDX_TRANSACTIONS_CUSTOMER ON TRANSACTIONS(CUSTOMER_ID);
-CREATE INDEX IF NOT EXISTS IDX_CUSTOMERS_SEGMENT ON CUSTOMERS(SEGMENT_ID);
-CREATE INDEX IF NOT EXISTS IDX_SUPPORT_STATUS ON SUPPORT_TICKETS(STATUS);
-CREATE INDEX IF NOT EXISTS IDX_PERFORMANCE_DATE ON PERFORMANCE_METRICS(METRIC_DATE);
+{clustering_advice}
 
 -- =====================================================
 -- GRANTS AND PERMISSIONS
@@ -454,118 +531,111 @@ SELECT 'Tables created successfully for {safe_company_name}' AS STATUS;
 
 -- Next: Load sample data using the data loading script'''
 
-    def _generate_sample_data_script(self, company_name: str, db_name: str, template: Dict[str, Any], sample_data: Dict[str, Any]) -> str:
-        """Generate sample data insertion script"""
+    def _generate_clustering_advice(self, company_name: str, db_name: str, template: Dict[str, Any],
+                                    sample_data: Dict[str, Any]) -> str:
+        """Clustering key and search optimization recommendations sized to the scale factor"""
+        from semantic_model_generator import SemanticModelGenerator
+        
+        model_generator = SemanticModelGenerator()
+        model_generator.reference_date = self.reference_date
+        verified_queries = model_generator._build_verified_queries(company_name, template, sample_data)
+        views_script = self._generate_views_script(company_name, db_name, template, sample_data)
+        
+        queries = {'views': views_script}
+        queries.update({query['name']: query['sql'] for query in verified_queries})
+        row_counts = {table.upper(): rows for table, rows in sample_data['row_counts'].items()}
+        row_counts.update({
+            'CATEGORIES': len(sample_data['categories']),
+            'PRODUCTS': len(sample_data['products']),
+            'CUSTOMER_SEGMENTS': len(sample_data['customers'])
+        })
+        
+        sources = {'views': views_script.count('CREATE OR REPLACE VIEW'), 'verified queries': len(verified_queries)}
+        return render_sql(recommend(queries, row_counts), sample_data['scale_factor'], sources)
+    
+    def _generate_sample_data_script(self, company_name: str, db_name: str, template: Dict[str, Any], sample_data: Dict[str, Any]) -> Iterator[str]:
+        """Generate sample data insertion script, yielding it section by section and batch by batch"""
         
         safe_company_name = company_name.replace("'", "''")
         categories = sample_data['categories']
         customers = sample_data['customers']
         revenue_scale = sample_data['revenue_scale']
+        products = sample_data['products']
+        row_counts = sample_data['row_counts']
+        num_customers = row_counts['customers']
         
-        # Generate sample data
-        category_inserts = self._generate_category_data(categories)
-        product_inserts = self._generate_product_data(categories)
-        customer_segment_inserts = self._generate_customer_segment_data(customers)
-        customer_inserts = self._generate_customer_data(customers)
-        transaction_inserts = self._generate_transaction_data(revenue_scale)
-        performance_inserts = self._generate_performance_data(categories)
-        support_inserts = self._generate_support_data()
-        knowledge_base_inserts = self._generate_knowledge_base_data(company_name, template)
-        feedback_inserts = self._generate_feedback_data()
-        
-        return f'''-- =====================================================
+        yield f'''-- =====================================================
 -- {safe_company_name} - Sample Data Loading Script
 -- =====================================================
--- Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+-- Generated on: {self.reference_date.strftime("%Y-%m-%d")}
 -- Industry: {template['name']}
+-- Scale Factor: {sample_data['scale_factor']:g}
 
 USE DATABASE {db_name};
 USE SCHEMA ANALYTICS;
 
--- =====================================================
--- CATEGORY DATA
--- =====================================================
-
-{category_inserts}
-
--- =====================================================
--- PRODUCT DATA
--- =====================================================
-
-{product_inserts}
-
--- =====================================================
--- CUSTOMER SEGMENT DATA
--- =====================================================
-
-{customer_segment_inserts}
-
--- =====================================================
--- CUSTOMER DATA
--- =====================================================
-
-{customer_inserts}
-
--- =====================================================
--- TRANSACTION DATA
--- =====================================================
-
-{transaction_inserts}
-
--- =====================================================
--- PERFORMANCE METRICS DATA
--- =====================================================
-
-{performance_inserts}
-
--- =====================================================
--- SUPPORT TICKETS DATA
--- =====================================================
-
-{support_inserts}
-
--- =====================================================
--- CORTEX DEMO DATA
--- =====================================================
-
-USE SCHEMA CORTEX_DEMO;
-
--- Knowledge Base Documents
-{knowledge_base_inserts}
-
--- Customer Feedback
-{feedback_inserts}
+'''
+        
+        # Fact tables reference the fixed dimension tables (categories,
+        # segments, products) and the scaled customer range
+        yield self._section_banner('CATEGORY DATA')
+        yield self._generate_category_data(categories) + '\n\n'
+        
+        yield self._section_banner('PRODUCT DATA')
+        yield self._generate_product_data(products) + '\n\n'
+        
+        yield self._section_banner('CUSTOMER SEGMENT DATA')
+        yield self._generate_customer_segment_data(customers) + '\n\n'
+        
+        yield self._section_banner('CUSTOMER DATA')
+        yield from self._generate_customer_data(customers, num_customers)
+        
+        yield self._section_banner('TRANSACTION DATA')
+        yield from self._generate_transaction_data(
+            revenue_scale, sample_data['transactions'],
+            row_counts['transactions'], num_customers, len(products)
+        )
+        
+        yield self._section_banner('PERFORMANCE METRICS DATA')
+        yield from self._generate_performance_data(categories)
+        
+        yield self._section_banner('SUPPORT TICKETS DATA')
+        yield from self._generate_support_data(row_counts['support_tickets'], num_customers)
+        
+        yield self._section_banner('CORTEX DEMO DATA')
+        yield 'USE SCHEMA CORTEX_DEMO;\n\n-- Knowledge Base Documents\n'
+        yield self._generate_knowledge_base_data(company_name, template) + '\n\n'
+        yield '-- Customer Feedback\n'
+        yield from self._generate_feedback_data(row_counts['customer_feedback'], num_customers, len(products))
+        
+        yield self._generate_data_validation_sql(safe_company_name)
 
+    def _section_banner(self, title: str) -> str:
+        """Comment banner that opens a script section"""
+        return f"""-- =====================================================
+-- {title}
 -- =====================================================
--- DATA VALIDATION
--- =====================================================
-
-USE SCHEMA ANALYTICS;
-
-SELECT 'Data Loading Summary:' AS INFO;
-SELECT 'Categories: ' || COUNT(*) || ' records' AS SUMMARY FROM CATEGORIES;
-SELECT 'Products: ' || COUNT(*) || ' records' AS SUMMARY FROM PRODUCTS;
-SELECT 'Customer Segments: ' || COUNT(*) || ' records' AS SUMMARY FROM CUSTOMER_SEGMENTS;
-SELECT 'Customers: ' || COUNT(*) || ' records' AS SUMMARY FROM CUSTOMERS;
-SELECT 'Transactions: ' || COUNT(*) || ' records' AS SUMMARY FROM TRANSACTIONS;
-SELECT 'Performance Metrics: ' || COUNT(*) || ' records' AS SUMMARY FROM PERFORMANCE_METRICS;
-SELECT 'Support Tickets: ' || COUNT(*) || ' records' AS SUMMARY FROM SUPPORT_TICKETS;
-
-USE SCHEMA CORTEX_DEMO;
-SELECT 'Knowledge Base: ' || COUNT(*) || ' records' AS SUMMARY FROM KNOWLEDGE_BASE;
-SELECT 'Customer Feedback: ' || COUNT(*) || ' records' AS SUMMARY FROM CUSTOMER_FEEDBACK;
 
-SELECT 'Sample data loaded successfully for {safe_company_name}' AS STATUS;'''
+"""
 
     def _generate_views_script(self, company_name: str, db_name: str, template: Dict[str, Any], sample_data: Dict[str, Any]) -> str:
-        """Generate analytical views for the semantic model"""
+        """Generate analytical views for the semantic model, aggregates precomputed per the aggregate mode"""
+        
+        views_script, _ = materialize_aggregates(
+            self._generate_plain_views_script(company_name, db_name, template),
+            self.aggregate_mode, self.target_lag, f"{db_name}_WH"
+        )
+        return views_script
+    
+    def _generate_plain_views_script(self, company_name: str, db_name: str, template: Dict[str, Any]) -> str:
+        """Analytical views script with every aggregate as a plain view"""
         
         safe_company_name = company_name.replace("'", "''")
         
         return f'''-- =====================================================
 -- {safe_company_name} - Analytical Views Creation
 -- =====================================================
--- Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+-- Generated on: {self.reference_date.strftime("%Y-%m-%d")}
 -- Industry: {template['name']}
 
 USE DATABASE {db_name};
@@ -742,58 +812,61 @@ ORDER BY month DESC, total_revenue DESC;
 -- Grant view access to demo role
 GRANT SELECT ON ALL VIEWS IN SCHEMA {db_name}.ANALYTICS TO ROLE {db_name}_ROLE;
 GRANT SELECT ON FUTURE VIEWS IN SCHEMA {db_name}.ANALYTICS TO ROLE {db_name}_ROLE;
-
+{object_grants(self.aggregate_mode, db_name)}
 SELECT 'Analytical views created successfully for {safe_company_name}' AS STATUS;
 
 -- Views are ready for Cortex Analyst semantic model configuration'''
 
     def _generate_category_data(self, categories: List[str]) -> str:
         """Generate category data inserts"""
-        inserts = []
-        for i, category in enumerate(categories, 1):
-            category_id = f"CAT{i:03d}"
-            description = f"Premium {category.lower()} products and services"
-            inserts.append(f"('{category_id}', '{category}', '{description}', NULL, TRUE)")
-        
-        return f"""INSERT INTO CATEGORIES (CATEGORY_ID, CATEGORY_NAME, DESCRIPTION, PARENT_CATEGORY_ID, IS_ACTIVE) VALUES
-{','.join(inserts)};"""
+        return ''.join(self._format_insert_batches(
+            "INSERT INTO CATEGORIES (CATEGORY_ID, CATEGORY_NAME, DESCRIPTION, PARENT_CATEGORY_ID, IS_ACTIVE) VALUES",
+            format_value_rows(self._category_columns(categories)),
+            batch_size=1000
+        )).rstrip()
 
-    def _generate_product_data(self, categories: List[str]) -> str:
+    def _generate_product_data(self, products: List[Dict[str, str]]) -> str:
         """Generate product data inserts"""
-        inserts = []
-        product_counter = 1
-        
-        product_templates = {
-            'Fashion': ['Premium Clothing Line', 'Designer Accessories', 'Seasonal Collection', 'Athletic Wear'],
-            'Home': ['Modern Furniture Set', 'Kitchen Appliances', 'Home Decor Collection', 'Bedding Essentials'],
-            'Electronics': ['Smart Device Collection', 'Audio Equipment', 'Computer Accessories', 'Mobile Tech'],
-            'Beauty': ['Skincare Essentials', 'Makeup Collection', 'Fragrance Line', 'Hair Care Products'],
-            'Sports': ['Fitness Equipment', 'Outdoor Gear', 'Athletic Accessories', 'Sports Apparel'],
-            'Luxury': ['Premium Collection', 'Exclusive Items', 'Limited Edition', 'VIP Products']
-        }
-        
-        for i, category in enumerate(categories, 1):
-            category_id = f"CAT{i:03d}"
-            
-            # Get product templates or use generic ones
-            templates = product_templates.get(category, ['Premium Product', 'Standard Product', 'Basic Product'])
-            
-            for template in templates:
-                product_id = f"PROD{product_counter:04d}"
-                product_name = f"{category} - {template}"
-                description = f"High-quality {template.lower()} from our {category.lower()} collection"
-                unit_price = random.randint(50, 1000)
-                cost_price = round(unit_price * 0.6, 2)
-                
-                inserts.append(f"('{product_id}', '{product_name}', '{category_id}', '{description}', {unit_price}, {cost_price}, TRUE)")
-                product_counter += 1
-        
-        return f"""INSERT INTO PRODUCTS (PRODUCT_ID, PRODUCT_NAME, CATEGORY_ID, DESCRIPTION, UNIT_PRICE, COST_PRICE, IS_ACTIVE) VALUES
-{','.join(inserts)};"""
+        return ''.join(self._format_insert_batches(
+            "INSERT INTO PRODUCTS (PRODUCT_ID, PRODUCT_NAME, CATEGORY_ID, DESCRIPTION, UNIT_PRICE, COST_PRICE, IS_ACTIVE) VALUES",
+            format_value_rows(self._product_columns(products)),
+            batch_size=1000
+        )).rstrip()
 
     def _generate_customer_segment_data(self, segments: List[str]) -> str:
         """Generate customer segment data inserts"""
-        inserts = []
+        return ''.join(self._format_insert_batches(
+            "INSERT INTO CUSTOMER_SEGMENTS (SEGMENT_ID, SEGMENT_NAME, DESCRIPTION, TARGET_DEMOGRAPHICS, IS_ACTIVE) VALUES",
+            format_value_rows(self._customer_segment_columns(segments)),
+            batch_size=1000
+        )).rstrip()
+
+    def _category_columns(self, categories: List[str]) -> Dict[str, np.ndarray]:
+        """Build the CATEGORIES table as columns"""
+        return {
+            'CATEGORY_ID': np.array([f"CAT{i:03d}" for i in range(1, len(categories) + 1)]),
+            'CATEGORY_NAME': np.array(categories),
+            'DESCRIPTION': np.array([f"Premium {category.lower()} products and services" for category in categories]),
+            'PARENT_CATEGORY_ID': np.full(len(categories), None, dtype=object),
+            'IS_ACTIVE': np.ones(len(categories), dtype=bool)
+        }
+
+    def _product_columns(self, products: List[Dict[str, str]]) -> Dict[str, np.ndarray]:
+        """Build the PRODUCTS table as columns"""
+        unit_price = np.array([self.rng.randint(50, 1000) for _ in products])
+        
+        return {
+            'PRODUCT_ID': np.array([product['product_id'] for product in products]),
+            'PRODUCT_NAME': np.array([product['name'] for product in products]),
+            'CATEGORY_ID': np.array([product['category_id'] for product in products]),
+            'DESCRIPTION': np.array([product['description'] for product in products]),
+            'UNIT_PRICE': unit_price,
+            'COST_PRICE': np.round(unit_price * 0.6, 2),
+            'IS_ACTIVE': np.ones(len(products), dtype=bool)
+        }
+
+    def _customer_segment_columns(self, segments: List[str]) -> Dict[str, np.ndarray]:
+        """Build the CUSTOMER_SEGMENTS table as columns"""
         segment_descriptions = {
             'Premium Members': 'High-value customers with exclusive benefits',
             'Young Professionals': 'Career-focused individuals aged 25-35',
@@ -806,247 +879,225 @@ SELECT 'Analytical views created successfully for {safe_company_name}' AS STATUS
             'First Time Buyers': 'New customers making their first purchases'
         }
         
-        for i, segment in enumerate(segments, 1):
-            segment_id = f"SEG{i:03d}"
-            description = segment_descriptions.get(segment, f"Customer segment for {segment.lower()}")
-            demographics = f"Target demographic for {segment.lower()} customer base"
-            
-            inserts.append(f"('{segment_id}', '{segment}', '{description}', '{demographics}', TRUE)")
-        
-        return f"""INSERT INTO CUSTOMER_SEGMENTS (SEGMENT_ID, SEGMENT_NAME, DESCRIPTION, TARGET_DEMOGRAPHICS, IS_ACTIVE) VALUES
-{','.join(inserts)};"""
+        return {
+            'SEGMENT_ID': np.array([f"SEG{i:03d}" for i in range(1, len(segments) + 1)]),
+            'SEGMENT_NAME': np.array(segments),
+            'DESCRIPTION': np.array([
+                segment_descriptions.get(segment, f"Customer segment for {segment.lower()}") for segment in segments
+            ]),
+            'TARGET_DEMOGRAPHICS': np.array([
+                f"Target demographic for {segment.lower()} customer base" for segment in segments
+            ]),
+            'IS_ACTIVE': np.ones(len(segments), dtype=bool)
+        }
 
-    def _generate_customer_data(self, segments: List[str]) -> str:
-        """Generate customer data inserts"""
-        inserts = []
-        
-        first_names = ['Juan', 'María', 'Carlos', 'Ana', 'Luis', 'Carmen', 'Jorge', 'Patricia', 'Miguel', 'Rosa',
-                      'Fernando', 'Guadalupe', 'Rafael', 'Isabel', 'Antonio', 'Margarita', 'José', 'Leticia']
-        
-        last_names = ['García', 'Rodríguez', 'Martínez', 'González', 'López', 'Hernández', 'Pérez', 'Sánchez',
-                     'Ramírez', 'Torres', 'Flores', 'Rivera', 'Gómez', 'Díaz', 'Cruz', 'Morales', 'Jiménez']
-        
-        regions = ['CDMX', 'Guadalajara', 'Monterrey', 'Puebla', 'Tijuana', 'León', 'Querétaro', 'Mérida']
-        
-        for customer_id in range(1, 501):  # Generate 500 customers
-            customer_name = f"{random.choice(first_names)} {random.choice(last_names)}"
-            email = f"{customer_name.lower().replace(' ', '.')}@email.com"
-            phone = f"+52 55 {random.randint(1000, 9999)} {random.randint(1000, 9999)}"
-            segment_id = f"SEG{random.randint(1, len(segments)):03d}"
+    def _generate_customer_data(self, segments: List[str], num_customers: int = 500) -> Iterator[str]:
+        """Generate customer data inserts, one chunk of customers at a time"""
+        for start, count in iter_chunks(num_customers):
+            columns = self.data_engine.customers(count, len(segments), start)
             
-            # Random registration date in the last 3 years
-            reg_date = datetime.now() - timedelta(days=random.randint(1, 1095))
-            last_purchase = reg_date + timedelta(days=random.randint(1, (datetime.now() - reg_date).days))
+            yield from self._format_insert_batches(
+                """INSERT INTO CUSTOMERS (CUSTOMER_ID, CUSTOMER_NAME, EMAIL, PHONE, SEGMENT_ID, 
+REGISTRATION_DATE, LAST_PURCHASE_DATE, TOTAL_PURCHASES, IS_ACTIVE, REGION, COUNTRY) VALUES""",
+                format_value_rows(columns),
+                batch_size=50
+            )
+
+    def _generate_transaction_data(self, revenue_scale: Dict[str, Any], transaction_patterns: Dict[str, List[float]] = None,
+                                   num_transactions: int = 5000, num_customers: int = 500, num_products: int = 24) -> Iterator[str]:
+        """Generate transaction data inserts for the last 18 months, one chunk at a time"""
+        for start, count in iter_chunks(num_transactions):
+            columns = self.data_engine.transactions(
+                count, num_customers, num_products, transaction_patterns, days=540, start=start
+            )
             
-            total_purchases = round(random.uniform(100, 10000), 2)
-            region = random.choice(regions)
-            
-            customer_id_str = f"CUST{customer_id:06d}"
-            
-            inserts.append(f"('{customer_id_str}', '{customer_name}', '{email}', '{phone}', '{segment_id}', "
-                          f"'{reg_date.strftime('%Y-%m-%d')}', '{last_purchase.strftime('%Y-%m-%d')}', "
-                          f"{total_purchases}, TRUE, '{region}', 'Mexico')")
-        
-        # Split inserts into batches of 50
-        batch_size = 50
-        batches = [inserts[i:i + batch_size] for i in range(0, len(inserts), batch_size)]
-        
-        result = ""
-        for i, batch in enumerate(batches):
-            result += f"""INSERT INTO CUSTOMERS (CUSTOMER_ID, CUSTOMER_NAME, EMAIL, PHONE, SEGMENT_ID, 
-REGISTRATION_DATE, LAST_PURCHASE_DATE, TOTAL_PURCHASES, IS_ACTIVE, REGION, COUNTRY) VALUES
-{','.join(batch)};
-
-"""
-        
-        return result
-
-    def _generate_transaction_data(self, revenue_scale: Dict[str, Any]) -> str:
-        """Generate transaction data inserts"""
-        inserts = []
-        
-        channels = ['Online', 'Store', 'Mobile App', 'Call Center', 'Partner']
-        payment_methods = ['Credit Card', 'Debit Card', 'PayPal', 'Bank Transfer', 'Cash']
-        regions = ['CDMX', 'Guadalajara', 'Monterrey', 'Puebla', 'Tijuana', 'León', 'Querétaro', 'Mérida']
-        
-        # Generate transactions for the last 18 months
-        start_date = datetime.now() - timedelta(days=540)
+            yield from self._format_insert_batches(
+                """INSERT INTO TRANSACTIONS (TRANSACTION_ID, CUSTOMER_ID, PRODUCT_ID, TRANSACTION_DATE, 
+QUANTITY, UNIT_PRICE, TOTAL_AMOUNT, DISCOUNT_AMOUNT, FINAL_AMOUNT, PAYMENT_METHOD, 
+STATUS, CHANNEL, REGION) VALUES""",
+                format_value_rows(columns),
+                batch_size=100
+            )
+
+    def _generate_performance_data(self, categories: List[str]) -> Iterator[str]:
+        """Generate performance metrics data for the last 24 months"""
+        columns = self.data_engine.performance_metrics(categories, months=24)
         
-        for transaction_id in range(1, 5001):  # Generate 5000 transactions
-            trans_date = start_date + timedelta(days=random.randint(0, 540))
-            customer_id = f"CUST{random.randint(1, 500):06d}"
-            product_id = f"PROD{random.randint(1, 24):04d}"  # Assuming 24 products (6 categories × 4 products)
-            
-            quantity = random.randint(1, 5)
-            unit_price = round(random.uniform(50, 1000), 2)
-            total_amount = round(quantity * unit_price, 2)
-            discount = round(random.uniform(0, total_amount * 0.2), 2) if random.random() < 0.3 else 0
-            final_amount = round(total_amount - discount, 2)
+        return self._format_insert_batches(
+            """INSERT INTO PERFORMANCE_METRICS (METRIC_ID, METRIC_DATE, METRIC_NAME, METRIC_VALUE, 
+METRIC_TARGET, CATEGORY, REGION, MEASUREMENT_UNIT) VALUES""",
+            format_value_rows(columns),
+            batch_size=200
+        )
+
+    def _generate_support_data(self, num_tickets: int = 1000, num_customers: int = 500) -> Iterator[str]:
+        """Generate support ticket data for the last 6 months, one chunk at a time"""
+        for start, count in iter_chunks(num_tickets):
+            columns = self.data_engine.support_tickets(count, num_customers, days=180, start=start)
             
-            payment_method = random.choice(payment_methods)
-            status = 'COMPLETED' if random.random() < 0.95 else random.choice(['PENDING', 'CANCELLED'])
-            channel = random.choice(channels)
-            region = random.choice(regions)
-            
-            transaction_id_str = f"TXN{transaction_id:08d}"
-            
-            inserts.append(f"('{transaction_id_str}', '{customer_id}', '{product_id}', "
-                          f"'{trans_date.strftime('%Y-%m-%d %H:%M:%S')}', {quantity}, {unit_price}, "
-                          f"{total_amount}, {discount}, {final_amount}, '{payment_method}', "
-                          f"'{status}', '{channel}', '{region}')")
-        
-        # Split into batches
-        batch_size = 100
-        batches = [inserts[i:i + batch_size] for i in range(0, len(inserts), batch_size)]
-        
-        result = ""
-        for i, batch in enumerate(batches):
-            result += f"""INSERT INTO TRANSACTIONS (TRANSACTION_ID, CUSTOMER_ID, PRODUCT_ID, TRANSACTION_DATE, 
-QUANTITY, UNIT_PRICE, TOTAL_AMOUNT, DISCOUNT_AMOUNT, FINAL_AMOUNT, PAYMENT_METHOD, 
-STATUS, CHANNEL, REGION) VALUES
-{','.join(batch)};
+            yield from self._format_insert_batches(
+                """INSERT INTO SUPPORT_TICKETS (TICKET_ID, CUSTOMER_ID, SUBJECT, DESCRIPTION, PRIORITY, 
+STATUS, CATEGORY, ASSIGNED_TO, CREATED_DATE, RESOLVED_DATE, SATISFACTION_RATING, FEEDBACK_TEXT) VALUES""",
+                format_value_rows(columns),
+                batch_size=100
+            )
+
+    def _format_insert_batches(self, insert_header: str, rows: List[str], batch_size: int) -> Iterator[str]:
+        """Split formatted VALUES rows into multi-row INSERT statements"""
+        for i in range(0, len(rows), batch_size):
+            yield f"""{insert_header}
+{','.join(rows[i:i + batch_size])};
 
 """
-        
-        return result
 
-    def _generate_performance_data(self, categories: List[str]) -> str:
-        """Generate performance metrics data"""
-        inserts = []
-        
-        metrics = [
-            ('Revenue', 'currency', 'MXN'),
-            ('Transactions', 'count', 'units'),
-            ('Customer Satisfaction', 'rating', 'score'),
-            ('Market Share', 'percentage', 'percent'),
-            ('Growth Rate', 'percentage', 'percent')
-        ]
-        
-        regions = ['CDMX', 'Guadalajara', 'Monterrey', 'Puebla', 'National']
+    def _write_bulk_data_files(self, data_dir: str, sample_data: Dict[str, Any], data_format: str) -> Dict[str, Dict[str, Any]]:
+        """Write every ANALYTICS table as compressed data files, one sub-directory per table"""
+        writer = write_parquet_files if data_format == 'parquet' else write_csv_files
+        table_files = {}
         
-        # Generate metrics for the last 24 months
-        start_date = datetime.now() - timedelta(days=730)
-        
-        metric_counter = 1
-        for month_offset in range(24):
-            metric_date = (start_date + timedelta(days=month_offset * 30)).date()
+        for table_name, column_chunks in self._build_table_columns(sample_data):
+            table_dir = os.path.join(data_dir, table_name.lower())
+            # Drop parts left by an earlier, larger run so PUT only picks up this one
+            for stale_file in glob.glob(os.path.join(table_dir, 'part_*')):
+                os.remove(stale_file)
             
-            for metric_name, metric_type, unit in metrics:
-                for region in regions:
-                    for category in categories:
-                        metric_id = f"MET{metric_counter:06d}"
-                        
-                        # Generate realistic values based on metric type
-                        if metric_type == 'currency':
-                            value = round(random.uniform(50000, 500000), 2)
-                            target = round(value * random.uniform(0.9, 1.1), 2)
-                        elif metric_type == 'count':
-                            value = random.randint(100, 2000)
-                            target = int(value * random.uniform(0.9, 1.1))
-                        elif metric_type == 'rating':
-                            value = round(random.uniform(3.5, 5.0), 1)
-                            target = 4.5
-                        else:  # percentage
-                            value = round(random.uniform(0, 100), 1)
-                            target = round(value * random.uniform(0.9, 1.1), 1)
-                        
-                        category_name = f"{category} - {metric_name}"
-                        
-                        inserts.append(f"('{metric_id}', '{metric_date}', '{metric_name}', "
-                                      f"{value}, {target}, '{category_name}', '{region}', '{unit}')")
-                        
-                        metric_counter += 1
-        
-        # Split into batches
-        batch_size = 200
-        batches = [inserts[i:i + batch_size] for i in range(0, len(inserts), batch_size)]
-        
-        result = ""
-        for i, batch in enumerate(batches):
-            result += f"""INSERT INTO PERFORMANCE_METRICS (METRIC_ID, METRIC_DATE, METRIC_NAME, METRIC_VALUE, 
-METRIC_TARGET, CATEGORY, REGION, MEASUREMENT_UNIT) VALUES
-{','.join(batch)};
-
-"""
+            first_chunk = next(column_chunks)
+            files = writer(table_dir, itertools.chain([first_chunk], column_chunks))
+            table_files[table_name] = {
+                'columns': list(first_chunk.keys()),
+                'directory': os.path.relpath(table_dir, os.path.dirname(data_dir)),
+                'files': files
+            }
         
-        return result
+        return table_files
 
-    def _generate_support_data(self) -> str:
-        """Generate support ticket data"""
-        inserts = []
-        
-        subjects = [
-            'Product inquiry and specifications',
-            'Order status and delivery questions',
-            'Technical support request',
-            'Billing and payment issues',
-            'Return and refund request',
-            'Account access problems',
-            'Product quality concerns',
-            'Feature request and suggestions',
-            'General customer service inquiry'
-        ]
+    def _build_table_columns(self, sample_data: Dict[str, Any]):
+        """Yield (table name, iterator of column chunks) for the ANALYTICS tables"""
+        categories = sample_data['categories']
+        segments = sample_data['customers']
+        products = sample_data['products']
+        row_counts = sample_data['row_counts']
+        num_customers = row_counts['customers']
+        engine = self.data_engine
         
-        categories = ['Technical', 'Billing', 'Sales', 'General', 'Returns', 'Account']
-        priorities = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
-        statuses = ['OPEN', 'IN_PROGRESS', 'RESOLVED', 'CLOSED']
-        agents = ['Agent001', 'Agent002', 'Agent003', 'Agent004', 'Agent005']
+        yield 'CATEGORIES', iter([self._category_columns(categories)])
+        yield 'PRODUCTS', iter([self._product_columns(products)])
+        yield 'CUSTOMER_SEGMENTS', iter([self._customer_segment_columns(segments)])
+        yield 'CUSTOMERS', (
+            engine.customers(count, len(segments), start)
+            for start, count in iter_chunks(num_customers)
+        )
+        yield 'TRANSACTIONS', (
+            engine.transactions(count, num_customers, len(products), sample_data['transactions'], days=540, start=start)
+            for start, count in iter_chunks(row_counts['transactions'])
+        )
+        yield 'PERFORMANCE_METRICS', iter([engine.performance_metrics(categories, months=24)])
+        yield 'SUPPORT_TICKETS', (
+            engine.support_tickets(count, num_customers, days=180, start=start)
+            for start, count in iter_chunks(row_counts['support_tickets'])
+        )
+
+    def _generate_bulk_load_script(self, company_name: str, db_name: str, template: Dict[str, Any],
+                                   sample_data: Dict[str, Any], table_files: Dict[str, Dict[str, Any]],
+                                   data_format: str) -> Iterator[str]:
+        """Generate the PUT / COPY INTO script that loads the bulk data files, yielding it in parts"""
         
-        # Generate tickets for the last 6 months
-        start_date = datetime.now() - timedelta(days=180)
+        safe_company_name = company_name.replace("'", "''")
+        stage = f"{db_name}.STAGING.SAMPLE_DATA_STAGE"
+        file_format = f"{db_name}.UTILITIES.{'PARQUET_FORMAT' if data_format == 'parquet' else 'CSV_FORMAT'}"
+        row_counts = sample_data['row_counts']
         
-        for ticket_id in range(1, 1001):  # Generate 1000 tickets
-            created_date = start_date + timedelta(days=random.randint(0, 180))
-            customer_id = f"CUST{random.randint(1, 500):06d}"
-            subject = random.choice(subjects)
-            description = f"Customer inquiry regarding {subject.lower()}. Detailed description of the issue and customer requirements."
-            
-            priority = random.choice(priorities)
-            status = random.choice(statuses)
-            category = random.choice(categories)
-            agent = random.choice(agents)
-            
-            # Generate resolved date if ticket is resolved/closed
-            resolved_date = None
-            if status in ['RESOLVED', 'CLOSED']:
-                resolve_days = random.randint(1, 7)
-                resolved_date = created_date + timedelta(days=resolve_days)
-                resolved_date_str = f"'{resolved_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-            else:
-                resolved_date_str = "NULL"
+        load_steps = []
+        for table_name, table in table_files.items():
+            stage_path = f"@{stage}/{table_name.lower()}/"
+            local_path = './' + table['directory'].replace('\\', '/')
             
-            # Generate satisfaction rating for resolved tickets
-            satisfaction = None
-            if status in ['RESOLVED', 'CLOSED'] and random.random() < 0.8:
-                satisfaction = round(random.uniform(3.0, 5.0), 1)
-                satisfaction_str = str(satisfaction)
+            if data_format == 'parquet':
+                copy_sql = f"""COPY INTO {table_name}
+    FROM {stage_path}
+    FILE_FORMAT = (FORMAT_NAME = '{file_format}')
+    MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+    ON_ERROR = 'ABORT_STATEMENT';"""
             else:
-                satisfaction_str = "NULL"
-            
-            feedback_text = f"Customer feedback for ticket regarding {category.lower()} issue" if satisfaction else "NULL"
-            if feedback_text != "NULL":
-                feedback_text = f"'{feedback_text}'"
-            
-            ticket_id_str = f"TICK{ticket_id:06d}"
+                copy_sql = f"""COPY INTO {table_name} ({', '.join(table['columns'])})
+    FROM {stage_path}
+    FILE_FORMAT = (FORMAT_NAME = '{file_format}')
+    ON_ERROR = 'ABORT_STATEMENT';"""
             
-            inserts.append(f"('{ticket_id_str}', '{customer_id}', '{subject}', '{description}', "
-                          f"'{priority}', '{status}', '{category}', '{agent}', "
-                          f"'{created_date.strftime('%Y-%m-%d %H:%M:%S')}', {resolved_date_str}, "
-                          f"{satisfaction_str}, {feedback_text})")
+            load_steps.append(f"""-- {table_name} ({len(table['files'])} file(s))
+PUT 'file://{local_path}/*' {stage_path} AUTO_COMPRESS = FALSE PARALLEL = 8 OVERWRITE = TRUE;
+{copy_sql}""")
         
-        # Split into batches
-        batch_size = 100
-        batches = [inserts[i:i + batch_size] for i in range(0, len(inserts), batch_size)]
+        knowledge_base_inserts = self._generate_knowledge_base_data(company_name, template)
+        load_sql = '\n\n'.join(load_steps)
         
-        result = ""
-        for i, batch in enumerate(batches):
-            result += f"""INSERT INTO SUPPORT_TICKETS (TICKET_ID, CUSTOMER_ID, SUBJECT, DESCRIPTION, PRIORITY, 
-STATUS, CATEGORY, ASSIGNED_TO, CREATED_DATE, RESOLVED_DATE, SATISFACTION_RATING, FEEDBACK_TEXT) VALUES
-{','.join(batch)};
+        yield f'''-- =====================================================
+-- {safe_company_name} - Bulk Data Loading Script
+-- =====================================================
+-- Generated on: {self.reference_date.strftime("%Y-%m-%d")}
+-- Industry: {template['name']}
+-- Scale Factor: {sample_data['scale_factor']:g}
+-- Data Format: {data_format.upper()}
+--
+-- Run with SnowSQL or the Snowflake CLI from the folder holding this script
+-- and its data files: PUT uploads local files (paths are relative to the
+-- working directory) and is not available in Snowsight worksheets.
 
-"""
-        
-        return result
+USE DATABASE {db_name};
+USE SCHEMA ANALYTICS;
+
+-- =====================================================
+-- STAGE
+-- =====================================================
+
+CREATE STAGE IF NOT EXISTS {stage}
+    FILE_FORMAT = (FORMAT_NAME = '{file_format}')
+    COMMENT = 'Stage for bulk sample data files';
+
+-- =====================================================
+-- UPLOAD AND COPY ANALYTICS TABLES
+-- =====================================================
+
+{load_sql}
+
+-- =====================================================
+-- CORTEX DEMO DATA
+-- =====================================================
+
+USE SCHEMA CORTEX_DEMO;
+
+-- Knowledge Base Documents
+{knowledge_base_inserts}
+
+-- Customer Feedback
+'''
+        yield from self._generate_feedback_data(
+            row_counts['customer_feedback'], row_counts['customers'], len(sample_data['products'])
+        )
+        yield self._generate_data_validation_sql(safe_company_name)
+
+    def _generate_data_validation_sql(self, safe_company_name: str) -> str:
+        """Generate the row count summary run after loading sample data"""
+        return f'''-- =====================================================
+-- DATA VALIDATION
+-- =====================================================
+
+USE SCHEMA ANALYTICS;
+
+SELECT 'Data Loading Summary:' AS INFO;
+SELECT 'Categories: ' || COUNT(*) || ' records' AS SUMMARY FROM CATEGORIES;
+SELECT 'Products: ' || COUNT(*) || ' records' AS SUMMARY FROM PRODUCTS;
+SELECT 'Customer Segments: ' || COUNT(*) || ' records' AS SUMMARY FROM CUSTOMER_SEGMENTS;
+SELECT 'Customers: ' || COUNT(*) || ' records' AS SUMMARY FROM CUSTOMERS;
+SELECT 'Transactions: ' || COUNT(*) || ' records' AS SUMMARY FROM TRANSACTIONS;
+SELECT 'Performance Metrics: ' || COUNT(*) || ' records' AS SUMMARY FROM PERFORMANCE_METRICS;
+SELECT 'Support Tickets: ' || COUNT(*) || ' records' AS SUMMARY FROM SUPPORT_TICKETS;
+
+USE SCHEMA CORTEX_DEMO;
+SELECT 'Knowledge Base: ' || COUNT(*) || ' records' AS SUMMARY FROM KNOWLEDGE_BASE;
+SELECT 'Customer Feedback: ' || COUNT(*) || ' records' AS SUMMARY FROM CUSTOMER_FEEDBACK;
+
+SELECT 'Sample data loaded successfully for {safe_company_name}' AS STATUS;'''
 
     def _generate_knowledge_base_data(self, company_name: str, template: Dict[str, Any]) -> str:
         """Generate knowledge base documents for Cortex Search"""
@@ -1102,8 +1153,8 @@ STATUS, CATEGORY, ASSIGNED_TO, CREATED_DATE, RESOLVED_DATE, SATISFACTION_RATING,
 AUTHOR, CREATED_DATE, UPDATED_DATE, IS_ACTIVE, TAGS, METADATA) VALUES
 {','.join(inserts)};"""
 
-    def _generate_feedback_data(self) -> str:
-        """Generate customer feedback data for sentiment analysis"""
+    def _generate_feedback_data(self, num_feedback: int = 500, num_customers: int = 500, num_products: int = 24) -> Iterator[str]:
+        """Generate customer feedback data for sentiment analysis, one INSERT batch at a time"""
         
         feedback_texts = [
             'Excellent service and high quality products. Very satisfied with my purchase.',
@@ -1120,28 +1171,29 @@ AUTHOR, CREATED_DATE, UPDATED_DATE, IS_ACTIVE, TAGS, METADATA) VALUES
         
         sources = ['Website', 'Email', 'Phone', 'Chat', 'Survey', 'Social Media']
         
+        batch_size = 100
         inserts = []
-        for feedback_id in range(1, 501):  # Generate 500 feedback records
-            customer_id = f"CUST{random.randint(1, 500):06d}"
-            product_id = f"PROD{random.randint(1, 24):04d}"
+        for feedback_id in range(1, num_feedback + 1):
+            customer_id = f"CUST{self.rng.randint(1, num_customers):06d}"
+            product_id = f"PROD{self.rng.randint(1, num_products):04d}"
             
-            feedback_text = random.choice(feedback_texts)
-            rating = random.randint(1, 5)
-            source = random.choice(sources)
+            feedback_text = self.rng.choice(feedback_texts)
+            rating = self.rng.randint(1, 5)
+            source = self.rng.choice(sources)
             
             # Simple sentiment based on rating
             if rating >= 4:
-                sentiment_score = round(random.uniform(0.6, 1.0), 2)
+                sentiment_score = round(self.rng.uniform(0.6, 1.0), 2)
                 sentiment_label = 'POSITIVE'
             elif rating >= 3:
-                sentiment_score = round(random.uniform(-0.2, 0.2), 2)
+                sentiment_score = round(self.rng.uniform(-0.2, 0.2), 2)
                 sentiment_label = 'NEUTRAL'
             else:
-                sentiment_score = round(random.uniform(-1.0, -0.3), 2)
+                sentiment_score = round(self.rng.uniform(-1.0, -0.3), 2)
                 sentiment_label = 'NEGATIVE'
             
-            feedback_date = datetime.now() - timedelta(days=random.randint(1, 180))
-            processed_date = feedback_date + timedelta(hours=random.randint(1, 24))
+            feedback_date = self.reference_date - timedelta(days=self.rng.randint(1, 180))
+            processed_date = feedback_date + timedelta(hours=self.rng.randint(1, 24))
             
             keywords = "ARRAY_CONSTRUCT('quality', 'service', 'delivery')"
             themes = f"ARRAY_CONSTRUCT('{sentiment_label.lower()}', 'product_feedback')"
@@ -1152,20 +1204,15 @@ AUTHOR, CREATED_DATE, UPDATED_DATE, IS_ACTIVE, TAGS, METADATA) VALUES
                           f"'{feedback_text}', {rating}, '{feedback_date.strftime('%Y-%m-%d %H:%M:%S')}', "
                           f"'{source}', {sentiment_score}, '{sentiment_label}', "
                           f"'{processed_date.strftime('%Y-%m-%d %H:%M:%S')}', {keywords}, {themes})")
-        
-        # Split into batches
-        batch_size = 100
-        batches = [inserts[i:i + batch_size] for i in range(0, len(inserts), batch_size)]
-        
-        result = ""
-        for i, batch in enumerate(batches):
-            result += f"""INSERT INTO CUSTOMER_FEEDBACK (FEEDBACK_ID, CUSTOMER_ID, PRODUCT_ID, FEEDBACK_TEXT, 
+            
+            # Emit full batches as soon as they are ready
+            if len(inserts) == batch_size or feedback_id == num_feedback:
+                yield f"""INSERT INTO CUSTOMER_FEEDBACK (FEEDBACK_ID, CUSTOMER_ID, PRODUCT_ID, FEEDBACK_TEXT, 
 RATING, FEEDBACK_DATE, SOURCE, SENTIMENT_SCORE, SENTIMENT_LABEL, PROCESSED_DATE, KEYWORDS, THEMES) VALUES
-{','.join(batch)};
+{','.join(inserts)};
 
 """
-        
-        return result
+                inserts = []
 
     def _load_sql_templates(self) -> Dict[str, str]:
         """Load SQL templates for different components"""
@@ -9,27 +9,48 @@ This module creates complete Streamlit apps based on client information and indu
 
 import os
 from typing import Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timedelta
+from urllib.parse import quote_plus
+
+from demo_generator import DEFAULT_SEED
+
+# Part of every build cache key; bump when the generated output changes
+GENERATOR_VERSION = 10
+
+
+def escape_string_literal(text: str) -> str:
+    """Escape text for use inside any generated Python string literal (single, double or triple quoted)"""
+    return text.replace('\\', '\\\\').replace("'", "\\'").replace('"', '\\"')
+
+
+def escape_fstring_literal(text: str) -> str:
+    """Escape text for use inside a generated f-string, where braces are also special"""
+    return escape_string_literal(text).replace('{', '{{').replace('}', '}}')
+
 
 class StreamlitGenerator:
     """Generates customized Streamlit applications"""
     
     def __init__(self):
         self.base_template = self._load_base_template()
-    
-    def generate_app(self, client_info: Dict[str, Any], output_dir: str = "output") -> str:
+        self.reference_date = datetime.now()
+        self.seed = DEFAULT_SEED
+        self.db_name = 'COMPANY_ANALYTICS'
+        self.aggregate_objects: Dict[str, str] = {}
+        self.instrumentation = False
+    
+    def generate_app(self, client_info: Dict[str, Any], output_dir: str = "output",
+                     demo_context: Dict[str, Any] = None) -> str:
         """Generate a complete Streamlit application for the client"""
         
         # Extract information
         company_name = client_info['name']
-        website_info = client_info['website_info']
-        industry = website_info['industry']
         
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
         # Generate app content
-        app_content = self._generate_app_content(client_info)
+        app_content = self._generate_app_content(client_info, demo_context)
         
         # Write to file
         filename = f"{company_name.lower().replace(' ', '_')}_cortex_demo.py"
@@ -40,23 +61,35 @@ class StreamlitGenerator:
         
         return filepath
     
-    def _generate_app_content(self, client_info: Dict[str, Any]) -> str:
+    def _generate_app_content(self, client_info: Dict[str, Any], demo_context: Dict[str, Any] = None) -> str:
         """Generate the complete Streamlit application content"""
         
-        company_name = client_info['name']
         website_info = client_info['website_info']
-        industry = website_info['industry']
         
-        # Import industry template
-        from demo_generator import DemoGenerator
-        generator = DemoGenerator()
-        template = generator.industry_templates[industry]
-        sample_data = generator.generate_sample_data(industry, company_name)
+        # Resolve industry template and sample data
+        if demo_context is None:
+            from demo_generator import DemoGenerator
+            demo_context = DemoGenerator().build_demo_context(client_info)
+        
+        company_name = demo_context['company_name']
+        industry = demo_context['industry']
+        template = demo_context['template']
+        sample_data = demo_context['sample_data']
+        self.reference_date = demo_context['reference_date']
+        self.seed = demo_context['seed']
+        self.db_name = demo_context['db_name']
+        self.instrumentation = demo_context['instrumentation']
+        
+        # The dashboard reads the analytical views, or their dynamic tables /
+        # materialized views when the aggregate mode precomputes them
+        from sql_generator import SQLGenerator
+        self.aggregate_objects = SQLGenerator().aggregate_objects(demo_context)
         
         # Generate sections
         header_section = self._generate_header(company_name, template)
         imports_section = self._generate_imports()
         config_section = self._generate_config(company_name, template)
+        instrumentation_section = self._generate_instrumentation(company_name)
         data_section = self._generate_data_simulation(sample_data, template)
         sidebar_section = self._generate_sidebar(company_name, template, website_info)
         introduction_section = self._generate_introduction(company_name, template, sample_data)
@@ -68,6 +101,13 @@ class StreamlitGenerator:
         alerts_section = self._generate_alerts_monitoring(company_name, template, sample_data)
         footer_section = self._generate_footer(company_name, template)
         
+        # Section timing wraps the whole if/elif chain: exactly one section runs per rerun
+        if self.instrumentation:
+            introduction_section = f"section_started = time.perf_counter()\n\n{introduction_section}"
+            alerts_section = (f"{alerts_section}\n\n"
+                              "record_timing('section', demo_section, time.perf_counter() - section_started)\n"
+                              "render_performance_panel()")
+        
         # Combine all sections
         app_content = f'''{header_section}
 
@@ -75,6 +115,8 @@ class StreamlitGenerator:
 
 {config_section}
 
+{instrumentation_section}
+
 {data_section}
 
 {sidebar_section}
@@ -101,7 +143,7 @@ class StreamlitGenerator:
     def _generate_header(self, company_name: str, template: Dict[str, Any]) -> str:
         """Generate the file header with documentation"""
         return f'''"""
-{company_name} - Snowflake Cortex {template['name']} Demo
+{escape_string_literal(company_name)} - Snowflake Cortex {template['name']} Demo
 {"=" * (len(company_name) + len(template['name']) + 25)}
 Comprehensive Streamlit application demonstrating Snowflake Cortex capabilities for {template['name'].lower()}:
 - Cortex Analyst (Natural Language Queries for {template['name']} Analytics)
@@ -110,7 +152,7 @@ Comprehensive Streamlit application demonstrating Snowflake Cortex capabilities
 - ML Predictive (Forecasting and Pattern Detection)
 
 Generated by: Multi-Modal Snowflake AI Demo Generator
-Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Generated on: {self.reference_date.strftime("%Y-%m-%d")}
 Industry: {template['name']}
 """'''
     
@@ -121,10 +163,15 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import snowflake.connector
-from snowflake.snowpark import Session
 import json
 import datetime
+import queue
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import numpy as np
 from typing import Dict, List, Any
 import base64
@@ -132,7 +179,7 @@ from io import StringIO'''
     
     def _generate_config(self, company_name: str, template: Dict[str, Any]) -> str:
         """Generate the Streamlit configuration and styling"""
-        safe_company_name = company_name.replace("'", "\\'")
+        safe_company_name = escape_string_literal(company_name)
         
         return f'''# =====================================================
 # APPLICATION CONFIGURATION
@@ -159,72 +206,194 @@ COMPANY_COLORS = {{
 # Custom CSS for {safe_company_name} branding
 st.markdown(f"""
 <style>
-    .main-header {{
+    .main-header {{{{
         background: linear-gradient(90deg, {{COMPANY_COLORS['primary']}} 0%, {{COMPANY_COLORS['secondary']}} 100%);
         padding: 1rem;
         border-radius: 10px;
         margin-bottom: 2rem;
         color: white;
         text-align: center;
-    }}
+    }}}}
     
-    .metric-card {{
+    .metric-card {{{{
         background: white;
         padding: 1rem;
         border-radius: 8px;
         border-left: 4px solid {{COMPANY_COLORS['primary']}};
         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
         margin-bottom: 1rem;
-    }}
+    }}}}
     
-    .section-header {{
+    .section-header {{{{
         color: {{COMPANY_COLORS['primary']}};
         border-bottom: 2px solid {{COMPANY_COLORS['secondary']}};
         padding-bottom: 0.5rem;
         margin-bottom: 1rem;
-    }}
+    }}}}
     
-    .alert-box {{
+    .alert-box {{{{
         padding: 1rem;
         border-radius: 8px;
         margin-bottom: 1rem;
-    }}
+    }}}}
     
-    .alert-success {{
+    .alert-success {{{{
         background-color: #D1FAE5;
         border-left: 4px solid {{COMPANY_COLORS['accent']}};
         color: #065F46;
-    }}
+    }}}}
     
-    .alert-warning {{
+    .alert-warning {{{{
         background-color: #FEF3C7;
         border-left: 4px solid {{COMPANY_COLORS['warning']}};
         color: #92400E;
-    }}
+    }}}}
     
-    .alert-danger {{
+    .alert-danger {{{{
         background-color: #FEE2E2;
         border-left: 4px solid {{COMPANY_COLORS['danger']}};
         color: #991B1B;
-    }}
+    }}}}
     
-    .stButton > button {{
+    .stButton > button {{{{
         background-color: {{COMPANY_COLORS['primary']}};
         color: white;
         border-radius: 6px;
         border: none;
         padding: 0.5rem 1rem;
         font-weight: 500;
-    }}
+    }}}}
     
-    .stButton > button:hover {{
+    .stButton > button:hover {{{{
         background-color: {{COMPANY_COLORS['secondary']}};
         transform: translateY(-1px);
         box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }}
+    }}}}
 </style>
 """, unsafe_allow_html=True)'''
     
+    def _generate_instrumentation(self, company_name: str) -> str:
+        """Generate the timing and cache counters, or no-op hooks when instrumentation is off"""
+        if not self.instrumentation:
+            return '''# =====================================================
+# INSTRUMENTATION (disabled when this app was generated)
+# =====================================================
+
+def record_timing(kind: str, name: str, seconds: float):
+    pass
+
+def record_cache_call(cache: str):
+    pass
+
+def record_cache_miss(cache: str):
+    pass
+
+def cortex_call(name: str, text: str):
+    return st.spinner(text)'''
+        
+        safe_company_name = escape_string_literal(company_name)
+        
+        return f'''# =====================================================
+# INSTRUMENTATION
+# =====================================================
+
+# Section renders, queries and Cortex calls are timed and cache calls and
+# misses counted for every session of the app; the sidebar "Performance"
+# panel shows them and exports them as JSON for comparing releases
+TIMING_SAMPLES = 1000
+
+class Instrumentation:
+    """Timings (last TIMING_SAMPLES per kind and name) and cache counters"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = datetime.datetime.now().isoformat(timespec="seconds")
+        self.timings: Dict[str, deque] = {{}}
+        self.cache_calls: Dict[str, int] = {{}}
+        self.cache_misses: Dict[str, int] = {{}}
+    
+    def record(self, kind: str, name: str, seconds: float):
+        with self.lock:
+            self.timings.setdefault(f"{{kind}}: {{name}}", deque(maxlen=TIMING_SAMPLES)).append(seconds * 1000)
+    
+    def count(self, counters: Dict[str, int], cache: str):
+        with self.lock:
+            counters[cache] = counters.get(cache, 0) + 1
+    
+    def summary(self) -> Dict[str, Any]:
+        """Per-timing statistics in milliseconds and per-cache hit rates"""
+        with self.lock:
+            timings = {{key: np.array(values) for key, values in self.timings.items()}}
+            calls, misses = dict(self.cache_calls), dict(self.cache_misses)
+        
+        return {{
+            "app": "{safe_company_name}",
+            "generator_version": {GENERATOR_VERSION},
+            "started": self.started,
+            "exported": datetime.datetime.now().isoformat(timespec="seconds"),
+            "timings_ms": {{
+                key: {{
+                    "count": int(values.size),
+                    "mean": round(float(values.mean()), 2),
+                    "p50": round(float(np.percentile(values, 50)), 2),
+                    "p95": round(float(np.percentile(values, 95)), 2),
+                    "max": round(float(values.max()), 2)
+                }}
+                for key, values in sorted(timings.items())
+            }},
+            "cache": {{
+                cache: {{
+                    "calls": count,
+                    "hits": max(count - misses.get(cache, 0), 0),
+                    "misses": misses.get(cache, 0),
+                    "hit_rate": round(max(count - misses.get(cache, 0), 0) / count, 3)
+                }}
+                for cache, count in sorted(calls.items())
+            }}
+        }}
+
+@st.cache_resource
+def get_instrumentation() -> Instrumentation:
+    """One collector for the whole app, kept across reruns and sessions"""
+    return Instrumentation()
+
+# Resolved on the script thread so query worker threads can record too
+PERF = get_instrumentation()
+
+def record_timing(kind: str, name: str, seconds: float):
+    PERF.record(kind, name, seconds)
+
+def record_cache_call(cache: str):
+    PERF.count(PERF.cache_calls, cache)
+
+def record_cache_miss(cache: str):
+    PERF.count(PERF.cache_misses, cache)
+
+@contextmanager
+def cortex_call(name: str, text: str):
+    """st.spinner that records how long the Cortex call inside it took"""
+    started = time.perf_counter()
+    with st.spinner(text):
+        yield
+    record_timing('cortex', name, time.perf_counter() - started)
+
+def render_performance_panel():
+    """Sidebar panel with the collected timings, cache hit rates and a JSON export"""
+    summary = PERF.summary()
+    with st.sidebar.expander("⏱️ Performance"):
+        if summary["timings_ms"]:
+            timings = pd.DataFrame.from_dict(summary["timings_ms"], orient="index")
+            st.dataframe(timings[["count", "p50", "p95", "max"]], use_container_width=True)
+        for cache, counts in summary["cache"].items():
+            st.caption(f"{{cache}} cache: {{counts['hits']}} hits, {{counts['misses']}} misses "
+                       f"({{counts['hit_rate']:.0%}})")
+        st.download_button(
+            "📥 Export JSON",
+            json.dumps(summary, indent=2),
+            file_name="{self.db_name.lower()}_performance.json",
+            mime="application/json"
+        )'''
+    
     def _generate_data_simulation(self, sample_data: Dict[str, Any], template: Dict[str, Any]) -> str:
         """Generate the data simulation section"""
         categories = sample_data['categories']
@@ -232,85 +401,232 @@ st.markdown(f"""
         customers = sample_data['customers']
         revenue_scale = sample_data['revenue_scale']
         
-        # Generate revenue figures based on scale
+        # Simulated history ends with the last full month before the reference date
         base_revenue = revenue_scale['monthly_base']
-        revenue_list = [int(base_revenue * (0.8 + i * 0.1)) for i in range(16)]
+        history_end = (self.reference_date.replace(day=1) - timedelta(days=1)).strftime('%Y-%m-%d')
         
         return f'''# =====================================================
 # SNOWFLAKE CONNECTION & DATA SIMULATION
 # =====================================================
 
+def get_secret(key: str, default: Any) -> Any:
+    """Value from st.secrets, or the default when the app has no secrets file"""
+    try:
+        return st.secrets.get(key, default)
+    except FileNotFoundError:
+        return default
+
+# Sessions shared by every viewer of the app; a viewer waits at most
+# QUERY_WAIT_SECONDS for a free one. Sessions idle longer than
+# SESSION_CHECK_SECONDS are pinged before reuse and replaced when dead.
+POOL_SIZE = int(get_secret("snowflake_pool_size", 4))
+QUERY_WAIT_SECONDS = 30
+SESSION_CHECK_SECONDS = 60
+QUERY_CACHE_TTL = 300
+
+# String literals and quoted identifiers are kept, comments and runs of whitespace collapse to one space
+_SQL_SPANS = re.compile(r"""('(?:[^']|'')*'|"[^"]*")|(?:\\s|--[^\\n]*|/\\*.*?\\*/)+""", re.S)
+
+def normalize_sql(query: str) -> str:
+    """Query text without comments or layout, so reformatted copies of a query share a cache entry"""
+    return _SQL_SPANS.sub(lambda match: match.group(1) or ' ', query).strip()
+
+class ConnectionPool:
+    """Bounded pool of Snowflake connections with health checks"""
+    
+    def __init__(self, connection_params: Dict[str, Any], size: int):
+        self.connection_params = connection_params
+        self.size = size
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle = queue.LifoQueue()
+    
+    def _connect(self):
+        import snowflake.connector  # Only needed once simulation is off
+        
+        # qmark binds values server side: "WHERE MONTH = ?" with params=[date]
+        return snowflake.connector.connect(paramstyle="qmark", **self.connection_params)
+    
+    @staticmethod
+    def _alive(connection) -> bool:
+        try:
+            if connection.is_closed():
+                return False
+            connection.cursor().execute("SELECT 1").fetchone()
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _discard(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a healthy connection, returning it to the pool afterwards"""
+        if not self.slots.acquire(timeout=QUERY_WAIT_SECONDS):
+            raise TimeoutError(f"All {{self.size}} Snowflake connections are busy")
+        connection = None
+        try:
+            while connection is None:
+                try:
+                    candidate, last_used = self.idle.get_nowait()
+                except queue.Empty:
+                    connection = self._connect()
+                    break
+                if time.monotonic() - last_used < SESSION_CHECK_SECONDS or self._alive(candidate):
+                    connection = candidate
+                else:
+                    self._discard(candidate)
+            
+            try:
+                yield connection
+            except Exception:
+                # A failed query usually leaves the connection usable; keep it only if it still answers
+                if not self._alive(connection):
+                    self._discard(connection)
+                    connection = None
+                raise
+        finally:
+            if connection is not None:
+                self.idle.put((connection, time.monotonic()))
+            self.slots.release()
+
 @st.cache_resource
-def init_snowflake_connection():
-    """Initialize Snowflake connection"""
+def init_connection_pool() -> ConnectionPool:
+    """Connection pool shared by all sessions of the app; connections open on first use"""
+    connection_params = {{
+        "user": get_secret("snowflake_user", "DEMO_USER"),
+        "password": get_secret("snowflake_password", "DEMO_PASSWORD"),
+        "account": get_secret("snowflake_account", "DEMO_ACCOUNT"),
+        "warehouse": get_secret("snowflake_warehouse", "CORTEX_WH"),
+        "database": "{self.db_name}",
+        "schema": "ANALYTICS",
+        "role": get_secret("snowflake_role", "{self.db_name}_ROLE")
+    }}
+    return ConnectionPool(connection_params, POOL_SIZE)
+
+def _fetch_frame(cursor) -> pd.DataFrame:
+    """Result set of an executed cursor, fetched as Arrow when pyarrow is available"""
     try:
-        connection_params = {{
-            "user": st.secrets.get("snowflake_user", "DEMO_USER"),
-            "password": st.secrets.get("snowflake_password", "DEMO_PASSWORD"),
-            "account": st.secrets.get("snowflake_account", "DEMO_ACCOUNT"),
-            "warehouse": st.secrets.get("snowflake_warehouse", "CORTEX_WH"),
-            "database": "COMPANY_ANALYTICS",
-            "schema": "CORTEX_DEMO",
-            "role": "ANALYTICS_ROLE"
-        }}
-        
-        session = Session.builder.configs(connection_params).create()
-        return session, True
-    except Exception as e:
-        st.error(f"Error connecting to Snowflake: {{str(e)}}")
-        return None, False
-
-@st.cache_data(ttl=300)
-def execute_query(query: str) -> pd.DataFrame:
-    """Execute query in Snowflake and return DataFrame"""
-    session, connected = init_snowflake_connection()
-    if not connected:
-        return pd.DataFrame()
-    
+        table = cursor.fetch_arrow_all()
+    except Exception:
+        # Connector installed without the pandas/pyarrow extra
+        return pd.DataFrame(cursor.fetchall(), columns=[column[0] for column in cursor.description])
+    if table is None:
+        return pd.DataFrame(columns=[column[0] for column in cursor.description])
+    return table.to_pandas()
+
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def _cached_query(sql: str, params: tuple) -> pd.DataFrame:
+    record_cache_miss('query')
+    with init_connection_pool().connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, list(params) if params else None)
+            return _fetch_frame(cursor)
+
+def execute_query(query: str, params: Any = ()) -> pd.DataFrame:
+    """Execute a query with bind parameters (qmark: ?) in Snowflake and return a DataFrame
+    
+    Values are always passed as params, never formatted into the SQL text.
+    Results are cached per normalized SQL and parameter values.
+    """
+    sql = normalize_sql(query)
+    record_cache_call('query')
+    started = time.perf_counter()
     try:
-        result = session.sql(query).to_pandas()
-        return result
+        return _cached_query(sql, tuple(params))
     except Exception as e:
         st.error(f"Error executing query: {{str(e)}}")
         return pd.DataFrame()
+    finally:
+        record_timing('query', sql[:60], time.perf_counter() - started)
+
+def execute_queries(queries: Dict[str, Any]) -> tuple:
+    """Run named queries concurrently on the connection pool and return them together
+    
+    queries maps a name to SQL or to (SQL, params). Returns the DataFrames and
+    the milliseconds each query took, by name; a failed query yields an empty
+    DataFrame and is reported once all have finished.
+    """
+    def run(query):
+        sql, params = query if isinstance(query, tuple) else (query, ())
+        record_cache_call('query')
+        started = time.perf_counter()
+        try:
+            return _cached_query(normalize_sql(sql), tuple(params)), None, time.perf_counter() - started
+        except Exception as e:
+            return pd.DataFrame(), e, time.perf_counter() - started
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(len(queries), POOL_SIZE))) as executor:
+        outcomes = dict(zip(queries, executor.map(run, queries.values())))
+    
+    frames, timings = {{}}, {{}}
+    for name, (frame, error, seconds) in outcomes.items():
+        if error is not None:
+            st.error(f"Error executing query '{{name}}': {{str(error)}}")
+        frames[name] = frame
+        timings[name] = seconds * 1000
+        record_timing('query', name, seconds)
+    return frames, timings
 
-def simulate_business_data():
+# Simulated history: fixed seed so every rerun and every viewer sees the same
+# numbers, years of daily rows generated as whole arrays
+SIMULATION_SEED = {self.seed}
+SIMULATION_DAYS = 3 * 365
+SIMULATION_END = '{history_end}'
+
+def simulate_business_data(days: int = SIMULATION_DAYS, seed: int = SIMULATION_SEED):
     """Simulate business data when Snowflake is not available"""
+    record_cache_call('simulation')
+    return _simulate_business_data(days, seed)
+
+@st.cache_data
+def _simulate_business_data(days: int, seed: int):
+    record_cache_miss('simulation')
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=SIMULATION_END, periods=days, freq='D')
+    weekend = dates.dayofweek.to_numpy() >= 5
     
-    # Monthly performance data
-    meses = pd.date_range('2023-01-01', periods=16, freq='ME')
-    revenue_data = {revenue_list}
-    transactions = [int(r * 0.1) for r in revenue_data]  # Scale transactions
-    new_customers = [int(r * 0.005) for r in revenue_data]  # Scale customers
+    # Daily revenue (K): linear growth from 80% to 230% of the base over the history, weekend lift, noise
+    daily_revenue = {base_revenue} / 30.4 * np.linspace(0.8, 2.3, days)
+    daily_revenue = daily_revenue * np.where(weekend, 1.15, 0.94) * rng.normal(1.0, 0.05, days)
     
+    # Monthly performance data
+    revenue_data = pd.Series(daily_revenue, index=dates).resample('ME').sum().round()
     performance_data = pd.DataFrame({{
-        'month': meses,
-        'revenue': revenue_data,
-        'transactions': transactions,
-        'new_customers': new_customers
+        'month': revenue_data.index,
+        'revenue': revenue_data.to_numpy(dtype=np.int64),
+        'transactions': (revenue_data.to_numpy() * 100).astype(np.int64),  # Scale transactions
+        'active_customers': (revenue_data.to_numpy() * 5).astype(np.int64)  # Scale customers
     }})
     
     # Category performance
+    categories = {categories}
+    position = np.arange(len(categories))
     categories_data = pd.DataFrame({{
-        'category': {categories},
-        'revenue': [int(sum(revenue_data) * (0.5 + i * 0.2) / len({categories})) for i in range(len({categories}))],
-        'growth': [round(10 + i * 5 + np.random.normal(0, 3), 1) for i in range(len({categories}))]
+        'category': categories,
+        'revenue': (revenue_data.tail(16).sum() * (0.5 + position * 0.2) / len(categories)).astype(np.int64),
+        'growth': np.round(10 + position * 5 + rng.normal(0, 3, len(categories)), 1)
     }})
     
     # Customer segments
+    segments = {customers}
+    position = np.arange(len(segments))
     segments_data = pd.DataFrame({{
-        'segment': {customers},
-        'count': [1000 + i * 500 + int(np.random.normal(0, 100)) for i in range(len({customers}))],
-        'avg_value': [500 + i * 200 + int(np.random.normal(0, 50)) for i in range(len({customers}))],
-        'churn_risk': [round(0.1 + i * 0.05 + np.random.normal(0, 0.02), 2) for i in range(len({customers}))]
+        'segment': segments,
+        'count': 1000 + position * 500 + rng.normal(0, 100, len(segments)).astype(np.int64),
+        'avg_value': 500 + position * 200 + rng.normal(0, 50, len(segments)).astype(np.int64),
+        'churn_risk': np.round(0.1 + position * 0.05 + rng.normal(0, 0.02, len(segments)), 2)
     }})
     
     # Support tickets simulation
-    num_days = 120
     support_data = pd.DataFrame({{
-        'date': pd.date_range('2024-01-01', periods=num_days, freq='D'),
-        'tickets': [10 + int(np.random.normal(0, 3)) + (5 if i % 7 in [0, 6] else 0) for i in range(num_days)],
-        'satisfaction': [4.2 + np.random.normal(0, 0.3) for _ in range(num_days)]
+        'date': dates,
+        'tickets': 10 + rng.normal(0, 3, days).astype(np.int64) + np.where(weekend, 5, 0),
+        'satisfaction': np.clip(4.2 + rng.normal(0, 0.3, days), 1.0, 5.0)
     }})
     
     return performance_data, categories_data, segments_data, support_data
@@ -332,7 +648,7 @@ def display_metric_card(title: str, value: str, delta: str = None, delta_color:
     
     def _generate_sidebar(self, company_name: str, template: Dict[str, Any], website_info: Dict[str, Any]) -> str:
         """Generate the sidebar navigation"""
-        safe_company_name = company_name.replace("'", "\\'")
+        safe_company_name = escape_string_literal(company_name)
         domain = website_info.get('domain', 'company.com')
         
         return f'''# =====================================================
@@ -348,7 +664,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 with st.sidebar:
-    st.image(f"https://via.placeholder.com/200x80/{template['primary_color'][1:]}/FFFFFF?text={company_name.replace(' ', '+')}", 
+    st.image(f"https://via.placeholder.com/200x80/{template['primary_color'][1:]}/FFFFFF?text={quote_plus(company_name)}", 
              caption="{template['name']}")
     
     st.markdown("### 🧭 Navigation")
@@ -394,7 +710,8 @@ with st.sidebar:
     
     def _generate_introduction(self, company_name: str, template: Dict[str, Any], sample_data: Dict[str, Any]) -> str:
         """Generate the introduction section"""
-        safe_company_name = company_name.replace("'", "\\'")
+        safe_company_name = escape_string_literal(company_name)
+        fstring_company_name = escape_fstring_literal(company_name)
         use_cases = sample_data['use_cases']
         
         return f'''# =====================================================
@@ -410,13 +727,13 @@ if demo_section == "🏠 Introduction":
         st.markdown(f"""
         ## {template['icon']} **Revolutionizing {template['name']} with Snowflake Cortex**
         
-        Welcome to {safe_company_name}'s comprehensive demonstration of **Snowflake Cortex AI capabilities for {template['name'].lower()}**. 
+        Welcome to {fstring_company_name}'s comprehensive demonstration of **Snowflake Cortex AI capabilities for {template['name'].lower()}**. 
         This interactive application showcases how modern {template['name'].lower()} organizations can leverage artificial intelligence 
         to transform their operations, decision-making processes, and customer experiences.
         
         ### 🎯 **What You'll Experience**
         
-        This demo simulates {safe_company_name}'s **real business environment** where advanced analytics and AI 
+        This demo simulates {fstring_company_name}'s **real business environment** where advanced analytics and AI 
         power data-driven decisions across all operational areas.
         """)
     
@@ -581,6 +898,15 @@ if demo_section == "🏠 Introduction":
     def _generate_dashboard(self, company_name: str, template: Dict[str, Any], sample_data: Dict[str, Any]) -> str:
         """Generate the executive dashboard section"""
         metrics = sample_data['metrics']
+        monthly_performance = self.aggregate_objects['V_MONTHLY_PERFORMANCE']
+        product_metrics = self.aggregate_objects['V_PRODUCT_METRICS']
+        segment_analysis = self.aggregate_objects['V_CUSTOMER_SEGMENT_ANALYSIS']
+        churn_risk = self.aggregate_objects['V_CUSTOMER_CHURN_RISK']
+        support_tickets = f"{self.db_name}.ANALYTICS.SUPPORT_TICKETS"
+        
+        # Category growth compares the last two full months of the sample data, which ends at the reference date
+        last_month = (self.reference_date.replace(day=1) - timedelta(days=1)).replace(day=1)
+        month_before = (last_month - timedelta(days=1)).replace(day=1)
         
         return f'''# =====================================================
 # SECTION 1: EXECUTIVE DASHBOARD
@@ -592,11 +918,47 @@ elif demo_section == "📊 Executive Dashboard":
     if use_simulation:
         performance_data, categories_data, segments_data, support_data = simulate_business_data()
     else:
-        # Real Snowflake queries would go here
-        performance_data = execute_query("SELECT * FROM performance_summary ORDER BY month")
-        categories_data = execute_query("SELECT * FROM category_performance")
-        segments_data = execute_query("SELECT * FROM customer_segments")
-        support_data = execute_query("SELECT * FROM support_metrics")
+        # Precomputed analytical objects, shaped like simulate_business_data(); all
+        # queries are declared here and run together on the connection pool
+        last_month = datetime.date.fromisoformat('{last_month:%Y-%m-%d}')
+        month_before = datetime.date.fromisoformat('{month_before:%Y-%m-%d}')
+        dashboard_queries = {{
+            'performance': """
+            SELECT MONTH AS "month", TOTAL_REVENUE / 1000 AS "revenue",
+                   TOTAL_TRANSACTIONS AS "transactions", UNIQUE_CUSTOMERS AS "active_customers"
+            FROM {monthly_performance}
+            ORDER BY MONTH""",
+            'categories': ("""
+            SELECT CATEGORY_NAME AS "category", SUM(TOTAL_REVENUE) / 1000 AS "revenue",
+                   ROUND(100 * (SUM(IFF(MONTH = ?, TOTAL_REVENUE, 0))
+                                / NULLIF(SUM(IFF(MONTH = ?, TOTAL_REVENUE, 0)), 0) - 1), 1) AS "growth"
+            FROM {product_metrics}
+            GROUP BY CATEGORY_NAME
+            ORDER BY "revenue" DESC""", (last_month, month_before)),
+            'segments': """
+            SELECT s.SEGMENT_NAME AS "segment", s.TOTAL_CUSTOMERS AS "count",
+                   ROUND(s.REVENUE_PER_CUSTOMER) AS "avg_value", ROUND(r.HIGH_RISK_SHARE, 2) AS "churn_risk"
+            FROM {segment_analysis} s
+            LEFT JOIN (
+                SELECT SEGMENT_ID, AVG(IFF(CHURN_RISK_LEVEL = 'HIGH', 1, 0)) AS HIGH_RISK_SHARE
+                FROM {churn_risk}
+                GROUP BY SEGMENT_ID
+            ) r ON s.SEGMENT_ID = r.SEGMENT_ID""",
+            'support': """
+            SELECT TO_DATE(CREATED_DATE) AS "date", COUNT(*) AS "tickets", AVG(SATISFACTION_RATING) AS "satisfaction"
+            FROM {support_tickets}
+            GROUP BY TO_DATE(CREATED_DATE)
+            ORDER BY TO_DATE(CREATED_DATE)"""
+        }}
+        
+        batch_started = time.perf_counter()
+        results, query_ms = execute_queries(dashboard_queries)
+        batch_ms = (time.perf_counter() - batch_started) * 1000
+        performance_data, categories_data, segments_data, support_data = (
+            results['performance'], results['categories'], results['segments'], results['support']
+        )
+        st.caption(f"⏱️ {{len(results)}} queries in {{batch_ms:,.0f}} ms · " +
+                   " · ".join(f"{{name}} {{ms:,.0f}} ms" for name, ms in query_ms.items()))
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -616,15 +978,15 @@ elif demo_section == "📊 Executive Dashboard":
         latest_transactions = performance_data['transactions'].iloc[-1] if not performance_data.empty else 0
         display_metric_card(
             "Transactions", 
-            f"{{latest_transactions:,.0f}}K", 
+            f"{{latest_transactions:,.0f}}", 
             "↗️ +12% vs previous month"
         )
     
     with col3:
-        latest_customers = performance_data['new_customers'].iloc[-1] if not performance_data.empty else 0
+        latest_customers = performance_data['active_customers'].iloc[-1] if not performance_data.empty else 0
         display_metric_card(
-            "New Customers", 
-            f"{{latest_customers:,.0f}}K", 
+            "Active Customers", 
+            f"{{latest_customers:,.0f}}", 
             "↗️ +8% vs previous month"
         )
     
@@ -754,7 +1116,7 @@ elif demo_section == "🤖 Cortex Analyst":
     )
     
     if st.button("🔍 Analyze") and user_question:
-        with st.spinner("Cortex Analyst is processing your question..."):
+        with cortex_call("Cortex Analyst", "Cortex Analyst is processing your question..."):
             
             st.markdown("#### 🤖 Cortex Analyst Response:")
             
@@ -844,6 +1206,8 @@ elif demo_section == "🤖 Cortex Analyst":
     
     def _generate_cortex_search(self, company_name: str, template: Dict[str, Any], industry: str) -> str:
         """Generate the Cortex Search section"""
+        fstring_company_name = escape_fstring_literal(company_name)
+        
         return f'''# =====================================================
 # SECTION 3: CORTEX SEARCH
 # =====================================================
@@ -859,7 +1223,7 @@ elif demo_section == "🔍 Cortex Search":
     st.markdown("### 📚 Available Knowledge Base")
     
     documents = [
-        f"📋 {company_name} - Operating Procedures Manual",
+        f"📋 {fstring_company_name} - Operating Procedures Manual",
         f"📊 {template['name']} Performance Standards Guide", 
         f"📈 Business Intelligence Best Practices",
         f"⚙️ System Administration Guidelines",
@@ -895,13 +1259,13 @@ elif demo_section == "🔍 Cortex Search":
     )
     
     if st.button("🚀 Search") and search_query:
-        with st.spinner("Cortex Search is analyzing documents..."):
+        with cortex_call("Cortex Search", "Cortex Search is analyzing documents..."):
             
             st.markdown("#### 🎯 Search Results:")
             
             if "procedure" in search_query.lower() or "operating" in search_query.lower():
                 st.markdown(f"""
-                **📋 {company_name} Operating Procedures** - Relevance: 95%
+                **📋 {fstring_company_name} Operating Procedures** - Relevance: 95%
                 
                 > **Standard Operating Procedures include:**  
                 > • Quality control checkpoints at each stage  
@@ -1022,7 +1386,7 @@ elif demo_section == "🎯 AISQL Multimodal":
         st.write(f"**Text:** {{feedback['text']}}")
         
         if st.button("🔍 Analyze with AISQL"):
-            with st.spinner("Processing with AISQL functions..."):
+            with cortex_call("AISQL Analysis", "Processing with AISQL functions..."):
                 
                 col1, col2 = st.columns(2)
                 
@@ -1107,7 +1471,7 @@ elif demo_section == "🎯 AISQL Multimodal":
         st.markdown("#### 🔍 Automated Data Classification")
         
         if st.button("🧠 Analyze Current Data Patterns"):
-            with st.spinner("Analyzing data patterns with AI..."):
+            with cortex_call("AISQL Data Patterns", "Analyzing data patterns with AI..."):
                 
                 st.success("""
                 **Pattern Analysis Complete** ✅
@@ -1157,7 +1521,7 @@ elif demo_section == "🎯 AISQL Multimodal":
         )
         
         if st.button("🔍 Discover Patterns") and pattern_types:
-            with st.spinner("Discovering patterns in your data..."):
+            with cortex_call("AISQL Pattern Discovery", "Discovering patterns in your data..."):
                 
                 results = []
                 
@@ -1270,7 +1634,7 @@ elif demo_section == "📈 ML Predictive":
         
         # Generate forecast data
         forecast_data = pd.DataFrame({{
-            'month': pd.date_range('2024-01-01', '2024-12-01', freq='M'),
+            'month': pd.date_range('2024-01-01', '2024-12-01', freq='MS'),
             'historical': [1200, 1350, 1280, 1400, None, None, None, None, None, None, None, None],
             'forecast': [None, None, None, None, 1450, 1520, 1480, 1600, 1550, 1680, 1620, 1750],
             'confidence_min': [None, None, None, None, 1350, 1420, 1380, 1500, 1450, 1580, 1520, 1650],
@@ -1475,7 +1839,7 @@ elif demo_section == "📈 ML Predictive":
         
         if trend_categories:
             # Generate trend data
-            months = pd.date_range('2023-01-01', '2024-04-01', freq='M')
+            months = pd.date_range('2023-01-01', '2024-04-01', freq='MS')
             
             trend_data = pd.DataFrame({{
                 'month': months,
@@ -1667,7 +2031,7 @@ elif demo_section == "⚠️ Alerts & Monitoring":
     
     # Simulate real-time data
     real_time_data = pd.DataFrame({{
-        'hour': pd.date_range('2024-04-30 08:00', periods=9, freq='H'),
+        'hour': pd.date_range('2024-04-30 08:00', periods=9, freq='h'),
         'performance': [95, 97, 94, 98, 92, 85, 88, 94, 96],
         'errors': [2, 1, 3, 0, 1, 8, 5, 2, 1],
         'quality_score': [4.5, 4.6, 4.4, 4.7, 4.3, 3.8, 4.0, 4.4, 4.5]
@@ -1765,7 +2129,7 @@ elif demo_section == "⚠️ Alerts & Monitoring":
     
     def _generate_footer(self, company_name: str, template: Dict[str, Any]) -> str:
         """Generate the footer section"""
-        safe_company_name = company_name.replace("'", "\\'")
+        fstring_company_name = escape_fstring_literal(company_name)
         
         return f'''# =====================================================
 # FOOTER
@@ -1774,7 +2138,7 @@ elif demo_section == "⚠️ Alerts & Monitoring":
 st.markdown("---")
 st.markdown(f"""
 <div style="text-align: center; color: {{COMPANY_COLORS['neutral']}}; padding: 2rem;">
-    <p><strong>{safe_company_name} - Snowflake Cortex {template['name']} Demo</strong></p>
+    <p><strong>{fstring_company_name} - Snowflake Cortex {template['name']} Demo</strong></p>
     <p>Demonstrating AI-powered analytics and intelligence capabilities for {template['name'].lower()}</p>
     <p>{template['icon']} {template['name']} Excellence | 🤖 Artificial Intelligence | 📊 Advanced Analytics | 🔍 Intelligent Insights</p>
 </div>
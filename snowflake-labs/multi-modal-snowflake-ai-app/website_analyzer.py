@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Website Analyzer
+================
+Concurrent website analysis for industry detection.
+
+Many domains are fetched at once over pooled HTTP connections (one keep-alive
+requests.Session per worker thread, driven from asyncio). Analyses are kept
+in a TTL'd on-disk cache: fresh entries are served without touching the
+network, stale ones are revalidated with ETag / Last-Modified so an
+unchanged page costs a 304 instead of a download and a re-score.
+
+The analyzer only needs a base URL, so it can be pointed at a local stand-in
+server (e.g. `python -m http.server`) for testing.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from keyword_scorer import KeywordScorer, SCORER_VERSION
+
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'websites')
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+INDUSTRY_KEYWORDS = {
+    'retail': ['shop', 'store', 'buy', 'product', 'cart', 'ecommerce', 'retail', 'fashion', 'clothing'],
+    'financial': ['bank', 'finance', 'investment', 'loan', 'credit', 'insurance', 'financial'],
+    'healthcare': ['health', 'medical', 'hospital', 'clinic', 'doctor', 'patient', 'healthcare'],
+    'manufacturing': ['manufacturing', 'factory', 'production', 'industrial', 'machinery', 'equipment'],
+    'technology': ['software', 'technology', 'tech', 'digital', 'cloud', 'api', 'platform']
+}
+
+DOMAIN_HINTS = [
+    ('retail', ['shop', 'store', 'retail', 'fashion']),
+    ('financial', ['bank', 'finance', 'invest']),
+    ('healthcare', ['health', 'medical', 'hospital']),
+    ('manufacturing', ['manufacturing', 'industrial'])
+]
+
+
+def normalize_url(url: str) -> str:
+    """Add a scheme to bare domains"""
+    url = url.strip()
+    return url if url.startswith(('http://', 'https://')) else 'https://' + url
+
+
+_scorer = KeywordScorer(INDUSTRY_KEYWORDS)
+
+
+def score_industries(content: str) -> Dict[str, Dict[str, int]]:
+    """Industry scores and per-keyword hit counts for a page's visible text"""
+    return _scorer.score(content)
+
+
+def industry_from_domain(domain: str) -> str:
+    """Fallback industry guess from the domain name alone"""
+    for industry, hints in DOMAIN_HINTS:
+        if any(word in domain for word in hints):
+            return industry
+    return 'technology'
+
+
+class WebsiteCache:
+    """TTL'd on-disk cache of website analyses, one JSON file per URL"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for a URL (fresh or stale), or None"""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry['fetched_at'] < self.ttl_seconds
+
+    def put(self, url: str, entry: Dict[str, Any]):
+        """Store an entry atomically so concurrent readers never see half a file"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+
+class WebsiteAnalyzer:
+    """Analyzes many company websites concurrently with pooled, cached HTTP"""
+
+    def __init__(self, max_concurrency: int = 16, timeout: float = 10, cache_dir: str = DEFAULT_CACHE_DIR,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS, use_cache: bool = True):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache = WebsiteCache(cache_dir, ttl_seconds) if use_cache else None
+        self._local = threading.local()
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    def analyze(self, url: str) -> Dict[str, Any]:
+        """Analyze a single website"""
+        return self.analyze_urls([url])[0]
+
+    def analyze_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Analyze websites concurrently, returning results in input order"""
+        return asyncio.run(self.analyze_many(urls))
+
+    async def analyze_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Coroutine form of analyze_urls for callers that already run an event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            async def analyze_one(url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await loop.run_in_executor(executor, self._analyze_blocking, url)
+
+            return await asyncio.gather(*(analyze_one(url) for url in urls))
+
+    # =====================================================
+    # FETCH AND SCORE
+    # =====================================================
+
+    def _session(self) -> requests.Session:
+        """Keep-alive session owned by the current worker thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = USER_AGENT
+            self._local.session = session
+        return session
+
+    def _analyze_blocking(self, url: str) -> Dict[str, Any]:
+        """Analyze one website, consulting and updating the cache"""
+        url = normalize_url(url)
+        domain = urlparse(url).netloc.lower()
+
+        entry = self.cache.get(url) if self.cache else None
+        if entry and entry.get('scorer_version') != SCORER_VERSION:
+            entry = None  # Scored with older matching rules
+        if entry and self.cache.is_fresh(entry):
+            return self._result(url, domain, entry, 'fresh')
+
+        # Revalidate a stale entry instead of downloading the page again
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self._session().get(url, headers=headers, timeout=self.timeout)
+
+            if response.status_code == 304 and entry:
+                entry['fetched_at'] = time.time()
+                self.cache.put(url, entry)
+                return self._result(url, domain, entry, 'revalidated')
+
+            scored = score_industries(response.text)
+
+            if self.cache and response.ok:
+                self.cache.put(url, {
+                    'url': url,
+                    'fetched_at': time.time(),
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'scorer_version': SCORER_VERSION,
+                    **scored
+                })
+            return self._result(url, domain, scored, 'miss')
+
+        except Exception:
+            # Prefer a stale analysis over guessing from the domain name
+            if entry:
+                return self._result(url, domain, entry, 'stale')
+            return self._result(url, domain, None, 'error')
+
+    def _result(self, url: str, domain: str, scored: Optional[Dict[str, Any]], cache_status: str) -> Dict[str, Any]:
+        """Shape an analysis like DemoGenerator.analyze_website's result"""
+        scores = scored['industry_scores'] if scored else {}
+        if scores:
+            best_industry = max(scores, key=scores.get)
+            confidence = scores[best_industry]
+        else:
+            best_industry = industry_from_domain(domain)
+            confidence = 0
+
+        return {
+            'company_name': domain.replace('www.', '').split('.')[0].title(),
+            'domain': domain,
+            'url': url,
+            'industry': best_industry,
+            'industry_confidence': confidence,
+            'industry_scores': scores,
+            'keyword_hits': scored['keyword_hits'] if scored else {},
+            'cache_status': cache_status
+        }
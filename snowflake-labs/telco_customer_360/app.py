@@ -4,10 +4,11 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import datetime as dt
 from datetime import timedelta
+import os
 import random
-from data_generator import generate_customer_data, generate_usage_data, generate_billing_data, generate_support_data
+from data_generator import DEFAULT_SEED, latest_as_of, load_datasets, build_partitioned_datasets, read_customer_rows
+from portfolio import as_dataset, churn_portfolio, risk_percentile, sales_portfolio
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -59,22 +60,101 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load or generate data
+NUM_CUSTOMERS = int(os.environ.get('TELCO_CUSTOMERS', 1000))
+# Larger customer bases run out of core: partitioned Parquet on disk, read one customer or column at a time
+IN_MEMORY_MAX_CUSTOMERS = 100_000
+
+# Load or generate data; generated datasets persist on disk across restarts (data_generator.load_datasets)
 @st.cache_data
-def load_data():
+def load_data(num_customers=NUM_CUSTOMERS, seed=DEFAULT_SEED, as_of=None):
     """Load all the telco customer data"""
-    customers = generate_customer_data(1000)
-    usage = generate_usage_data(customers)
-    billing = generate_billing_data(customers)
-    support = generate_support_data(customers)
+    datasets = load_datasets(num_customers, seed, as_of=as_of)
+    
+    return datasets['customers'], datasets['usage'], datasets['billing'], datasets['support']
+
+def index_by_customer(frame, customer_ids):
+    """Frame sorted by customer and the offsets of every customer's rows, in customer_ids order"""
+    codes = pd.Categorical(frame['customer_id'], categories=customer_ids).codes
+    order = np.argsort(codes, kind='stable')
+    offsets = np.searchsorted(codes[order], np.arange(len(customer_ids) + 1))
     
-    return customers, usage, billing, support
+    return frame.take(order).reset_index(drop=True), offsets
+
+# Built once and shared read-only by every session; pages copy slices before changing them
+@st.cache_resource(show_spinner="Preparing customer data...")
+def load_customer_index(num_customers=NUM_CUSTOMERS, seed=DEFAULT_SEED):
+    """Per-customer index over the telco data, so drill-downs only touch the selected customer's rows
+    
+    Out of core, the index is just the dataset folder: files are partitioned
+    by customer ID, which locates a customer's rows without scanning. The
+    data is pinned to the newest generated as-of date, which the pages use
+    as "today", so the app never regenerates just because the day changed.
+    """
+    out_of_core = num_customers > IN_MEMORY_MAX_CUSTOMERS
+    as_of = latest_as_of(num_customers, seed, layout='parquet' if out_of_core else 'arrow')
+    if out_of_core:
+        return {'path': build_partitioned_datasets(num_customers, seed, as_of=as_of), 'as_of': pd.Timestamp(as_of)}
+    
+    customers, usage, billing, support = load_data(num_customers, seed, as_of)
+    customer_ids = customers['customer_id'].tolist()
+    
+    return {
+        'as_of': pd.Timestamp(as_of),
+        'positions': {customer_id: position for position, customer_id in enumerate(customer_ids)},
+        'display': (customers['customer_id'] + " - " + customers['name']).tolist(),
+        'customers': customers,
+        'usage': index_by_customer(usage, customer_ids),
+        'billing': index_by_customer(billing, customer_ids),
+        'support': index_by_customer(support, customer_ids)
+    }
+
+@st.cache_data(max_entries=256)
+def read_partitioned_rows(path, dataset, customer_id):
+    """One customer's rows read from the partitioned Parquet files"""
+    return read_customer_rows(path, dataset, customer_id)
+
+def customer_record(index, customer_id):
+    """Profile row of one customer, or None for an unknown customer ID"""
+    if 'path' in index:
+        customer = read_partitioned_rows(index['path'], 'customers', customer_id)
+        return None if customer is None or customer.empty else customer.iloc[0]
+    
+    position = index['positions'].get(customer_id)
+    return None if position is None else index['customers'].iloc[position]
+
+def customer_rows(index, dataset, customer_id):
+    """Usage, billing or support rows of one customer"""
+    if 'path' in index:
+        return read_partitioned_rows(index['path'], dataset, customer_id)
+    
+    frame, offsets = index[dataset]
+    position = index['positions'][customer_id]
+    return frame.iloc[offsets[position]:offsets[position + 1]]
+
+def portfolio_source(index, dataset):
+    """pyarrow dataset of one of the telco datasets, for the portfolio aggregates"""
+    if 'path' in index:
+        return as_dataset(os.path.join(index['path'], dataset))
+    return as_dataset(index['customers'] if dataset == 'customers' else index[dataset][0])
+
+# Portfolio-wide aggregates are streamed column by column over every customer, then cached
+@st.cache_data(show_spinner="Aggregating the customer portfolio...")
+def load_churn_portfolio(num_customers=NUM_CUSTOMERS, seed=DEFAULT_SEED):
+    """Churn risk across all customers"""
+    index = load_customer_index(num_customers, seed)
+    return churn_portfolio(portfolio_source(index, 'customers'))
+
+@st.cache_data(show_spinner="Aggregating the customer portfolio...")
+def load_sales_portfolio(num_customers=NUM_CUSTOMERS, seed=DEFAULT_SEED):
+    """Service adoption and billing benchmarks across all customers"""
+    index = load_customer_index(num_customers, seed)
+    return sales_portfolio(portfolio_source(index, 'customers'), portfolio_source(index, 'billing'))
 
 def main():
     """Main application function"""
     
     # Load data
-    customers_df, usage_df, billing_df, support_df = load_data()
+    index = load_customer_index()
     
     # Sidebar navigation
     st.sidebar.title("📱 Telco Customer 360")
@@ -88,38 +168,48 @@ def main():
     
     # Customer selector
     st.sidebar.markdown("### Select Customer")
-    customer_list = customers_df[['customer_id', 'name']].copy()
-    customer_list['display'] = customer_list['customer_id'] + " - " + customer_list['name']
-    
-    selected_customer = st.sidebar.selectbox(
-        "Customer:",
-        customer_list['display'].tolist(),
-        help="Select a customer to view their 360° profile"
-    )
-    
-    customer_id = selected_customer.split(" - ")[0]
+    if 'path' in index:
+        # Millions of customers don't fit in a selectbox; look one up by ID instead
+        customer_id = st.sidebar.text_input(
+            "Customer ID:",
+            "CUST000001",
+            help=f"Customer ID between CUST000001 and CUST{NUM_CUSTOMERS:06d}"
+        ).strip().upper()
+        customer = customer_record(index, customer_id)
+        if customer is None:
+            st.sidebar.error(f"No customer with ID {customer_id}")
+            return
+        st.sidebar.markdown(f"**{customer['name']}**")
+    else:
+        selected_customer = st.sidebar.selectbox(
+            "Customer:",
+            index['display'],
+            help="Select a customer to view their 360° profile"
+        )
+        
+        customer_id = selected_customer.split(" - ")[0]
     
     # Page routing
     if page == "🏠 Customer Overview":
-        show_customer_overview(customers_df, usage_df, billing_df, support_df, customer_id)
+        show_customer_overview(index, customer_id)
     elif page == "📊 Usage Analytics":
-        show_usage_analytics(customers_df, usage_df, customer_id)
+        show_usage_analytics(index, customer_id)
     elif page == "💰 Billing & Revenue":
-        show_billing_revenue(customers_df, billing_df, customer_id)
+        show_billing_revenue(index, customer_id)
     elif page == "⚠️ Churn Risk Analysis":
-        show_churn_analysis(customers_df, usage_df, billing_df, support_df, customer_id)
+        show_churn_analysis(index, customer_id)
     elif page == "🎯 Customer Journey":
-        show_customer_journey(customers_df, support_df, customer_id)
+        show_customer_journey(index, customer_id)
     elif page == "📈 Sales Opportunities":
-        show_sales_opportunities(customers_df, usage_df, billing_df, customer_id)
+        show_sales_opportunities(index, customer_id)
 
-def show_customer_overview(customers_df, usage_df, billing_df, support_df, customer_id):
+def show_customer_overview(index, customer_id):
     """Customer Overview page"""
     
     st.markdown('<div class="main-header">🏠 Customer Overview</div>', unsafe_allow_html=True)
     
     # Get customer data
-    customer = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
+    customer = customer_record(index, customer_id)
     
     # Customer basic info
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -138,13 +228,13 @@ def show_customer_overview(customers_df, usage_df, billing_df, support_df, custo
         """, unsafe_allow_html=True)
     
     with col2:
-        tenure_months = (dt.datetime.now() - pd.to_datetime(customer['signup_date'])).days // 30
+        tenure_months = (index['as_of'] - pd.to_datetime(customer['signup_date'])).days // 30
         st.metric("Tenure (Months)", tenure_months)
         st.metric("Credit Score", customer['credit_score'])
         
     with col3:
         # Calculate monthly revenue
-        customer_billing = billing_df[billing_df['customer_id'] == customer_id]
+        customer_billing = customer_rows(index, 'billing', customer_id)
         avg_monthly_revenue = customer_billing['amount'].mean() if not customer_billing.empty else 0
         
         st.metric("Monthly Revenue", f"${avg_monthly_revenue:.2f}")
@@ -177,11 +267,12 @@ def show_customer_overview(customers_df, usage_df, billing_df, support_df, custo
     col1, col2, col3, col4 = st.columns(4)
     
     # Get recent data
-    recent_usage = usage_df[(usage_df['customer_id'] == customer_id) & 
-                           (usage_df['date'] >= (dt.datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))]
+    cutoff = index['as_of'] - timedelta(days=30)
+    customer_usage = customer_rows(index, 'usage', customer_id)
+    recent_usage = customer_usage[pd.to_datetime(customer_usage['date']) >= cutoff]
     
-    recent_support = support_df[(support_df['customer_id'] == customer_id) & 
-                               (support_df['date'] >= (dt.datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))]
+    customer_support = customer_rows(index, 'support', customer_id)
+    recent_support = customer_support[pd.to_datetime(customer_support['date']) >= cutoff]
     
     with col1:
         avg_data_usage = recent_usage['data_usage_gb'].mean() if not recent_usage.empty else 0
@@ -199,14 +290,14 @@ def show_customer_overview(customers_df, usage_df, billing_df, support_df, custo
         satisfaction = customer['satisfaction_score']
         st.metric("Satisfaction Score", f"{satisfaction}/10")
 
-def show_usage_analytics(customers_df, usage_df, customer_id):
+def show_usage_analytics(index, customer_id):
     """Usage Analytics page"""
     
     st.markdown('<div class="main-header">📊 Usage Analytics</div>', unsafe_allow_html=True)
     
     # Get customer and usage data
-    customer = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
-    customer_usage = usage_df[usage_df['customer_id'] == customer_id].copy()
+    customer = customer_record(index, customer_id)
+    customer_usage = customer_rows(index, 'usage', customer_id).copy()
     customer_usage['date'] = pd.to_datetime(customer_usage['date'])
     customer_usage = customer_usage.sort_values('date')
     
@@ -258,7 +349,7 @@ def show_usage_analytics(customers_df, usage_df, customer_id):
     
     with col3:
         # Usage distribution
-        fig_dist = px.histogram(customer_usage, x='data_usage_gb', bins=20,
+        fig_dist = px.histogram(customer_usage, x='data_usage_gb', nbins=20,
                                title='Data Usage Distribution')
         fig_dist.update_layout(height=300)
         st.plotly_chart(fig_dist, use_container_width=True)
@@ -284,14 +375,14 @@ def show_usage_analytics(customers_df, usage_df, customer_id):
         total_sms = customer_usage['sms_count'].sum()
         st.metric("Total SMS", f"{total_sms:,}")
 
-def show_billing_revenue(customers_df, billing_df, customer_id):
+def show_billing_revenue(index, customer_id):
     """Billing & Revenue page"""
     
     st.markdown('<div class="main-header">💰 Billing & Revenue</div>', unsafe_allow_html=True)
     
     # Get customer and billing data
-    customer = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
-    customer_billing = billing_df[billing_df['customer_id'] == customer_id].copy()
+    customer = customer_record(index, customer_id)
+    customer_billing = customer_rows(index, 'billing', customer_id).copy()
     customer_billing['bill_date'] = pd.to_datetime(customer_billing['bill_date'])
     customer_billing = customer_billing.sort_values('bill_date')
     
@@ -340,13 +431,13 @@ def show_billing_revenue(customers_df, billing_df, customer_id):
     recent_bills['due_date'] = pd.to_datetime(recent_bills['due_date']).dt.strftime('%Y-%m-%d')
     st.dataframe(recent_bills, use_container_width=True)
 
-def show_churn_analysis(customers_df, usage_df, billing_df, support_df, customer_id):
+def show_churn_analysis(index, customer_id):
     """Churn Risk Analysis page"""
     
     st.markdown('<div class="main-header">⚠️ Churn Risk Analysis</div>', unsafe_allow_html=True)
     
     # Get customer data
-    customer = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
+    customer = customer_record(index, customer_id)
     churn_risk = customer['churn_risk_score']
     
     # Risk level classification
@@ -391,14 +482,14 @@ def show_churn_analysis(customers_df, usage_df, billing_df, support_df, customer
             risk_factors.append("❌ New customer (< 6 months)")
         
         # Check recent support tickets
-        recent_support = support_df[(support_df['customer_id'] == customer_id) & 
-                                   (support_df['date'] >= (dt.datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))]
+        customer_support = customer_rows(index, 'support', customer_id)
+        recent_support = customer_support[pd.to_datetime(customer_support['date']) >= index['as_of'] - timedelta(days=30)]
         if len(recent_support) > 3:
             risk_factors.append("❌ High support ticket volume")
         
         # Check payment history
-        late_payments = len(billing_df[(billing_df['customer_id'] == customer_id) & 
-                                      (billing_df['payment_status'] == 'Late')])
+        customer_billing = customer_rows(index, 'billing', customer_id)
+        late_payments = int((customer_billing['payment_status'] == 'Late').sum())
         if late_payments > 2:
             risk_factors.append("❌ Multiple late payments")
         
@@ -408,6 +499,25 @@ def show_churn_analysis(customers_df, usage_df, billing_df, support_df, customer
         for factor in risk_factors:
             st.markdown(factor)
     
+    # Portfolio context
+    st.markdown("### 📊 Portfolio Churn Risk")
+    
+    portfolio = load_churn_portfolio()
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.metric("Customers", f"{portfolio['customers']:,}")
+        st.metric("High Risk Customers", f"{portfolio['levels']['HIGH']:,}",
+                  f"{portfolio['levels']['HIGH'] / max(portfolio['customers'], 1):.1%} of portfolio", delta_color="off")
+        st.metric("Riskier Than", f"{risk_percentile(portfolio, churn_risk):.0%} of customers")
+    
+    with col2:
+        by_account_type = portfolio['by_account_type'].reset_index(names='Account Type')
+        fig_portfolio = px.bar(by_account_type, x='Account Type', y='Avg Churn Score',
+                               color='High Risk Share', title='Churn Risk by Account Type')
+        fig_portfolio.update_layout(height=300)
+        st.plotly_chart(fig_portfolio, use_container_width=True)
+    
     # Churn prevention recommendations
     st.markdown("### 🎯 Retention Recommendations")
     
@@ -454,14 +564,14 @@ def show_churn_analysis(customers_df, usage_df, billing_df, support_df, customer
         for strategy in strategies:
             st.markdown(f"- {strategy}")
 
-def show_customer_journey(customers_df, support_df, customer_id):
+def show_customer_journey(index, customer_id):
     """Customer Journey page"""
     
     st.markdown('<div class="main-header">🎯 Customer Journey</div>', unsafe_allow_html=True)
     
     # Get customer and support data
-    customer = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
-    customer_support = support_df[support_df['customer_id'] == customer_id].copy()
+    customer = customer_record(index, customer_id)
+    customer_support = customer_rows(index, 'support', customer_id).copy()
     customer_support['date'] = pd.to_datetime(customer_support['date'])
     customer_support = customer_support.sort_values('date', ascending=False)
     
@@ -470,7 +580,7 @@ def show_customer_journey(customers_df, support_df, customer_id):
     
     # Key milestones
     signup_date = pd.to_datetime(customer['signup_date'])
-    today = pd.Timestamp.now()
+    today = index['as_of']
     
     col1, col2, col3 = st.columns(3)
     
@@ -581,15 +691,15 @@ def show_customer_journey(customers_df, support_df, customer_id):
         for item in attention:
             st.markdown(item)
 
-def show_sales_opportunities(customers_df, usage_df, billing_df, customer_id):
+def show_sales_opportunities(index, customer_id):
     """Sales Opportunities page"""
     
     st.markdown('<div class="main-header">📈 Sales Opportunities</div>', unsafe_allow_html=True)
     
     # Get customer data
-    customer = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
-    customer_usage = usage_df[usage_df['customer_id'] == customer_id]
-    customer_billing = billing_df[billing_df['customer_id'] == customer_id]
+    customer = customer_record(index, customer_id)
+    customer_usage = customer_rows(index, 'usage', customer_id)
+    customer_billing = customer_rows(index, 'billing', customer_id)
     
     # Opportunity scoring
     st.markdown("### 🎯 Opportunity Assessment")
@@ -600,6 +710,8 @@ def show_sales_opportunities(customers_df, usage_df, billing_df, customer_id):
     
     # Calculate opportunity scores
     opportunities = []
+    portfolio = load_sales_portfolio()
+    peer_adoption = portfolio['adoption'].loc[customer['account_type']]
     
     # Service expansion opportunities
     for service in missing_services:
@@ -617,7 +729,8 @@ def show_sales_opportunities(customers_df, usage_df, billing_df, customer_id):
             'opportunity': f"Add {service} Service",
             'score': min(1.0, score),
             'potential_revenue': random.uniform(25, 150),
-            'reasoning': f"Customer profile suggests good fit for {service}"
+            'reasoning': f"Customer profile suggests good fit for {service} "
+                         f"({peer_adoption[service]:.0%} of {customer['account_type']} customers have it)"
         })
     
     # Usage-based opportunities
@@ -684,6 +797,23 @@ def show_sales_opportunities(customers_df, usage_df, billing_df, customer_id):
             potential_increase = (total_potential / current_revenue) * 100 if current_revenue > 0 else 0
             st.metric("Potential Increase", f"{potential_increase:.1f}%")
     
+    # Portfolio benchmarks
+    st.markdown(f"### 📊 {customer['account_type']} Portfolio Benchmarks")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        fig_adoption = px.bar(x=peer_adoption.index, y=peer_adoption.values,
+                              color=[service in current_services for service in peer_adoption.index],
+                              labels={'x': 'Service', 'y': 'Adoption', 'color': 'Customer Has It'},
+                              title=f"Service Adoption among {customer['account_type']} Customers")
+        fig_adoption.update_layout(height=300, yaxis_tickformat='.0%')
+        st.plotly_chart(fig_adoption, use_container_width=True)
+    
+    with col2:
+        st.metric("Avg Monthly Bill (All Customers)", f"${portfolio['avg_monthly_bill']:.2f}")
+        st.metric("Late Payment Rate (All Customers)", f"{portfolio['late_payment_rate']:.1%}")
+    
     # Next best actions
     st.markdown("### 📋 Recommended Next Actions")
     
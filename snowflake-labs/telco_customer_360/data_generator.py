@@ -2,269 +2,554 @@ import pandas as pd
 import numpy as np
 import datetime as dt
 from datetime import timedelta
+import json
+import os
 import random
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from faker import Faker
 
 fake = Faker()
 np.random.seed(42)
 random.seed(42)
 
-def generate_customer_data(num_customers=1000):
-    """Generate realistic customer data"""
-    
-    customers = []
+# Part of every dataset cache key; bump when the generated data changes
+GENERATOR_VERSION = 2
+DEFAULT_SEED = 42
+DATASET_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'datasets')
+DATASETS = ('customers', 'usage', 'billing', 'support')
+
+# Out-of-core layout: customers are generated in partitions of consecutive IDs, one
+# Parquet file per dataset and partition; row groups small enough that reading one
+# customer's rows touches a few hundred thousand rows at most
+PARTITION_CUSTOMERS = 100_000
+ROW_GROUP_ROWS = 131_072
+CUSTOMER_ID_PATTERN = re.compile(r'CUST(\d+)')
+
+# Identity pool: Faker values sampled once and cached on disk; customers are
+# assembled from it by index instead of calling Faker for every row
+IDENTITY_POOL_SIZE = 5000
+IDENTITY_POOL_SEED = 42
+IDENTITY_POOL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+IDENTITY_FIELDS = {
+    'first_name': lambda faker: faker.first_name(),
+    'last_name': lambda faker: faker.last_name(),
+    'email_domain': lambda faker: faker.free_email_domain(),
+    'phone': lambda faker: faker.phone_number(),
+    'street_name': lambda faker: faker.street_name(),
+    'city': lambda faker: faker.city(),
+    'state': lambda faker: faker.state_abbr(),
+    'zip_code': lambda faker: faker.zipcode()
+}
+
+ACCOUNT_TYPES = ['Individual', 'Family', 'Business', 'Enterprise']
+ACCOUNT_TYPE_WEIGHTS = [0.4, 0.35, 0.2, 0.05]
+ALL_SERVICES = ['Mobile', 'Internet', 'TV', 'Phone', 'Security', 'Cloud', 'IoT']
+# Number of services by account type (more likely to have multiple services for higher tier accounts)
+SERVICE_COUNTS = {
+    'Individual': ([1, 2, 3], [0.5, 0.3, 0.2]),
+    'Family': ([2, 3, 4], [0.3, 0.4, 0.3]),
+    'Business': ([3, 4, 5], [0.3, 0.4, 0.3]),
+    'Enterprise': ([4, 5, 6, 7], [0.2, 0.3, 0.3, 0.2])
+}
+SATISFACTION_WEIGHTS = [0.02, 0.03, 0.05, 0.08, 0.12, 0.15, 0.2, 0.15, 0.12, 0.08]
+
+def load_identity_pool(size=IDENTITY_POOL_SIZE, seed=IDENTITY_POOL_SEED, cache_dir=IDENTITY_POOL_DIR):
+    """Pre-sampled Faker values by field, read from the disk cache or generated once and saved"""
     
-    for i in range(num_customers):
-        customer_id = f"CUST{str(i+1).zfill(6)}"
-        
-        # Basic demographics
-        name = fake.name()
-        email = fake.email()
-        phone = fake.phone_number()
-        address = fake.street_address()
-        city = fake.city()
-        state = fake.state_abbr()
-        zip_code = fake.zipcode()
-        
-        # Account details
-        account_types = ['Individual', 'Family', 'Business', 'Enterprise']
-        account_type = np.random.choice(account_types, p=[0.4, 0.35, 0.2, 0.05])
-        
-        # Services (more likely to have multiple services for higher tier accounts)
-        all_services = ['Mobile', 'Internet', 'TV', 'Phone', 'Security', 'Cloud', 'IoT']
-        if account_type == 'Individual':
-            num_services = np.random.choice([1, 2, 3], p=[0.5, 0.3, 0.2])
-        elif account_type == 'Family':
-            num_services = np.random.choice([2, 3, 4], p=[0.3, 0.4, 0.3])
-        elif account_type == 'Business':
-            num_services = np.random.choice([3, 4, 5], p=[0.3, 0.4, 0.3])
-        else:  # Enterprise
-            num_services = np.random.choice([4, 5, 6, 7], p=[0.2, 0.3, 0.3, 0.2])
-        
-        services = ','.join(np.random.choice(all_services, num_services, replace=False))
-        
-        # Signup date (last 5 years)
-        signup_date = fake.date_between(start_date='-5y', end_date='today')
-        
-        # Credit score
-        credit_score = np.random.normal(700, 80)
-        credit_score = max(300, min(850, int(credit_score)))
-        
-        # Satisfaction score (1-10)
-        satisfaction_score = np.random.choice(range(1, 11), p=[0.02, 0.03, 0.05, 0.08, 0.12, 0.15, 0.2, 0.15, 0.12, 0.08])
-        
-        # Churn risk factors
-        tenure_months = (dt.datetime.now().date() - signup_date).days // 30
+    path = os.path.join(cache_dir, f"identity_pool_{fake.locales[0]}_{size}_{seed}.json")
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            pool = json.load(f)
+    else:
+        faker = Faker(fake.locales[0])
+        faker.seed_instance(seed)
+        pool = {field: [sample(faker) for _ in range(size)] for field, sample in IDENTITY_FIELDS.items()}
         
-        # Calculate churn risk based on multiple factors
-        churn_score = 0
-        if satisfaction_score <= 5:
-            churn_score += 0.3
-        if tenure_months < 6:
-            churn_score += 0.2
-        if account_type in ['Individual', 'Family']:
-            churn_score += 0.1
-        
-        churn_score += np.random.normal(0, 0.1)
-        churn_score = max(0, min(1, churn_score))
-        
-        customers.append({
-            'customer_id': customer_id,
-            'name': name,
-            'email': email,
-            'phone': phone,
-            'address': address,
-            'city': city,
-            'state': state,
-            'zip_code': zip_code,
-            'account_type': account_type,
-            'services': services,
-            'signup_date': signup_date,
-            'credit_score': credit_score,
-            'satisfaction_score': satisfaction_score,
-            'churn_risk_score': churn_score,
-            'tenure_months': tenure_months
-        })
-    
-    return pd.DataFrame(customers)
+        # Written to a temporary file and renamed, so concurrent app processes never read half a pool
+        os.makedirs(cache_dir, exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump(pool, f, ensure_ascii=False)
+        os.replace(temporary_path, path)
+    
+    return {field: np.array(values, dtype=object) for field, values in pool.items()}
+
+def _weighted_choice(rng, values, weights, size):
+    """size weighted draws from values, by inverting the cumulative weights"""
+    return np.asarray(values)[np.searchsorted(np.cumsum(weights)[:-1], rng.random(size), side='right')]
 
-def generate_usage_data(customers_df):
-    """Generate usage data for the last 90 days"""
+def generate_customer_data(num_customers=1000, first_id=1, as_of=None):
+    """Generate realistic customer data
     
-    usage_data = []
-    end_date = dt.datetime.now().date()
-    start_date = end_date - timedelta(days=90)
+    Identity fields are drawn by index from the cached identity pool; the
+    rest, churn score included, is computed as array expressions over all
+    customers at once. IDs are numbered from first_id; signup dates and
+    tenure count back from as_of (default: today).
+    """
     
-    for _, customer in customers_df.iterrows():
-        customer_id = customer['customer_id']
-        services = customer['services'].split(',')
-        account_type = customer['account_type']
-        
-        # Generate data for each day
-        current_date = start_date
-        while current_date <= end_date:
-            
-            # Base usage patterns by account type
-            if account_type == 'Individual':
-                base_data_gb = np.random.normal(5, 2)
-                base_call_minutes = np.random.normal(120, 40)
-                base_sms = np.random.normal(50, 20)
-            elif account_type == 'Family':
-                base_data_gb = np.random.normal(15, 5)
-                base_call_minutes = np.random.normal(300, 80)
-                base_sms = np.random.normal(200, 60)
-            elif account_type == 'Business':
-                base_data_gb = np.random.normal(25, 8)
-                base_call_minutes = np.random.normal(600, 150)
-                base_sms = np.random.normal(100, 30)
-            else:  # Enterprise
-                base_data_gb = np.random.normal(100, 30)
-                base_call_minutes = np.random.normal(1500, 300)
-                base_sms = np.random.normal(500, 100)
-            
-            # Weekend vs weekday patterns
-            if current_date.weekday() >= 5:  # Weekend
-                data_usage_gb = base_data_gb * np.random.uniform(1.2, 1.8)
-                call_minutes = base_call_minutes * np.random.uniform(0.6, 1.0)
-            else:  # Weekday
-                data_usage_gb = base_data_gb * np.random.uniform(0.8, 1.2)
-                call_minutes = base_call_minutes * np.random.uniform(0.9, 1.3)
-            
-            # Ensure non-negative values
-            data_usage_gb = max(0, data_usage_gb)
-            call_minutes = max(0, call_minutes)
-            sms_count = max(0, int(base_sms + np.random.normal(0, 10)))
-            
-            # Network quality (1-5 scale)
-            network_quality = np.random.choice([1, 2, 3, 4, 5], p=[0.05, 0.1, 0.2, 0.4, 0.25])
-            
-            # Data roaming (occasional)
-            roaming_gb = np.random.exponential(0.1) if np.random.random() < 0.05 else 0
-            
-            usage_data.append({
-                'customer_id': customer_id,
-                'date': current_date,
-                'data_usage_gb': round(data_usage_gb, 2),
-                'call_minutes': round(call_minutes, 0),
-                'sms_count': sms_count,
-                'network_quality': network_quality,
-                'roaming_gb': round(roaming_gb, 2)
-            })
-            
-            current_date += timedelta(days=1)
-    
-    return pd.DataFrame(usage_data)
+    # Seeded from the global state, so np.random.seed() keeps runs reproducible
+    rng = np.random.default_rng(np.random.randint(2**32))
+    pool = load_identity_pool()
+    
+    def sample(field):
+        return rng.integers(0, len(pool[field]), num_customers)
+    
+    def handles(field):
+        # Lowercase letters only, computed once per pool value rather than per customer
+        return pd.Series(pool[field]).str.lower().str.replace(r"[^a-z]", '', regex=True).to_numpy(dtype=object)
+    
+    customer_id = 'CUST' + pd.Series(np.arange(first_id, first_id + num_customers)).astype(str).str.zfill(6)
+    
+    # Basic demographics
+    first, last = sample('first_name'), sample('last_name')
+    email = (handles('first_name')[first] + '.' + handles('last_name')[last]
+             + rng.integers(1, 1000, num_customers).astype(str).astype(object)
+             + '@' + pool['email_domain'][sample('email_domain')])
+    address = rng.integers(1, 10000, num_customers).astype(str).astype(object) + ' ' + pool['street_name'][sample('street_name')]
+    
+    # Account details
+    account_type = _weighted_choice(rng, np.array(ACCOUNT_TYPES, dtype=object), ACCOUNT_TYPE_WEIGHTS, num_customers)
+    
+    # Services: the first num_services of a random ordering of all services, each
+    # subset rendered as a bitmask whose string is built once
+    num_services = np.zeros(num_customers, dtype=np.int64)
+    for account, (counts, weights) in SERVICE_COUNTS.items():
+        rows = account_type == account
+        num_services[rows] = _weighted_choice(rng, counts, weights, rows.sum())
+    ranks = rng.random((num_customers, len(ALL_SERVICES))).argsort(axis=1).argsort(axis=1)
+    masks = (ranks < num_services[:, None]) @ (1 << np.arange(len(ALL_SERVICES)))
+    subsets = np.array([
+        ','.join(service for bit, service in enumerate(ALL_SERVICES) if mask >> bit & 1)
+        for mask in range(1 << len(ALL_SERVICES))
+    ], dtype=object)
+    
+    # Signup date (last 5 years)
+    today = as_of or dt.date.today()
+    history_days = (today - (pd.Timestamp(today) - pd.DateOffset(years=5)).date()).days
+    signup_date = np.datetime64(today, 'D') - rng.integers(0, history_days + 1, num_customers)
+    
+    # Credit score
+    credit_score = np.clip(rng.normal(700, 80, num_customers).astype(int), 300, 850)
+    
+    # Satisfaction score (1-10)
+    satisfaction_score = _weighted_choice(rng, np.arange(1, 11), SATISFACTION_WEIGHTS, num_customers)
+    
+    # Churn risk factors
+    tenure_months = (np.datetime64(today, 'D') - signup_date).astype(int) // 30
+    
+    # Calculate churn risk based on multiple factors
+    churn_score = (0.3 * (satisfaction_score <= 5)
+                   + 0.2 * (tenure_months < 6)
+                   + 0.1 * np.isin(account_type, ['Individual', 'Family'])
+                   + rng.normal(0, 0.1, num_customers))
+    
+    return pd.DataFrame({
+        'customer_id': customer_id,
+        'name': pool['first_name'][first] + ' ' + pool['last_name'][last],
+        'email': email,
+        'phone': pool['phone'][sample('phone')],
+        'address': address,
+        'city': pool['city'][sample('city')],
+        'state': pool['state'][sample('state')],
+        'zip_code': pool['zip_code'][sample('zip_code')],
+        'account_type': account_type,
+        'services': subsets[masks],
+        'signup_date': signup_date.astype(object),
+        'credit_score': credit_score,
+        'satisfaction_score': satisfaction_score,
+        'churn_risk_score': np.clip(churn_score, 0, 1),
+        'tenure_months': tenure_months
+    })
 
-def generate_billing_data(customers_df):
-    """Generate billing data for the last 12 months"""
+# Daily usage baselines by account type: (mean, std) of data GB, call minutes and SMS
+USAGE_BASELINES = {
+    'Individual': ((5, 2), (120, 40), (50, 20)),
+    'Family': ((15, 5), (300, 80), (200, 60)),
+    'Business': ((25, 8), (600, 150), (100, 30)),
+    'Enterprise': ((100, 30), (1500, 300), (500, 100))
+}
+
+# Day-to-day multiplier ranges: (low, high) on weekdays and on weekends
+DATA_MULTIPLIERS = {'weekday': (0.8, 1.2), 'weekend': (1.2, 1.8)}
+CALL_MULTIPLIERS = {'weekday': (0.9, 1.3), 'weekend': (0.6, 1.0)}
+
+def generate_usage_data(customers_df, days=90, as_of=None):
+    """Generate usage data for the 90 days up to as_of (default: today)
     
-    billing_data = []
+    The whole (customer x day) grid is drawn at once: account-type baselines
+    broadcast down the customer axis, weekday/weekend multipliers across the
+    day axis. Rows come out customer by customer in date order.
+    """
     
-    for _, customer in customers_df.iterrows():
-        customer_id = customer['customer_id']
-        services = customer['services'].split(',')
-        account_type = customer['account_type']
-        
-        # Base monthly charges by service
-        service_costs = {
-            'Mobile': 45, 'Internet': 65, 'TV': 85, 'Phone': 25,
-            'Security': 35, 'Cloud': 55, 'IoT': 15
-        }
-        
-        # Account type multipliers
-        type_multipliers = {
-            'Individual': 1.0, 'Family': 1.8, 'Business': 2.5, 'Enterprise': 5.0
-        }
-        
-        base_monthly_cost = sum([service_costs.get(service.strip(), 30) for service in services])
-        base_monthly_cost *= type_multipliers[account_type]
-        
-        # Generate last 12 months
-        for month_offset in range(12):
-            bill_date = (dt.datetime.now().date().replace(day=1) - timedelta(days=30*month_offset))
-            
-            # Add some variation to monthly bills
-            monthly_variation = np.random.normal(1.0, 0.15)
-            amount = base_monthly_cost * monthly_variation
-            
-            # Add overage charges occasionally
-            if np.random.random() < 0.2:
-                overage = np.random.uniform(10, 50)
-                amount += overage
-            
-            # Payment status
-            payment_status = np.random.choice(['Paid', 'Late', 'Pending'], p=[0.85, 0.1, 0.05])
-            
-            # Late fees
-            if payment_status == 'Late':
-                amount += np.random.uniform(5, 25)
-            
-            billing_data.append({
-                'customer_id': customer_id,
-                'bill_date': bill_date,
-                'amount': round(amount, 2),
-                'payment_status': payment_status,
-                'due_date': bill_date + timedelta(days=30),
-                'services_billed': len(services)
-            })
-    
-    return pd.DataFrame(billing_data)
+    # Seeded from the global state, so np.random.seed() keeps runs reproducible
+    rng = np.random.default_rng(np.random.randint(2**32))
+    
+    end_date = pd.Timestamp(as_of or dt.date.today())
+    dates = pd.date_range(end=end_date, periods=days + 1, freq='D')
+    grid = (len(customers_df), len(dates))
+    
+    # Base usage patterns by account type, one (mean, std) row per customer
+    type_codes = pd.Categorical(customers_df['account_type'], categories=list(USAGE_BASELINES)).codes
+    baselines = np.array(list(USAGE_BASELINES.values()), dtype=float)[type_codes]
+    
+    def base_usage(metric):
+        usage = rng.standard_normal(grid)
+        usage *= baselines[:, metric, 1, None]
+        usage += baselines[:, metric, 0, None]
+        return usage
+    
+    # Weekend vs weekday patterns
+    weekend = dates.dayofweek.to_numpy() >= 5
+    
+    def apply_multiplier(usage, ranges):
+        low = np.where(weekend, ranges['weekend'][0], ranges['weekday'][0])
+        high = np.where(weekend, ranges['weekend'][1], ranges['weekday'][1])
+        factor = rng.random(grid)
+        factor *= high - low
+        factor += low
+        usage *= factor
+        return usage
+    
+    # Ensure non-negative values; grids are updated in place to keep peak memory
+    # at a few copies of the grid even for millions of customer-days
+    data_usage_gb = np.round(np.maximum(apply_multiplier(base_usage(0), DATA_MULTIPLIERS), 0), 2)
+    call_minutes = np.round(np.maximum(apply_multiplier(base_usage(1), CALL_MULTIPLIERS), 0), 0)
+    sms = base_usage(2)
+    sms += rng.normal(0, 10, grid)
+    sms_count = np.maximum(sms.astype(np.int64), 0)
+    del sms
+    
+    # Network quality (1-5 scale), sampled by inverting the cumulative weights
+    quality_weights = np.cumsum([0.05, 0.1, 0.2, 0.4, 0.25])
+    network_quality = np.searchsorted(quality_weights[:-1], rng.random(grid), side='right').astype(np.int8) + 1
+    
+    # Data roaming (occasional)
+    roaming_gb = rng.exponential(0.1, grid)
+    roaming_gb[rng.random(grid) >= 0.05] = 0
+    
+    return pd.DataFrame({
+        # Categorical: one code per row instead of millions of repeated strings
+        'customer_id': pd.Categorical.from_codes(np.repeat(np.arange(grid[0], dtype=np.int32), grid[1]),
+                                                 categories=pd.Index(customers_df['customer_id'])),
+        'date': np.tile(dates.to_numpy(), grid[0]),
+        'data_usage_gb': data_usage_gb.ravel(),
+        'call_minutes': call_minutes.ravel(),
+        'sms_count': sms_count.ravel(),
+        'network_quality': network_quality.ravel(),
+        'roaming_gb': np.round(roaming_gb, 2).ravel()
+    }, copy=False)
 
-def generate_support_data(customers_df):
-    """Generate customer support interaction data"""
+# Base monthly charges by service and account type multipliers
+SERVICE_COSTS = {
+    'Mobile': 45, 'Internet': 65, 'TV': 85, 'Phone': 25,
+    'Security': 35, 'Cloud': 55, 'IoT': 15
+}
+TYPE_MULTIPLIERS = {
+    'Individual': 1.0, 'Family': 1.8, 'Business': 2.5, 'Enterprise': 5.0
+}
+PAYMENT_STATUSES = (['Paid', 'Late', 'Pending'], [0.85, 0.1, 0.05])
+
+def generate_billing_data(customers_df, months=12, as_of=None):
+    """Generate billing data for the 12 months up to as_of (default: today)
     
-    support_data = []
+    Drawn as a (customer x month) grid; rows come out customer by customer,
+    newest bill first.
+    """
     
-    for _, customer in customers_df.iterrows():
-        customer_id = customer['customer_id']
-        satisfaction = customer['satisfaction_score']
-        
-        # Number of support tickets based on satisfaction
-        if satisfaction <= 3:
-            avg_tickets = 8
-        elif satisfaction <= 6:
-            avg_tickets = 4
-        else:
-            avg_tickets = 1
+    # Seeded from the global state, so np.random.seed() keeps runs reproducible
+    rng = np.random.default_rng(np.random.randint(2**32))
+    grid = (len(customers_df), months)
+    
+    # Costs are worked out once per distinct service list, not per customer
+    subset_codes, subsets = pd.factorize(customers_df['services'])
+    subset_costs = np.array([sum(SERVICE_COSTS.get(service.strip(), 30) for service in subset.split(',')) for subset in subsets])
+    subset_sizes = np.array([len(subset.split(',')) for subset in subsets])
+    base_monthly_cost = subset_costs[subset_codes] * customers_df['account_type'].map(TYPE_MULTIPLIERS).to_numpy(dtype=float)
+    
+    # Generate last 12 months
+    first_of_month = (as_of or dt.date.today()).replace(day=1)
+    bill_dates = pd.to_datetime([first_of_month - timedelta(days=30*month_offset) for month_offset in range(months)])
+    
+    # Add some variation to monthly bills
+    amount = rng.normal(1.0, 0.15, grid)
+    amount *= base_monthly_cost[:, None]
+    
+    # Add overage charges occasionally
+    overage = rng.random(grid) < 0.2
+    amount[overage] += rng.uniform(10, 50, overage.sum())
+    
+    # Payment status and late fees
+    payment_status = _weighted_choice(rng, np.array(PAYMENT_STATUSES[0], dtype=object), PAYMENT_STATUSES[1], grid)
+    late = payment_status == 'Late'
+    amount[late] += rng.uniform(5, 25, late.sum())
+    
+    return pd.DataFrame({
+        'customer_id': pd.Categorical.from_codes(np.repeat(np.arange(grid[0], dtype=np.int32), months),
+                                                 categories=pd.Index(customers_df['customer_id'])),
+        'bill_date': np.tile(bill_dates.to_numpy(), grid[0]),
+        'amount': np.round(amount, 2).ravel(),
+        'payment_status': payment_status.ravel(),
+        'due_date': np.tile((bill_dates + pd.Timedelta(days=30)).to_numpy(), grid[0]),
+        'services_billed': np.repeat(subset_sizes[subset_codes], months)
+    }, copy=False)
+
+# Support tickets: average tickets over 6 months by satisfaction (up to the score),
+# ticket types, priorities (complaints skew higher) and resolution hours by priority
+TICKET_RATES = [(3, 8), (6, 4), (10, 1)]
+TICKET_TYPES = (['Billing', 'Technical', 'Service', 'Sales', 'Complaint'], [0.3, 0.25, 0.2, 0.15, 0.1])
+PRIORITIES = ['Low', 'Medium', 'High', 'Critical']
+PRIORITY_WEIGHTS = {'Complaint': [0.1, 0.3, 0.4, 0.2], 'Other': [0.4, 0.35, 0.2, 0.05]}
+RESOLUTION_HOURS = {'Low': (24, 168), 'Medium': (12, 72), 'High': (4, 24), 'Critical': (1, 6)}
+TICKET_STATUSES = (['Resolved', 'Open', 'In Progress'], [0.8, 0.1, 0.1])
+
+def generate_support_data(customers_df, as_of=None):
+    """Generate customer support interaction data for the 6 months up to as_of (default: today)
+    
+    Ticket counts are drawn per customer, then every ticket attribute for
+    all customers at once; rows come out customer by customer.
+    """
+    
+    # Seeded from the global state, so np.random.seed() keeps runs reproducible
+    rng = np.random.default_rng(np.random.randint(2**32))
+    
+    # Number of support tickets based on satisfaction
+    satisfaction = customers_df['satisfaction_score'].to_numpy()
+    limits, rates = zip(*TICKET_RATES)
+    num_tickets = rng.poisson(np.array(rates)[np.searchsorted(limits, satisfaction)])
+    owner = np.repeat(np.arange(len(customers_df), dtype=np.int32), num_tickets)
+    size = len(owner)
+    
+    # Random date in last 6 months
+    today = as_of or dt.date.today()
+    history_days = (today - (pd.Timestamp(today) - pd.DateOffset(months=6)).date()).days
+    ticket_date = np.datetime64(today, 'D') - rng.integers(0, history_days + 1, size)
+    
+    # Ticket types and priorities
+    ticket_type = _weighted_choice(rng, np.array(TICKET_TYPES[0], dtype=object), TICKET_TYPES[1], size)
+    complaint = ticket_type == 'Complaint'
+    priority = np.empty(size, dtype=object)
+    priority[complaint] = _weighted_choice(rng, np.array(PRIORITIES, dtype=object), PRIORITY_WEIGHTS['Complaint'], complaint.sum())
+    priority[~complaint] = _weighted_choice(rng, np.array(PRIORITIES, dtype=object), PRIORITY_WEIGHTS['Other'], size - complaint.sum())
+    
+    # Resolution time based on priority
+    low, high = np.array([RESOLUTION_HOURS[level] for level in PRIORITIES], dtype=float).T
+    level = pd.Categorical(priority, categories=PRIORITIES).codes
+    resolution_hours = low[level] + rng.random(size) * (high[level] - low[level])
+    
+    # Status
+    status = _weighted_choice(rng, np.array(TICKET_STATUSES[0], dtype=object), TICKET_STATUSES[1], size)
+    
+    return pd.DataFrame({
+        'customer_id': pd.Categorical.from_codes(owner, categories=pd.Index(customers_df['customer_id'])),
+        'ticket_id': 'TKT' + rng.integers(0, 10**8, size).astype(str).astype(object),
+        'date': ticket_date.astype('datetime64[ns]'),
+        'type': ticket_type,
+        'priority': priority,
+        'status': status,
+        'resolution_hours': np.round(resolution_hours, 1),
+        'agent_id': 'AGT' + rng.integers(0, 10**4, size).astype(str).astype(object)
+    }, copy=False)
+
+def generate_datasets(num_customers=1000, seed=DEFAULT_SEED, as_of=None):
+    """Generate customers, usage, billing and support from a fixed seed, dated up to as_of (default: today)"""
+    
+    np.random.seed(seed)
+    random.seed(seed)
+    fake.seed_instance(seed)
+    as_of = as_of or dt.date.today()
+    
+    customers = generate_customer_data(num_customers, as_of=as_of)
+    return {
+        'customers': customers,
+        'usage': generate_usage_data(customers, as_of=as_of),
+        'billing': generate_billing_data(customers, as_of=as_of),
+        'support': generate_support_data(customers, as_of=as_of)
+    }
+
+def _dataset_key_dir(num_customers, seed, cache_dir, layout):
+    """Folder holding every as-of date generated for a (seed, size, generator version, layout)"""
+    return os.path.join(cache_dir, f"v{GENERATOR_VERSION}_seed{seed}_n{num_customers}_{layout}")
+
+def _published_dates(key_dir):
+    """As-of dates published under a key folder, oldest first"""
+    if not os.path.isdir(key_dir):
+        return []
+    return sorted(entry for entry in os.listdir(key_dir) if not entry.endswith('.tmp'))
+
+def latest_as_of(num_customers, seed=DEFAULT_SEED, cache_dir=DATASET_CACHE_DIR, layout='arrow'):
+    """Newest as-of date already generated for a key, or today when there is none
+    
+    Apps pin their data to this date rather than to the calendar, so a new
+    day never triggers a rebuild; a newer date is only generated on request
+    (python data_generator.py --as-of).
+    """
+    dates = _published_dates(_dataset_key_dir(num_customers, seed, cache_dir, layout))
+    return dt.date.fromisoformat(dates[-1]) if dates else dt.date.today()
+
+def dataset_cache_path(num_customers, seed, cache_dir=DATASET_CACHE_DIR, layout='arrow', as_of=None):
+    """Folder holding a generated dataset for a (seed, size, generator version, layout) as of a date
+    
+    Every generator counts back from its as-of date, so the date names the
+    folder; without one the newest generated date is used.
+    """
+    as_of = as_of or latest_as_of(num_customers, seed, cache_dir, layout)
+    return os.path.join(_dataset_key_dir(num_customers, seed, cache_dir, layout), as_of.isoformat())
+
+def _publish(temporary_path, path):
+    """Rename a finished dataset folder into place
+    
+    Published folders are never removed here: other app processes may
+    still have their files mapped or read them lazily. prune_datasets
+    clears older dates when nothing is running.
+    """
+    
+    try:
+        os.rename(temporary_path, path)
+    except OSError:
+        shutil.rmtree(temporary_path, ignore_errors=True)  # Another replica published it first
+
+def prune_datasets(num_customers, seed=DEFAULT_SEED, cache_dir=DATASET_CACHE_DIR, layout='parquet'):
+    """Remove every as-of date of a key but the newest; only run it while no app reads the cache"""
+    
+    key_dir = _dataset_key_dir(num_customers, seed, cache_dir, layout)
+    removed = _published_dates(key_dir)[:-1]
+    for entry in removed:
+        shutil.rmtree(os.path.join(key_dir, entry), ignore_errors=True)
+    return removed
+
+def load_datasets(num_customers=1000, seed=DEFAULT_SEED, cache_dir=DATASET_CACHE_DIR, as_of=None):
+    """Customers, usage, billing and support, memory-mapped from the dataset cache
+    
+    The first process to ask for a key generates the data and publishes it
+    with an atomic rename; every later start, in this or any other app
+    replica sharing the folder, maps the uncompressed Arrow files instead
+    of generating again. Without as_of the newest generated date is loaded
+    (see latest_as_of). Without pyarrow the data is generated every time.
+    """
+    
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return generate_datasets(num_customers, seed, as_of)
+    
+    path = dataset_cache_path(num_customers, seed, cache_dir, as_of=as_of)
+    if not os.path.isdir(path):
+        datasets = generate_datasets(num_customers, seed, dt.date.fromisoformat(os.path.basename(path)))
         
-        num_tickets = np.random.poisson(avg_tickets)
+        # Written next to the final folder and renamed into place, so readers never see half a dataset
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        os.makedirs(temporary_path, exist_ok=True)
+        for name, frame in datasets.items():
+            feather.write_feather(frame, os.path.join(temporary_path, f"{name}.arrow"), compression='uncompressed')
+        _publish(temporary_path, path)
+        return datasets
+    
+    return {
+        name: feather.read_table(os.path.join(path, f"{name}.arrow"), memory_map=True).to_pandas()
+        for name in DATASETS
+    }
+
+def _write_partition(path, seed, partition, first_id, num_customers, as_of):
+    """Generate one partition of customers and write each dataset to its Parquet file"""
+    
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    # Seeded per partition, so partitions can be generated in any order or process
+    np.random.seed([seed, partition])
+    
+    customers = generate_customer_data(num_customers, first_id, as_of)
+    for name, generate in (('customers', None), ('usage', generate_usage_data),
+                           ('billing', generate_billing_data), ('support', generate_support_data)):
+        frame = customers if generate is None else generate(customers, as_of=as_of)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
         
-        for _ in range(num_tickets):
-            # Random date in last 6 months
-            ticket_date = fake.date_between(start_date='-6m', end_date='today')
-            
-            # Ticket types and priorities
-            ticket_types = ['Billing', 'Technical', 'Service', 'Sales', 'Complaint']
-            ticket_type = np.random.choice(ticket_types, p=[0.3, 0.25, 0.2, 0.15, 0.1])
-            
-            priorities = ['Low', 'Medium', 'High', 'Critical']
-            if ticket_type == 'Complaint':
-                priority = np.random.choice(priorities, p=[0.1, 0.3, 0.4, 0.2])
-            else:
-                priority = np.random.choice(priorities, p=[0.4, 0.35, 0.2, 0.05])
-            
-            # Resolution time based on priority
-            if priority == 'Critical':
-                resolution_hours = np.random.uniform(1, 6)
-            elif priority == 'High':
-                resolution_hours = np.random.uniform(4, 24)
-            elif priority == 'Medium':
-                resolution_hours = np.random.uniform(12, 72)
-            else:
-                resolution_hours = np.random.uniform(24, 168)
-            
-            # Status
-            status = np.random.choice(['Resolved', 'Open', 'In Progress'], p=[0.8, 0.1, 0.1])
-            
-            support_data.append({
-                'customer_id': customer_id,
-                'ticket_id': f"TKT{fake.random_number(digits=8)}",
-                'date': ticket_date,
-                'type': ticket_type,
-                'priority': priority,
-                'status': status,
-                'resolution_hours': round(resolution_hours, 1),
-                'agent_id': f"AGT{fake.random_number(digits=4)}"
-            })
-    
-    return pd.DataFrame(support_data) 
\ No newline at end of file
+        # Plain strings: Parquet dictionary-encodes them per row group and keeps
+        # min/max statistics, so customer lookups skip every other row group
+        table = table.set_column(0, 'customer_id', table['customer_id'].cast(pa.string()))
+        pq.write_table(table, os.path.join(path, name, f"part-{partition:05d}.parquet"), row_group_size=ROW_GROUP_ROWS)
+        del frame, table
+
+def build_partitioned_datasets(num_customers, seed=DEFAULT_SEED, workers=None,
+                               partition_customers=PARTITION_CUSTOMERS, cache_dir=DATASET_CACHE_DIR, as_of=None):
+    """Folder of partitioned Parquet datasets for num_customers, generated in chunks when missing
+    
+    Each worker process holds one partition of PARTITION_CUSTOMERS customers
+    at a time, so memory stays flat however many customers are generated.
+    The folder is published like load_datasets' cache, for as_of or the
+    newest generated date, and holds a manifest.json describing the layout.
+    """
+    
+    path = dataset_cache_path(num_customers, seed, cache_dir, layout='parquet', as_of=as_of)
+    if os.path.isdir(path):
+        return path
+    as_of = dt.date.fromisoformat(os.path.basename(path))
+    
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    for name in DATASETS:
+        os.makedirs(os.path.join(temporary_path, name), exist_ok=True)
+    
+    load_identity_pool()  # Cached once here rather than by every worker at the same time
+    partitions = range((num_customers + partition_customers - 1) // partition_customers)
+    with ProcessPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(_write_partition, temporary_path, seed, partition, partition * partition_customers + 1,
+                        min(partition_customers, num_customers - partition * partition_customers), as_of)
+            for partition in partitions
+        ]
+        for future in futures:
+            future.result()
+    
+    with open(os.path.join(temporary_path, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump({'num_customers': num_customers, 'seed': seed, 'generator_version': GENERATOR_VERSION,
+                   'as_of': as_of.isoformat(), 'partition_customers': partition_customers,
+                   'datasets': list(DATASETS)}, f)
+    _publish(temporary_path, path)
+    return path
+
+def read_customer_rows(path, name, customer_id):
+    """One customer's rows of a partitioned dataset, or None for an unknown customer ID
+    
+    Customer IDs are numbered, so the partition holding a customer is known
+    without scanning; inside it only row groups whose customer_id range
+    covers the ID are read.
+    """
+    
+    import pyarrow.parquet as pq
+    
+    with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    match = CUSTOMER_ID_PATTERN.fullmatch(customer_id.strip().upper())
+    if not match or not 1 <= int(match.group(1)) <= manifest['num_customers']:
+        return None
+    customer_id = f"CUST{int(match.group(1)):06d}"
+    partition = (int(match.group(1)) - 1) // manifest['partition_customers']
+    
+    table = pq.read_table(os.path.join(path, name, f"part-{partition:05d}.parquet"),
+                          filters=[('customer_id', '==', customer_id)])
+    return table.to_pandas()
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Generate the partitioned Parquet datasets of the out-of-core telco app")
+    parser.add_argument('--customers', type=int, default=5_000_000, help="Number of customers")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Random seed")
+    parser.add_argument('--workers', type=int, help="Partitions generated in parallel (default: up to 4)")
+    parser.add_argument('--as-of', type=dt.date.fromisoformat,
+                        help="Date the data counts back from, YYYY-MM-DD (default: the newest generated, else today)")
+    parser.add_argument('--prune', action='store_true',
+                        help="Then remove older as-of dates of these datasets; only while no app is running")
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    path = build_partitioned_datasets(args.customers, args.seed, args.workers, as_of=args.as_of)
+    print(f"{args.customers:,} customers in {path} ({time.perf_counter() - started:.1f}s)")
+    
+    if args.prune:
+        for entry in prune_datasets(args.customers, args.seed):
+            print(f"Removed as-of {entry}")
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from data_generator import ACCOUNT_TYPES, ALL_SERVICES
+
+# Churn scores are counted in 100 buckets; risk levels and percentiles are read off the counts
+SCORE_BUCKETS = 100
+RISK_LEVELS = {'HIGH': 0.7, 'MEDIUM': 0.4, 'LOW': 0.0}
+
+def as_dataset(source):
+    """pyarrow dataset over a folder of Parquet files or an in-memory DataFrame"""
+    if isinstance(source, pd.DataFrame):
+        return ds.dataset(pa.Table.from_pandas(source, preserve_index=False))
+    return ds.dataset(source, format='parquet')
+
+def _grouped_sums(batch, columns):
+    """Per-account-type row count and column sums of one record batch"""
+    table = pa.Table.from_batches([batch]).select(['account_type'] + list(columns))
+    grouped = table.group_by('account_type').aggregate([('account_type', 'count')] + [(column, 'sum') for column in columns])
+    return grouped.to_pandas().set_index('account_type')
+
+def churn_portfolio(customers):
+    """Churn risk across the whole customer base
+
+    customers is a pyarrow dataset; only the columns needed are read, one
+    record batch at a time, and partial sums are added up, so memory use
+    does not grow with the number of customers.
+    """
+
+    buckets = np.zeros(SCORE_BUCKETS, dtype=np.int64)
+    totals = pd.DataFrame(0.0, index=ACCOUNT_TYPES, columns=['account_type_count', 'churn_risk_score_sum',
+                                                             'high_risk_sum', 'satisfaction_score_sum'])
+
+    for batch in customers.to_batches(columns=['account_type', 'churn_risk_score', 'satisfaction_score']):
+        if batch.num_rows == 0:
+            continue
+        score = batch.column('churn_risk_score')
+        high_risk = pc.cast(pc.greater_equal(score, RISK_LEVELS['HIGH']), pa.int64())
+        batch = pa.RecordBatch.from_arrays(batch.columns + [high_risk], names=batch.schema.names + ['high_risk'])
+        totals = totals.add(_grouped_sums(batch, ['churn_risk_score', 'high_risk', 'satisfaction_score']), fill_value=0)
+
+        bucket = np.minimum((score.to_numpy(zero_copy_only=False) * SCORE_BUCKETS).astype(np.int64), SCORE_BUCKETS - 1)
+        buckets += np.bincount(bucket, minlength=SCORE_BUCKETS)
+
+    count = totals['account_type_count']
+    by_account_type = pd.DataFrame({
+        'Customers': count.astype(np.int64),
+        'Avg Churn Score': totals['churn_risk_score_sum'] / count,
+        'High Risk Share': totals['high_risk_sum'] / count,
+        'Avg Satisfaction': totals['satisfaction_score_sum'] / count
+    }).loc[count > 0]
+
+    # Risk levels as in the churn page: HIGH from 0.7, MEDIUM from 0.4
+    edges = [int(round(threshold * SCORE_BUCKETS)) for threshold in RISK_LEVELS.values()]
+    levels = {
+        level: int(buckets[low:high].sum())
+        for level, low, high in zip(RISK_LEVELS, edges, [SCORE_BUCKETS] + edges[:-1])
+    }
+
+    return {
+        'customers': int(buckets.sum()),
+        'levels': levels,
+        'by_account_type': by_account_type,
+        'score_buckets': buckets
+    }
+
+def risk_percentile(portfolio, score):
+    """Share of the customer base with a lower churn score bucket than score"""
+    bucket = min(int(score * SCORE_BUCKETS), SCORE_BUCKETS - 1)
+    return portfolio['score_buckets'][:bucket].sum() / max(portfolio['customers'], 1)
+
+def sales_portfolio(customers, billing):
+    """Service adoption by account type and billing benchmarks across the customer base
+
+    Streams the customers' account type and service list and the bills'
+    amount and payment status, like churn_portfolio.
+    """
+
+    totals = pd.DataFrame(0.0, index=ACCOUNT_TYPES, columns=['account_type_count'] + [f"{service}_sum" for service in ALL_SERVICES])
+    for batch in customers.to_batches(columns=['account_type', 'services']):
+        if batch.num_rows == 0:
+            continue
+        services = batch.column('services')
+        adopted = [pc.cast(pc.match_substring(services, service), pa.int64()) for service in ALL_SERVICES]
+        batch = pa.RecordBatch.from_arrays([batch.column('account_type')] + adopted, names=['account_type'] + ALL_SERVICES)
+        totals = totals.add(_grouped_sums(batch, ALL_SERVICES), fill_value=0)
+
+    count = totals['account_type_count']
+    adoption = totals[[f"{service}_sum" for service in ALL_SERVICES]].div(count, axis=0).loc[count > 0]
+    adoption.columns = ALL_SERVICES
+
+    bills = amount = late = 0
+    for batch in billing.to_batches(columns=['amount', 'payment_status']):
+        if batch.num_rows == 0:
+            continue
+        bills += batch.num_rows
+        amount += pc.sum(batch.column('amount')).as_py()
+        late += pc.sum(pc.cast(pc.equal(batch.column('payment_status'), 'Late'), pa.int64())).as_py()
+
+    return {
+        'customers': int(count.sum()),
+        'adoption': adoption,
+        'avg_monthly_bill': amount / bills if bills else 0,
+        'late_payment_rate': late / bills if bills else 0
+    }